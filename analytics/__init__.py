@@ -0,0 +1 @@
+"""Statistics over reader responses collected by the app."""
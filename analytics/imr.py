@@ -0,0 +1,179 @@
+"""The IMR model as a scoring function, and its variance-based sensitivity.
+
+Each principle of the Information-Mediated Responsibility model becomes a
+factor in a single response score:
+
+    score = information * engagement * capacity              (integration)
+            * (1 + amplification * centrality)              (network amplification)
+            / (1 + load * (demands - 1))                    (cognitive load)
+            * (1 - mediation * (1 - literacy))              (mediation transparency)
+
+The integration term is multiplicative, so all three components are needed
+for a full response. ``load`` and ``mediation`` are model coefficients; the
+factors are drawn uniformly from their ``FACTORS`` ranges.
+
+``sensitivity`` estimates first-order and total Sobol indices with the
+Saltelli sampling scheme: two sample matrices ``A`` and ``B`` and, for each
+factor ``i``, ``A`` with column ``i`` taken from ``B`` -- ``samples * (d + 2)``
+model evaluations, drawn chunk by chunk from seeds derived from the chunk
+index, so the result is independent of how chunks are scheduled.
+
+By default everything runs in-process: a million samples take about a
+second on one core, less than starting a process pool would. Setting
+``PAPERS_IMR_WORKERS`` above 1 evaluates chunks across that many spawned
+processes (capped at ``MAX_WORKERS`` and the CPU count); they write the
+scores into one file-backed memory map in the temporary directory rather
+than ``/dev/shm``, which containers often limit to 64 MB.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+VERSION = 1
+WORKERS = int(os.environ.get("PAPERS_IMR_WORKERS", "1"))
+MAX_WORKERS = 8
+
+# name -> (label, principle, low, high)
+FACTORS = {
+    "information": ("Factual information", "Information Integration", 0.0, 1.0),
+    "engagement": ("Emotional engagement", "Information Integration", 0.0, 1.0),
+    "capacity": ("Capacity for action", "Information Integration", 0.0, 1.0),
+    "centrality": ("Network centrality", "Network Amplification", 0.0, 1.0),
+    "amplification": ("Network amplification", "Network Amplification", -0.5, 1.0),
+    "demands": ("Simultaneous demands", "Cognitive Load", 1.0, 10.0),
+    "literacy": ("Media literacy", "Mediation Transparency", 0.0, 1.0),
+}
+COEFFICIENTS = {"load": 0.3, "mediation": 0.5}
+
+
+def score(information, engagement, capacity, centrality, amplification, demands, literacy,
+          load=COEFFICIENTS["load"], mediation=COEFFICIENTS["mediation"]):
+    """IMR response score; every argument broadcasts."""
+    integration = information * engagement * capacity
+    network = 1.0 + amplification * centrality
+    overload = 1.0 + load * (demands - 1.0)
+    transparency = 1.0 - mediation * (1.0 - literacy)
+    return integration * network / overload * transparency
+
+
+def evaluate(x, load=COEFFICIENTS["load"], mediation=COEFFICIENTS["mediation"]):
+    """Score the rows of an (n, len(FACTORS)) matrix."""
+    return score(*x.T, load=load, mediation=mediation)
+
+
+def params_hash(samples, seed=0, **coefficients):
+    """Stable key for one analysis: parameters, factor ranges and model version."""
+    params = {
+        "version": VERSION,
+        "factors": FACTORS,
+        "coefficients": {**COEFFICIENTS, **coefficients},
+        "samples": samples,
+        "seed": seed,
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _draw(rng, n):
+    low = np.array([spec[2] for spec in FACTORS.values()])
+    high = np.array([spec[3] for spec in FACTORS.values()])
+    return low + (high - low) * rng.random((n, len(FACTORS)))
+
+
+def _fill(out, chunk, start, stop, seed, coefficients):
+    """Evaluate one chunk of the Saltelli design into ``out[:, start:stop]``.
+
+    Row 0 holds f(A), row 1 f(B) and row ``2 + i`` f(A with column i from B).
+    """
+    rng = np.random.default_rng([seed, chunk])
+    a = _draw(rng, stop - start)
+    b = _draw(rng, stop - start)
+    out[0, start:stop] = evaluate(a, **coefficients)
+    out[1, start:stop] = evaluate(b, **coefficients)
+    for i in range(len(FACTORS)):
+        column = a[:, i].copy()
+        a[:, i] = b[:, i]
+        out[2 + i, start:stop] = evaluate(a, **coefficients)
+        a[:, i] = column
+
+
+def _worker(path, shape, chunk, start, stop, seed, coefficients):
+    out = np.memmap(path, dtype=np.float64, mode="r+", shape=shape)
+    _fill(out, chunk, start, stop, seed, coefficients)
+    out.flush()
+
+
+def _indices(f):
+    """First-order (Saltelli, 2010) and total (Jansen) indices from the design."""
+    fa, fb, fab = f[0], f[1], f[2:]
+    variance = np.concatenate([fa, fb]).var()
+    if variance == 0:
+        return np.zeros(len(fab)), np.zeros(len(fab))
+    first = (fb * (fab - fa)).mean(axis=1) / variance
+    total = 0.5 * ((fa - fab) ** 2).mean(axis=1) / variance
+    return first, total
+
+
+def sensitivity(samples=1_000_000, seed=0, workers=None, chunk_size=131_072, batches=20, **coefficients):
+    """Monte Carlo Sobol indices of the IMR score for every factor.
+
+    Returns factor names and labels, ``first_order`` and ``total`` indices
+    with standard errors estimated from ``batches`` contiguous batches of
+    samples, the score mean and standard deviation, a score histogram and
+    the number of model evaluations.
+    """
+    coefficients = {**COEFFICIENTS, **coefficients}
+    shape = (len(FACTORS) + 2, samples)
+    bounds = [(chunk, start, min(start + chunk_size, samples))
+              for chunk, start in enumerate(range(0, samples, chunk_size))]
+    workers = min(workers or WORKERS, MAX_WORKERS, os.cpu_count() or 1, len(bounds))
+
+    if workers <= 1:
+        f = np.empty(shape)
+        for chunk, start, stop in bounds:
+            _fill(f, chunk, start, stop, seed, coefficients)
+        return _summary(f, samples, batches)
+
+    fd, path = tempfile.mkstemp(suffix=".imr")
+    os.close(fd)
+    try:
+        f = np.memmap(path, dtype=np.float64, mode="w+", shape=shape)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            jobs = [pool.submit(_worker, path, shape, chunk, start, stop, seed, coefficients)
+                    for chunk, start, stop in bounds]
+            for job in jobs:
+                job.result()
+        result = _summary(f, samples, batches)
+        del f
+    finally:
+        Path(path).unlink(missing_ok=True)
+    return result
+
+
+def _summary(f, samples, batches):
+    """Indices, their batch standard errors and score statistics of a design."""
+    first, total = _indices(f)
+    parts = [_indices(part) for part in np.array_split(f, batches, axis=1)]
+    first_se = np.std([p[0] for p in parts], axis=0, ddof=1) / np.sqrt(batches)
+    total_se = np.std([p[1] for p in parts], axis=0, ddof=1) / np.sqrt(batches)
+    counts, edges = np.histogram(f[0], bins=50)
+    return {
+        "factors": list(FACTORS),
+        "labels": [spec[0] for spec in FACTORS.values()],
+        "principles": [spec[1] for spec in FACTORS.values()],
+        "first_order": first,
+        "total": total,
+        "first_order_se": first_se,
+        "total_se": total_se,
+        "mean": float(f[0].mean()),
+        "std": float(f[0].std()),
+        "histogram": (counts, edges),
+        "samples": samples,
+        "evaluations": samples * f.shape[0],
+    }
@@ -0,0 +1,172 @@
+"""Streaming text analytics over free-text responses.
+
+Responses to every prompt (the discussion questions, the reflection box)
+arrive one at a time. ``Responses`` updates its statistics per response and
+never revisits the corpus:
+
+- term statistics: per prompt, the count of every word and two-word
+  phrase and how many responses use it; across prompts, the number of
+  responses using each word (document frequency);
+- keyphrases: a prompt's words and phrases ranked by TF-IDF, with their
+  count over the prompt's responses as the term frequency and every
+  response (to any prompt) as a document, so words the whole class uses
+  fall away;
+- clusters: sequential spherical k-means on hashed TF-IDF vectors. A new
+  response joins the closest centroid, and the centroid moves towards it.
+
+Adding a response costs time in its own length (plus a ``k x DIM``
+centroid update), so a class of thousands submitting within minutes costs
+milliseconds of CPU. A reader who edits an answer replaces their earlier
+response: its contributions are subtracted first. The clusters only ever
+move forward; earlier responses are not reassigned as centroids drift.
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from content.search import STOPWORDS, stem
+
+DIM = 2 ** 12
+CLUSTERS = 4
+KEYPHRASES = 10
+CLUSTER_TERMS = 4
+
+_WORD = re.compile(r"[a-z][a-z'-]*[a-z]|[a-z]")
+# Search stopwords plus the filler of conversational answers
+_STOPWORDS = STOPWORDS | frozenset(
+    "about also because but could did does don't just like more most much not our should some there think "
+    "very would you your i'm it's we've".split()
+)
+
+
+def terms(text):
+    """Words (stemmed, without stopwords) and adjacent two-word phrases."""
+    words = [stem(word) for word in _WORD.findall(text.lower())]
+    keep = [len(word) > 2 and word not in _STOPWORDS for word in words]
+    unigrams = [word for word, ok in zip(words, keep) if ok]
+    bigrams = [f"{a} {b}" for a, b, ok_a, ok_b in zip(words, words[1:], keep, keep[1:]) if ok_a and ok_b]
+    return Counter(unigrams), Counter(bigrams)
+
+
+def _bucket(term):
+    return zlib.crc32(term.encode("utf-8")) % DIM
+
+
+class _Prompt:
+    """Statistics of the responses to one prompt."""
+
+    def __init__(self, clusters):
+        self.n = 0
+        self.tf = Counter()
+        self.df = Counter()
+        self.docs = {}                              # author -> (terms, vector, cluster)
+        self.sums = np.zeros((clusters, DIM))
+        self.sizes = np.zeros(clusters, dtype=np.int64)
+        self.names = {}                             # bucket -> a word hashed to it
+
+
+class Responses:
+    """Incremental term statistics, keyphrases and clusters per prompt."""
+
+    def __init__(self, clusters=CLUSTERS):
+        self.clusters = clusters
+        self.n = 0
+        self.df = Counter()
+        self._prompts = {}
+        self._lock = threading.Lock()
+
+    def _idf(self, term, smooth=1.0):
+        return math.log((1 + self.n) / (1 + self.df[term])) + smooth
+
+    def _vector(self, unigrams):
+        index = np.fromiter((_bucket(term) for term in unigrams), dtype=np.int64, count=len(unigrams))
+        weight = np.fromiter(((1 + math.log(count)) * self._idf(term) for term, count in unigrams.items()),
+                             dtype=np.float64, count=len(unigrams))
+        # Words sharing a bucket add up, as in a dense hashed vector
+        index, inverse = np.unique(index, return_inverse=True)
+        weight = np.bincount(inverse, weights=weight)
+        return index, weight / np.linalg.norm(weight)
+
+    def add(self, prompt, author, text):
+        """Add (or replace) ``author``'s response to ``prompt``."""
+        unigrams, bigrams = terms(text)
+        with self._lock:
+            stats = self._prompts.get(prompt)
+            if stats is None:
+                stats = self._prompts[prompt] = _Prompt(self.clusters)
+            if author in stats.docs:
+                self._remove(stats, author)
+            if not unigrams:
+                return None
+            self.n += 1
+            self.df.update(unigrams.keys())
+            stats.n += 1
+            stats.tf.update(unigrams)
+            stats.tf.update(bigrams)
+            stats.df.update(unigrams.keys())
+            stats.df.update(bigrams.keys())
+
+            index, weight = self._vector(unigrams)
+            for term in unigrams:
+                stats.names.setdefault(_bucket(term), term)
+            empty = np.flatnonzero(stats.sizes == 0)
+            if len(empty):
+                cluster = int(empty[0])
+            else:
+                norms = np.linalg.norm(stats.sums, axis=1)
+                cluster = int(np.argmax(stats.sums[:, index] @ weight / norms))
+            stats.sums[cluster, index] += weight
+            stats.sizes[cluster] += 1
+            stats.docs[author] = ((unigrams, bigrams), (index, weight), cluster)
+            return cluster
+
+    def _remove(self, stats, author):
+        (unigrams, bigrams), (index, weight), cluster = stats.docs.pop(author)
+        self.n -= 1
+        self.df.subtract(unigrams.keys())
+        stats.n -= 1
+        stats.tf.subtract(unigrams)
+        stats.tf.subtract(bigrams)
+        stats.df.subtract(unigrams.keys())
+        stats.df.subtract(bigrams.keys())
+        stats.sums[cluster, index] -= weight
+        stats.sizes[cluster] -= 1
+
+    def prompts(self):
+        with self._lock:
+            return [prompt for prompt, stats in self._prompts.items() if stats.n]
+
+    def summary(self, prompt, keyphrases=KEYPHRASES, cluster_terms=CLUSTER_TERMS):
+        """Response count, top keyphrases ``(phrase, score, responses)`` and
+        clusters ``{"size", "terms"}`` (largest first) for one prompt."""
+        with self._lock:
+            stats = self._prompts.get(prompt)
+            if stats is None or not stats.n:
+                return {"responses": 0, "keyphrases": [], "clusters": []}
+            scored = []
+            for term, count in stats.df.items():
+                if count <= 0:
+                    continue
+                words = term.split(" ")
+                # A phrase is as rare as its rarer word, and counts for each of
+                # its words; words everyone uses score zero
+                idf = max(self._idf(word, smooth=0.0) for word in words)
+                scored.append((stats.tf[term] * idf * len(words), term, count))
+            top = sorted(scored, reverse=True)[:keyphrases]
+            clusters = []
+            for c in np.argsort(-stats.sizes):
+                if stats.sizes[c] <= 0:
+                    continue
+                buckets = np.argsort(-stats.sums[c])[:cluster_terms * 2]
+                names = [stats.names[b] for b in buckets if stats.sums[c, b] > 0 and b in stats.names]
+                clusters.append({"size": int(stats.sizes[c]), "terms": names[:cluster_terms]})
+            return {
+                "responses": stats.n,
+                "keyphrases": [(term, round(score, 2), int(df)) for score, term, df in top],
+                "clusters": clusters,
+            }
@@ -0,0 +1 @@
+"""Performance benchmarks for the app (run as ``python -m bench.<name>``)."""
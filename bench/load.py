@@ -0,0 +1,363 @@
+"""Concurrent-session load generator for a locally running app.
+
+Usage::
+
+    python -m bench.load [--sessions 10,50,100,200] [--duration 30] [--think 2]
+                         [--url ws://localhost:8501] [--pid PID] [--out FILE]
+
+Each simulated student is a real Streamlit client: it opens the app's
+websocket (``/_stcore/stream``), sends the same protobuf ``BackMsg`` reruns a
+browser sends and reads ``ForwardMsg`` deltas until the script finishes.
+Sessions replay a random walk through the app -- switching sections and demo
+panels, moving sliders (fragment reruns, as in the browser), typing
+reflections and submitting forms such as the quiz, with random answers --
+separated by exponential think times, and follow the app's auto-rerun
+fragments. Form sliders are left at their defaults, so the heavy demo
+simulations run once and are then served from cache, as for a class that
+mostly uses the defaults.
+
+Stages run one after another with growing session counts; every stage
+reports completed reruns per second, rerun latency percentiles (send to
+``script_finished``), errors and the server's RSS (sampled from ``/proc``,
+including child processes). Without ``--url`` the tool starts ``streamlit
+run app.py`` itself on a free port with a throwaway database, so everything
+runs on one Linux box; with ``--url`` pass ``--pid`` to sample the server's
+memory. Client and server share the machine, so leave CPU headroom when
+reading throughput. Needs the ``websockets`` package (a Streamlit
+dependency in recent releases); the protobuf classes come from the
+installed Streamlit, which must match the server's version.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "app.py"
+
+# Relative frequency of each kind of action in the random walk
+ACTIONS = {"section": 4, "panel": 2, "slider": 3, "text": 1, "form": 1}
+
+# Seconds to wait for a rerun to finish before the session counts as failed
+TIMEOUT = 120
+
+
+def _widget_state(widget_id):
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    state = WidgetState()
+    state.id = widget_id
+    return state
+
+
+class Session:
+    """One simulated browser session."""
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.ws = None
+        self.page_hash = ""
+        self.widgets = {}       # id -> (kind, proto, fragment_id)
+        self.states = {}        # id -> WidgetState the "browser" holds
+        self.auto_reruns = {}   # fragment_id -> (interval, next due time)
+
+    async def connect(self):
+        import websockets
+
+        self.ws = await websockets.connect(f"{self.url}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, triggers=(), fragment_id="", auto=False):
+        """Send one rerun and wait for it to finish; returns (seconds, errors)."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = ""
+        state.page_script_hash = self.page_hash
+        state.widget_states.widgets.extend(list(self.states.values()) + list(triggers))
+        if fragment_id:
+            state.fragment_id = fragment_id
+            state.is_auto_rerun = auto
+        else:
+            # A full run re-registers the widgets and auto-rerun fragments on the page
+            self.widgets = {}
+            self.auto_reruns = {}
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        errors = 0
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.ws.recv(), TIMEOUT))
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_kind = element.WhichOneof("type")
+                if element_kind == "exception":
+                    errors += 1
+                proto = getattr(element, element_kind)
+                if getattr(proto, "id", ""):
+                    self.widgets[proto.id] = (element_kind, proto, forward.delta.fragment_id)
+            elif kind == "new_session":
+                self.page_hash = forward.new_session.page_script_hash
+            elif kind == "auto_rerun":
+                interval = forward.auto_rerun.interval
+                self.auto_reruns[forward.auto_rerun.fragment_id] = (interval, time.monotonic() + interval)
+            elif kind == "stop_auto_rerun":
+                self.auto_reruns.clear()
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    errors += 1
+                return time.perf_counter() - start, errors
+
+    def _find(self, kind, form):
+        """(id, proto, fragment_id) of the widgets of a kind on the page,
+        inside (``form=True``) or outside forms."""
+        return [(widget_id, proto, fragment_id) for widget_id, (widget_kind, proto, fragment_id) in self.widgets.items()
+                if widget_kind == kind and bool(proto.form_id) == form]
+
+    def _choose_radio(self, widget_id, proto):
+        state = _widget_state(widget_id)
+        state.string_value = self.rng.choice(list(proto.options))
+        self.states[widget_id] = state
+
+    async def act(self, action):
+        """Perform one action; returns its rerun timing or None if the page
+        offers nothing to do for it."""
+        radios = self._find("radio", form=False)
+        if action == "section":
+            sidebar = [r for r in radios if r[1].label == "Select Section:"]
+            if not sidebar:
+                return None
+            self._choose_radio(sidebar[0][0], sidebar[0][1])
+            return await self.rerun()
+        if action == "panel":
+            panels = [r for r in radios if r[1].label != "Select Section:"]
+            if not panels:
+                return None
+            widget_id, proto, fragment_id = panels[0]
+            self._choose_radio(widget_id, proto)
+            return await self.rerun(fragment_id=fragment_id)
+        if action == "slider":
+            sliders = [s for s in self._find("slider", form=False) if not s[1].options and len(s[1].default) == 1]
+            if not sliders:
+                return None
+            widget_id, proto, fragment_id = self.rng.choice(sliders)
+            steps = int(round((proto.max - proto.min) / (proto.step or 1)))
+            state = _widget_state(widget_id)
+            state.double_array_value.data.append(proto.min + self.rng.randint(0, steps) * (proto.step or 1))
+            self.states[widget_id] = state
+            return await self.rerun(fragment_id=fragment_id)
+        if action == "text":
+            areas = self._find("text_area", form=False)
+            if not areas:
+                return None
+            widget_id, proto, fragment_id = self.rng.choice(areas)
+            state = _widget_state(widget_id)
+            state.string_value = f"Reflection {self.rng.randint(0, 10 ** 6)} on moral salience and attention."
+            self.states[widget_id] = state
+            return await self.rerun(fragment_id=fragment_id)
+        if action == "form":
+            submits = [b for b in self._find("button", form=True) if b[1].is_form_submitter]
+            if not submits:
+                return None
+            widget_id, proto, fragment_id = self.rng.choice(submits)
+            for radio_id, radio, _ in self._find("radio", form=True):
+                if radio.form_id == proto.form_id:
+                    self._choose_radio(radio_id, radio)
+            trigger = _widget_state(widget_id)
+            trigger.trigger_value = True
+            return await self.rerun(triggers=[trigger], fragment_id=fragment_id)
+        raise ValueError(f"Unknown action: {action!r}")
+
+    async def due_auto_rerun(self):
+        now = time.monotonic()
+        for fragment_id, (interval, due) in list(self.auto_reruns.items()):
+            if due <= now:
+                self.auto_reruns[fragment_id] = (interval, now + interval)
+                return await self.rerun(fragment_id=fragment_id, auto=True)
+        return None
+
+
+async def _student(url, seed, deadline, think, samples):
+    rng = random.Random(seed)
+    session = Session(url, rng)
+    actions, weights = list(ACTIONS), list(ACTIONS.values())
+    try:
+        await session.connect()
+        samples.append(("open", *await session.rerun()))
+        while time.monotonic() < deadline:
+            pause = min(rng.expovariate(1.0 / think), max(0.0, deadline - time.monotonic()))
+            await asyncio.sleep(pause)
+            if time.monotonic() >= deadline:
+                break
+            result = await session.due_auto_rerun()
+            if result is not None:
+                samples.append(("auto_rerun", *result))
+                continue
+            action = rng.choices(actions, weights)[0]
+            result = await session.act(action)
+            if result is not None:
+                samples.append((action, *result))
+    except Exception as exc:                       # connection refused, closed, ...
+        samples.append(("failed", 0.0, 1))
+        print(f"session {seed}: {type(exc).__name__}: {exc}", file=sys.stderr)
+    finally:
+        await session.close()
+
+
+def rss_kib(pid):
+    """Resident memory of a process and its descendants, from /proc."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as status:
+                total += next(int(line.split()[1]) for line in status if line.startswith("VmRSS:"))
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except (OSError, StopIteration):
+            continue
+    return total
+
+
+async def _sample_rss(pid, samples, stop):
+    while not stop.is_set():
+        samples.append(rss_kib(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), 0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_stage(url, sessions, duration, think, pid=None, seed=0, ramp=2.0):
+    """Run ``sessions`` concurrent students for ``duration`` seconds."""
+    samples, rss = [], []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(pid, rss, stop)) if pid else None
+    start = time.monotonic()
+    deadline = start + duration
+    tasks = []
+    for i in range(sessions):
+        # Spread connections over the ramp-up, as students arrive
+        await asyncio.sleep(ramp / sessions)
+        tasks.append(asyncio.create_task(_student(url, seed * 100_003 + i, deadline, think, samples)))
+    await asyncio.gather(*tasks)
+    elapsed = time.monotonic() - start
+    stop.set()
+    if sampler:
+        await sampler
+    return summarize(sessions, samples, elapsed, rss)
+
+
+def summarize(sessions, samples, elapsed, rss):
+    times = np.array([seconds for action, seconds, _ in samples if action != "failed"]) * 1000.0
+    by_action = {}
+    for action, seconds, _ in samples:
+        by_action.setdefault(action, []).append(seconds * 1000.0)
+
+    def percentiles(ms):
+        ms = np.asarray(ms)
+        return {p: round(float(np.percentile(ms, int(p[1:]))), 1) for p in ("p50", "p95", "p99")} if len(ms) else None
+
+    return {
+        "sessions": sessions,
+        "reruns": int(len(times)),
+        "throughput": round(len(times) / elapsed, 2),
+        "errors": int(sum(errors for _, _, errors in samples)),
+        "latency_ms": {**(percentiles(times) or {}), "max": round(float(times.max()), 1) if len(times) else None},
+        "actions": {action: {"n": len(ms), **(percentiles(ms) or {})} for action, ms in sorted(by_action.items())},
+        "rss_mib": {"peak": round(max(rss) / 1024, 1), "end": round(rss[-1] / 1024, 1)} if rss else None,
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def launch(port, timeout=60):
+    """Start ``streamlit run app.py`` headless; returns the process once healthy."""
+    env = dict(os.environ, PAPERS_DB=os.path.join(tempfile.mkdtemp(prefix="load-"), "papers.db"))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP), "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.25)
+    server.terminate()
+    raise RuntimeError(f"streamlit did not become healthy on port {port}")
+
+
+HEADER = (f"{'sessions':>8}{'reruns':>8}{'rerun/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}{'errors':>8}{'RSS MiB':>9}")
+
+
+def row(stage):
+    latency = stage["latency_ms"]
+    rss = f"{stage['rss_mib']['peak']:9.0f}" if stage["rss_mib"] else f"{'-':>9}"
+    return (f"{stage['sessions']:>8}{stage['reruns']:>8}{stage['throughput']:>9.1f}"
+            f"{latency.get('p50', 0):>9.1f}{latency.get('p95', 0):>9.1f}{latency.get('p99', 0):>9.1f}"
+            f"{latency['max'] or 0:>9.1f}{stage['errors']:>8}{rss}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="10,50,100,200", help="comma-separated session counts, one stage each")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per stage (default 30)")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think time between actions in seconds")
+    parser.add_argument("--url", help="websocket base URL of a running app, e.g. ws://localhost:8501")
+    parser.add_argument("--pid", type=int, help="server process to sample RSS from (with --url)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="write the stage results as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    url, pid = args.url, args.pid
+    if url is None:
+        port = _free_port()
+        server = launch(port)
+        url, pid = f"ws://127.0.0.1:{port}", server.pid
+    try:
+        stages = []
+        print(HEADER, flush=True)
+        for sessions in (int(n) for n in args.sessions.split(",")):
+            stages.append(asyncio.run(run_stage(url, sessions, args.duration, args.think, pid, args.seed)))
+            print(row(stages[-1]), flush=True)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    if args.out:
+        args.out.write_text(json.dumps(stages, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Headless render benchmark for every sidebar section.
+
+Usage::
+
+    python -m bench.sections [--runs N] [--save | --check] [--baseline PATH]
+
+Drives ``app.py`` with Streamlit's AppTest harness. Every round selects each
+section in turn (and each panel of the Interactive Demos), then exercises
+its widgets: every slider is nudged one step, every text area gets an
+answer and every form (such as ``quiz_form``) is submitted. Rerun wall
+times are summarised as percentiles per section, separately for selecting
+the section and for interacting with it. The first selection in the
+process is reported separately as the cold time; the first ``WARMUP``
+rounds fill the caches for sliders moved in both directions and are not
+counted. A last round runs under ``tracemalloc`` and records, per
+section, the peak traced memory of a rerun and the memory and allocated
+blocks it leaves behind.
+
+``--save`` writes the results as the baseline (``bench/baselines/
+sections.json``); ``--check`` compares against it and exits non-zero when a
+section got slower or heavier than ``TOLERANCE`` times its baseline.
+The database, the shared cache, the network layouts and the case study
+series all live in one throwaway directory, never in ``data/``; the layouts
+are built there before the first rerun, and there are no case study CSVs.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "app.py"
+BASELINE = Path(__file__).resolve().parent / "baselines" / "sections.json"
+
+# A metric regresses when it exceeds TOLERANCE x baseline plus the slack
+TOLERANCE = 1.5
+SLACK_MS = 10.0
+SLACK_KIB = 256.0
+
+WARMUP = 2
+
+
+def _run(widget, label):
+    start = time.perf_counter()
+    at = widget.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+    return elapsed
+
+
+def _nudge(slider, rep):
+    """Move a slider one step, alternating direction between rounds so
+    later rounds revisit values (and caches) from earlier ones."""
+    value = slider.value
+    if not isinstance(value, (int, float)):
+        return None                       # range sliders
+    step = (slider.step or 1) * (1 if rep % 2 == 0 else -1)
+    if not slider.min <= value + step <= slider.max:
+        step = -step
+    return slider.set_value(type(value)(value + step))
+
+
+def _exercise(at, label, rep):
+    """Interact with every slider, text area and form on the page."""
+    timings = []
+    for i in range(len(at.main.slider)):
+        if i < len(at.main.slider):
+            widget = _nudge(at.main.slider[i], rep)
+            if widget is not None:
+                timings.append(_run(widget, label))
+    for i in range(len(at.main.text_area)):
+        if i < len(at.main.text_area):
+            timings.append(_run(at.main.text_area[i].input(f"Benchmark answer {rep}"), label))
+    forms = [i for i, button in enumerate(at.main.button) if button.form_id]
+    for i in forms:
+        if i < len(at.main.button):
+            timings.append(_run(at.main.button[i].click(), label))
+    return timings
+
+
+def _walk(at, sections, rep, on_page):
+    """Call ``on_page(label, select, rep)`` for every section and, where a
+    section has a navigation radio (one outside any form), for each of its
+    options; ``select`` returns the widget change that opens the page."""
+    for section in sections:
+        on_page(section, lambda: at.sidebar.radio[0].set_value(section), rep)
+        radios = [radio for radio in at.main.radio if not radio.form_id]
+        if radios:
+            options = radios[0].options
+            for option in options[1:]:
+                on_page(f"{section} › {option}", lambda option=option: at.main.radio[0].set_value(option), rep)
+            _run(at.main.radio[0].set_value(options[0]), section)
+
+
+def _summary(seconds):
+    if not seconds:
+        return None
+    ms = np.asarray(seconds) * 1000.0
+    return {
+        "n": len(ms),
+        "mean": round(float(ms.mean()), 2),
+        "p50": round(float(np.percentile(ms, 50)), 2),
+        "p90": round(float(np.percentile(ms, 90)), 2),
+        "p99": round(float(np.percentile(ms, 99)), 2),
+        "max": round(float(ms.max()), 2),
+    }
+
+
+def measure(runs=10, timeout=300):
+    """Benchmark every section; returns the baseline-shaped result dict."""
+    # Read when storage is first imported, so set before importing anything
+    scratch = Path(tempfile.mkdtemp(prefix="bench-"))
+    os.environ.setdefault("PAPERS_DB", str(scratch / "papers.db"))
+    for name, sub in [("PAPERS_CACHE_DIR", "cache"), ("PAPERS_LAYOUT_DIR", "layouts"), ("PAPERS_SERIES_DIR", "series")]:
+        os.environ.setdefault(name, str(scratch / sub))
+    from streamlit.testing.v1 import AppTest
+
+    import sections
+    from storage import layouts
+
+    # As on a deployment: the app would show a placeholder while they build
+    layouts.main([])
+
+    at = AppTest.from_file(str(APP), default_timeout=timeout)
+    _run(at, "startup")
+    labels = list(sections.SECTIONS)
+    select, interact, cold = {}, {}, {}
+
+    def timed(label, page, rep):
+        elapsed = _run(page(), label)
+        timings = _exercise(at, label, rep)
+        cold.setdefault(label, elapsed)
+        if rep >= WARMUP:
+            select.setdefault(label, []).append(elapsed)
+            interact.setdefault(label, []).extend(timings)
+
+    # The app starts on the first section, so round 0 reselects it from the last
+    _run(at.sidebar.radio[0].set_value(labels[-1]), labels[-1])
+    for rep in range(WARMUP + runs):
+        _walk(at, labels, rep, timed)
+
+    memory = {}
+
+    def traced(label, page, rep):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        _run(page(), label)
+        _exercise(at, label, rep)
+        current, peak = tracemalloc.get_traced_memory()
+        memory[label] = {
+            "peak_kib": round((peak - base) / 1024, 1),
+            "retained_kib": round((current - base) / 1024, 1),
+            "retained_blocks": sys.getallocatedblocks() - blocks,
+        }
+
+    tracemalloc.start()
+    try:
+        _walk(at, labels, WARMUP + runs, traced)
+    finally:
+        tracemalloc.stop()
+
+    import streamlit
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "runs": runs,
+        "max_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "sections": {
+            label: {
+                "cold_ms": round(cold[label] * 1000.0, 2),
+                "select": _summary(select.get(label)),
+                "interact": _summary(interact.get(label)),
+                "memory": memory.get(label),
+            }
+            for label in cold
+        },
+    }
+
+
+def compare(current, baseline, tolerance=TOLERANCE):
+    """Return a list of regressions of ``current`` against ``baseline``."""
+    regressions = []
+    for label, base in baseline["sections"].items():
+        now = current["sections"].get(label)
+        if now is None:
+            continue
+        for kind in ("select", "interact"):
+            if not base[kind] or not now[kind]:
+                continue
+            for stat in ("p50", "p90"):
+                limit = base[kind][stat] * tolerance + SLACK_MS
+                if now[kind][stat] > limit:
+                    regressions.append(f"{label}: {kind} {stat} {now[kind][stat]:.1f} ms > {limit:.1f} ms")
+        if base["memory"] and now["memory"]:
+            limit = base["memory"]["peak_kib"] * tolerance + SLACK_KIB
+            if now["memory"]["peak_kib"] > limit:
+                regressions.append(f"{label}: peak {now['memory']['peak_kib']:.0f} KiB > {limit:.0f} KiB")
+    return regressions
+
+
+def report(result):
+    def cell(summary, stat):
+        return f"{summary[stat]:9.1f}" if summary else f"{'-':>9}"
+
+    lines = [f"{'section':<52}{'cold':>9}{'sel p50':>9}{'sel p90':>9}{'int p50':>9}{'int p90':>9}{'peak KiB':>10}"]
+    for label, row in result["sections"].items():
+        peak = f"{row['memory']['peak_kib']:10.0f}" if row["memory"] else f"{'-':>10}"
+        lines.append(f"{label:<52}{row['cold_ms']:9.1f}{cell(row['select'], 'p50')}{cell(row['select'], 'p90')}"
+                     f"{cell(row['interact'], 'p50')}{cell(row['interact'], 'p90')}{peak}")
+    lines.append(f"max RSS {result['max_rss_mib']} MiB over {result['runs']} rounds (times in ms)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="measured rounds per section (default 10)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--out", type=Path, help="also write the results to this file")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    action.add_argument("--check", action="store_true", help="fail on regressions against the baseline")
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs)
+    print(report(result))
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+    elif args.check:
+        regressions = compare(result, json.loads(args.baseline.read_text(encoding="utf-8")))
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Paper content: source text, build step and the runtime store."""
@@ -0,0 +1,136 @@
+"""Build the app stylesheet into a minified, content-hashed bundle.
+
+Usage::
+
+    python -m content.assets
+
+Concatenates the stylesheets under ``static/`` and adds ``@font-face`` rules
+for the fonts vendored in ``static/fonts/``. Without them the stylesheets
+fall back to the system UI font; no third-party font is ever requested.
+Writes ``static/dist/app.<hash>.css`` plus a manifest. Hashed files never
+change in place, so they can be served with an immutable cache header.
+
+The app links the hashed bundle (``stylesheet_href``): every rerun sends
+one ``@import`` line and the browser fetches the bundle once. Where
+Streamlit's static route would not serve CSS, the app inlines the bundle
+(``stylesheet``) instead. A missing or stale bundle is rebuilt on first use.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STATIC = ROOT / "static"
+DIST = STATIC / "dist"
+FONTS = STATIC / "fonts"
+MANIFEST = DIST / "manifest.json"
+STYLESHEETS = ("app.css",)
+
+# (family, file under static/fonts, weight range, style); missing files are
+# skipped and the stylesheets fall back to the system UI font
+FONT_FACES = [
+    ("Inter", "InterVariable.woff2", "100 900", "normal"),
+    ("Inter", "InterVariable-Italic.woff2", "100 900", "italic"),
+]
+
+# URL prefix under which Streamlit serves static/ (server.enableStaticServing)
+APP_STATIC_URL = "app/static/"
+
+
+def minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def fonts():
+    return [(family, name, weight, style) for family, name, weight, style in FONT_FACES if (FONTS / name).exists()]
+
+
+def font_face_css(url_prefix):
+    return "\n".join(
+        f"@font-face {{ font-family: '{family}'; src: url('{url_prefix}{name}') format('woff2'); "
+        f"font-weight: {weight}; font-style: {style}; font-display: swap; }}"
+        for family, name, weight, style in fonts()
+    )
+
+
+def source_hash(stylesheets=STYLESHEETS):
+    digest = hashlib.sha256()
+    for name in stylesheets:
+        digest.update((STATIC / name).read_bytes())
+    for _, name, _, _ in fonts():
+        digest.update(name.encode("utf-8"))
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def bundle(stylesheets=STYLESHEETS, font_url=APP_STATIC_URL + "fonts/"):
+    parts = [font_face_css(font_url)] + [(STATIC / name).read_text(encoding="utf-8") for name in stylesheets]
+    return minify("\n".join(parts))
+
+
+def fingerprint(css, stem="app"):
+    return f"{stem}.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]}.css"
+
+
+def build():
+    # Font URLs are relative to the bundle under static/dist/
+    css = bundle(font_url="../fonts/")
+    name = fingerprint(css)
+    DIST.mkdir(parents=True, exist_ok=True)
+    for old in DIST.glob("app.*.css"):
+        if old.name != name:
+            old.unlink()
+    (DIST / name).write_text(css, encoding="utf-8")
+    manifest = {"app.css": f"dist/{name}", "source_hash": source_hash()}
+    MANIFEST.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def current():
+    """The manifest of an up-to-date bundle, building it if needed; None if
+    it cannot be written."""
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+        if manifest.get("source_hash") == source_hash() and (STATIC / manifest["app.css"]).exists():
+            return manifest
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        return build()
+    except OSError:
+        return None
+
+
+def stylesheet_href():
+    """URL of the hashed bundle under Streamlit's static route, or None."""
+    manifest = current()
+    return None if manifest is None else APP_STATIC_URL + manifest["app.css"]
+
+
+def static_css_served():
+    """Whether Streamlit's static route serves ``.css`` as a stylesheet.
+
+    The Tornado server of older Streamlit versions sends every file type
+    outside a short list as text/plain with nosniff, which browsers refuse
+    to apply; the Starlette server types files by suffix."""
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+def stylesheet():
+    """The minified app stylesheet, for inlining (font URLs relative to the page)."""
+    return bundle()
+
+
+if __name__ == "__main__":
+    manifest = build()
+    print(f"{manifest['app.css']} ({len(fonts())} vendored font files)", file=sys.stderr)
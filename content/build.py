@@ -0,0 +1,330 @@
+"""Compile paper sources into pre-rendered content artifacts.
+
+Usage::
+
+    python -m content.build
+
+A paper source is a module of plain data (``content.paper`` is the one
+shipped). Each of its sections is laid out as a list of blocks and compiled
+once: runs of Markdown are merged into a single fragment, styled boxes are
+rendered to HTML, and the result is written to ``content/build/<id>.json``
+together with a version derived from the source files and the full-text
+search index (``content.search``). The app loads artifacts lazily through
+``content.registry`` instead of rebuilding the text on every rerun; the
+command above builds every paper listed in the manifest.
+"""
+
+import hashlib
+import html
+import importlib
+import json
+import sys
+from pathlib import Path
+
+from content import citations, paper, references, search
+from content.markup import inline
+
+FORMAT = 7
+
+ROOT = Path(__file__).resolve().parent
+BUILD_DIR = ROOT / "build"
+SOURCES = (ROOT / "markup.py", ROOT / "search.py", ROOT / "citations.py", ROOT / "references.py",
+           Path(__file__).resolve())
+
+
+def artifact_path(paper_id):
+    return BUILD_DIR / f"{paper_id}.json"
+
+
+def source_hash(source=paper):
+    digest = hashlib.sha256()
+    for path in (Path(source.__file__).resolve(),) + SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _labelled(label, text):
+    return f"**{label}:** {text}"
+
+
+def box_html(css_class, text, heading=None, footer=None):
+    """Render a styled box as a single HTML fragment (no blank lines, so
+    Streamlit treats the whole box as one HTML block)."""
+    parts = [f'<div class="{css_class}">']
+    if heading:
+        parts.append(f"<h3>{inline(heading)}</h3>")
+    for paragraph in text.split("\n\n") if text else []:
+        parts.append(f"<p>{inline(paragraph)}</p>")
+    if footer:
+        parts.append(footer)
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+# Section layouts
+
+def _overview(p):
+    summary = "\n\n".join(_labelled(label, text) for label, text in p.RESEARCH_SUMMARY)
+    metrics = [
+        ("Core Principles", str(len(p.PRINCIPLES))),
+        ("Empirical Predictions", str(len(p.PREDICTIONS))),
+        ("Case Studies", str(len(p.CASE_STUDIES))),
+    ]
+    return [
+        ("subheader", "Paper Overview"),
+        ("columns", [2, 1], [
+            [("md", summary), ("box", "key-insight", p.KEY_INSIGHT)],
+            [("metric", label, value) for label, value in metrics],
+        ]),
+        ("subheader", "Learning Objectives"),
+        *[("md", f"{i}. {obj}") for i, obj in enumerate(p.OBJECTIVES, 1)],
+    ]
+
+
+def _full_paper(p):
+    meta = p.META
+    blocks = [
+        ("md", "---"),
+        ("md", f"# {meta['title']}"),
+        ("md", f"## {meta['subtitle']}"),
+        ("md", f"**{meta['author']}**"),
+        ("md", f"{meta['affiliation']} • {meta['program']}"),
+        ("md", meta["date"]),
+        ("md", "---"),
+        ("md", "## Abstract"),
+        ("info", "\n\n".join(p.ABSTRACT + [f"**Keywords:** {p.KEYWORDS}"])),
+        ("md", "## 1. Introduction"),
+        *[("md", p) for p in p.INTRODUCTION],
+
+        ("md", "## 2. Theoretical Framework"),
+        ("md", "### 2.1 Moral Salience and Information Exposure"),
+        ("md", "Research in moral psychology demonstrates that moral judgment depends heavily on salience - the degree to which moral considerations capture attention and emotional engagement (Greene, 2013; Haidt, 2012). Digital media fundamentally alters moral salience through several mechanisms:"),
+        ("expander", "Key Mechanisms", [("md", _labelled(t, full)) for t, _, full in p.MECHANISMS]),
+        ("md", "### 2.2 Network Effects in Moral Responsibility"),
+        ("md", "Social network theory provides tools for understanding how individual moral responses aggregate into collective moral phenomena:"),
+        *[("md", _labelled(t, text)) for t, text in p.NETWORK_EFFECTS],
+        ("md", "### 2.3 Information Overload and Moral Numbing"),
+        ("md", "Psychological research reveals systematic limitations in human capacity to process moral information:"),
+        *[("md", _labelled(t, text)) for t, text in p.OVERLOAD_EFFECTS],
+
+        ("md", "## 3. The Information-Mediated Responsibility Model"),
+        ("md", "### 3.1 Core Principles"),
+        ("md", "The IMR model proposes that moral responsibility in digital environments operates according to the following principles:"),
+        *[("success", _labelled(t, full)) for t, _, full in p.PRINCIPLES],
+        ("md", "### 3.2 Empirical Predictions"),
+        ("md", "Unlike purely theoretical frameworks, IMR generates specific testable predictions:"),
+        *[("md", _labelled(f"Prediction {i}", p)) for i, p in enumerate(p.PREDICTIONS, 1)],
+
+        ("md", "## 4. Case Studies"),
+    ]
+    for study in p.CASE_STUDIES:
+        points = "\n".join(f"• **{label}:** {full}" for label, _, full in study["points"])
+        blocks += [("md", f"### {study['heading']}"), ("error", f"{study['intro']}\n\n{points}")]
+
+    blocks += [
+        ("md", "## 5. Practical Applications"),
+        ("md", "### 5.1 Ethical Design of Information Systems"),
+        ("md", "IMR analysis suggests several principles for ethical design of information systems:"),
+        *[("md", _labelled(t, full)) for t, _, full in p.DESIGN_PRINCIPLES],
+        ("md", "### 5.2 Educational Implications"),
+        ("md", "Digital moral literacy requires new educational approaches:"),
+        *[("md", _labelled(t, full)) for t, _, full in p.EDUCATION_AREAS],
+        ("md", "### 5.3 Policy Recommendations"),
+        ("md", "Several policy interventions could improve moral information environments:"),
+        *[("md", _labelled(t, full)) for t, _, full in p.POLICY_AREAS],
+
+        ("md", "## 6. Limitations and Future Research"),
+        ("md", "### 6.1 Methodological Limitations"),
+        ("md", "Current research on information-mediated moral responsibility faces several limitations:"),
+        *[("md", f"• {_labelled(t, text)}") for t, text in p.LIMITATIONS],
+        ("md", "### 6.2 Future Research Directions"),
+        ("md", "Several research programs could advance understanding of information-mediated moral responsibility:"),
+        *[("md", _labelled(t, text)) for t, text in p.FUTURE_RESEARCH],
+
+        ("md", "## 7. Conclusion"),
+        ("md", p.CONCLUSION[0]),
+        ("md", "Key insights include recognition that:"),
+        *[("md", f"• {c}") for c in p.KEY_CONCLUSIONS],
+        *[("md", p) for p in p.CONCLUSION[1:]],
+
+        ("md", "## References"),
+        ("bibliography", None, None),
+    ]
+    return blocks
+
+
+def _abstract(p):
+    keywords = f'<div class="keywords"><strong>Keywords:</strong> {html.escape(p.KEYWORDS)}</div>'
+    return [
+        ("html", box_html("abstract-box", p.ABSTRACT_SHORT, heading="Abstract", footer=keywords)),
+        ("html", box_html("content-section", p.INTRODUCTION_SHORT, heading="Introduction")),
+    ]
+
+
+def _framework(p):
+    return [
+        ("subheader", "Theoretical Framework"),
+        ("subheader", "Moral Salience and Information Exposure"),
+        ("columns", len(p.MECHANISMS), [
+            [("box", "principle-box", f"**{title}**\n\n{summary}")]
+            for title, summary, _ in p.MECHANISMS
+        ]),
+    ]
+
+
+def _imr_model(p):
+    return [
+        ("subheader", "The Information-Mediated Responsibility Model"),
+        ("box", "key-insight", p.IMR_INSIGHT),
+        ("subheader", "Core Principles"),
+        *[("box", "principle-box", f"**{i}. {title}**\n\n{summary}")
+          for i, (title, summary, _) in enumerate(p.PRINCIPLES, 1)],
+    ]
+
+
+def _case_studies(p):
+    blocks = [("subheader", "Case Studies")]
+    for study in p.CASE_STUDIES:
+        points = "\n\n".join(f"• {label}: {summary}" for label, summary, _ in study["points"])
+        blocks.append(("html", box_html("case-study-box", points, heading=study["title"])))
+    return blocks
+
+
+def _tab(heading, items):
+    return [("subheader", heading)] + [("box", "principle-box", f"{t}: {summary}") for t, summary, _ in items]
+
+
+def _applications(p):
+    return [
+        ("subheader", "Applications & Implications"),
+        ("tabs", ["System Design", "Education", "Policy"], [
+            _tab("Ethical Design of Information Systems", p.DESIGN_PRINCIPLES),
+            _tab("Educational Implications", p.EDUCATION_AREAS),
+            _tab("Policy Recommendations", p.POLICY_AREAS),
+        ]),
+    ]
+
+
+def _discussion(p):
+    return [
+        ("subheader", "Discussion Questions"),
+        ("subheader", "Critical Thinking Questions"),
+    ]
+
+
+def _references(p):
+    return [
+        ("subheader", "References & Further Reading"),
+        ("bibliography", "Primary References", p.PRIMARY_REFERENCES),
+    ]
+
+
+LAYOUTS = {
+    "overview": _overview,
+    "full_paper": _full_paper,
+    "abstract": _abstract,
+    "framework": _framework,
+    "imr_model": _imr_model,
+    "case_studies": _case_studies,
+    "applications": _applications,
+    "discussion": _discussion,
+    "references": _references,
+}
+
+
+def compile_blocks(blocks):
+    """Lower source blocks to renderable ones, merging adjacent fragments."""
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "box":
+            block = ("html", box_html(block[1], block[2]))
+            kind = "html"
+        if kind in ("expander",):
+            block = (kind, block[1], compile_blocks(block[2]))
+        elif kind in ("columns", "tabs"):
+            block = (kind, block[1], [compile_blocks(child) for child in block[2]])
+        if kind in ("md", "html") and out and out[-1][0] == kind:
+            sep = "\n\n" if kind == "md" else "\n"
+            out[-1] = [kind, out[-1][1] + sep + block[1]]
+        else:
+            out.append(list(block))
+    return out
+
+
+def quiz_items(source, sections):
+    """The source's quiz item bank, checked so a broken item fails the build."""
+    items = getattr(source, "QUIZ", [])
+    ids = set()
+    for item in items:
+        if item["id"] in ids:
+            raise ValueError(f"Duplicate quiz item {item['id']!r}")
+        ids.add(item["id"])
+        if item["section"] not in sections:
+            raise ValueError(f"Quiz item {item['id']!r} tests an unknown section {item['section']!r}")
+        if item["answer"] not in item["options"]:
+            raise ValueError(f"Quiz item {item['id']!r}: the answer is not one of the options")
+        if item["level"] not in (1, 2, 3):
+            raise ValueError(f"Quiz item {item['id']!r}: level must be 1, 2 or 3")
+    return items
+
+
+def compile_paper(source=paper):
+    """Compile a paper source module (its own ``LAYOUTS`` if it has them)."""
+    layouts = getattr(source, "LAYOUTS", None) or LAYOUTS
+    sections = {key: compile_blocks(layout(source)) for key, layout in layouts.items()}
+    reference_index = references.link(sections, source)
+    questions = getattr(source, "QUESTIONS", [])
+    data = {
+        "meta": source.META,
+        "nav": [list(item) for item in source.SECTIONS],
+        "questions": questions,
+        "quiz": quiz_items(source, sections),
+        "case_studies": [[study["key"], study["title"]] for study in getattr(source, "CASE_STUDIES", [])],
+        "citations": citations.items(source),
+        "references": reference_index,
+    }
+    body = json.dumps({"sections": sections, "data": data}, sort_keys=True, ensure_ascii=False)
+    return {
+        "format": FORMAT,
+        "source_hash": source_hash(source),
+        "version": hashlib.sha256(body.encode("utf-8")).hexdigest()[:12],
+        "sections": sections,
+        "data": data,
+        "search": search.build_index(sections, questions),
+    }
+
+
+def write(path, source=paper):
+    artifact = compile_paper(source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(artifact, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+    return artifact
+
+
+def load(path, source=None):
+    """Read an artifact; with a ``source`` module, rebuild it first if it is
+    missing or stale (in memory only on a read-only filesystem)."""
+    try:
+        artifact = json.loads(path.read_text(encoding="utf-8"))
+        if source is None or (artifact.get("format") == FORMAT and artifact.get("source_hash") == source_hash(source)):
+            return artifact
+    except (OSError, ValueError):
+        if source is None:
+            raise
+    try:
+        return write(path, source)
+    except OSError:
+        return compile_paper(source)
+
+
+if __name__ == "__main__":
+    from content import registry
+
+    for entry in registry.manifest()["papers"]:
+        if "source" in entry:
+            path = artifact_path(entry["id"])
+            artifact = write(path, importlib.import_module(entry["source"]))
+            print(f"{entry['id']} {artifact['version']} -> {path}", file=sys.stderr)
@@ -0,0 +1,195 @@
+"""Citations of a paper and its references in every export format.
+
+``items`` runs at content build time: the paper's metadata and its
+``REFERENCES`` (APA strings, as printed in the paper) become
+CSL-JSON items stored in the artifact, so a malformed reference fails the
+build rather than a reader's rerun. The formatters below turn items into
+APA, MLA and Chicago (plain text), BibTeX, RIS or CSL-JSON, and ``bundle``
+zips every format of every item into one download.
+"""
+
+import io
+import json
+import re
+import unicodedata
+import zipfile
+
+_APA = re.compile(r"(?P<authors>.+?) \((?P<year>\d{4})\)\. (?P<rest>.+)")
+_ARTICLE = re.compile(r"(?P<title>.+?)\. \*(?P<container>.+?)\*, (?P<volume>[^(,]+)(?:\((?P<issue>[^)]+)\))?, (?P<page>[\d-]+)\.")
+_BOOK = re.compile(r"\*(?P<title>.+?)\*\.? (?P<publisher>.+?)\.")
+_PLAIN = re.compile(r"(?P<title>.+[.?!]?) (?P<publisher>[^.]+)\.")
+
+
+def _end(text):
+    return text if text.endswith((".", "?", "!")) else text + "."
+
+
+def _key(item):
+    family = unicodedata.normalize("NFKD", item["author"][0]["family"]).encode("ascii", "ignore").decode()
+    words = [word for word in re.findall(r"[a-z]+", item["title"].lower()) if word not in ("a", "an", "the", "if", "i")]
+    return f"{family.lower()}{item['issued']['date-parts'][0][0]}{words[0] if words else ''}"
+
+
+def _authors(text):
+    parts = [part.strip() for part in text.replace(", &", ",").replace(" & ", ", ").split(", ")]
+    if len(parts) % 2:
+        raise ValueError(f"Cannot split authors: {text!r}")
+    return [{"family": family, "given": given} for family, given in zip(parts[::2], parts[1::2])]
+
+
+def parse_reference(text):
+    """CSL-JSON item for an APA reference string (``*...*`` marks italics)."""
+    match = _APA.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"Unrecognised reference: {text!r}")
+    item = {"author": _authors(match["authors"]), "issued": {"date-parts": [[int(match["year"])]]}}
+    rest = match["rest"]
+    if article := _ARTICLE.fullmatch(rest):
+        item.update(type="article-journal", title=article["title"], **{"container-title": article["container"]},
+                    volume=article["volume"].strip(), page=article["page"])
+        if article["issue"]:
+            item["issue"] = article["issue"]
+    elif book := _BOOK.fullmatch(rest) or _PLAIN.fullmatch(rest):
+        item.update(type="book", title=book["title"].rstrip("."), publisher=book["publisher"])
+    else:
+        raise ValueError(f"Unrecognised reference: {text!r}")
+    item["id"] = _key(item)
+    return item
+
+
+def paper_item(meta):
+    title = f"{meta['title']}: {meta['subtitle']}" if meta.get("subtitle") else meta["title"]
+    item = {
+        "type": "report",
+        "title": title,
+        "author": meta["authors"],
+        "issued": {"date-parts": [[meta["year"]]]},
+        "publisher": f"{meta['affiliation']} {meta['program']} Program",
+        "container-title": f"{meta['course']} Course Materials",
+    }
+    item["id"] = _key(item)
+    return item
+
+
+def items(source):
+    """The paper followed by its references."""
+    return [paper_item(source.META)] + [parse_reference(text) for text in getattr(source, "REFERENCES", [])]
+
+
+def _initials(given):
+    return " ".join(f"{part[0]}." for part in given.replace(".", ". ").split())
+
+
+def _year(item):
+    return item["issued"]["date-parts"][0][0]
+
+
+def _pages(item):
+    return item["page"].replace("-", "–")
+
+
+def apa(item):
+    names = [f"{a['family']}, {_initials(a['given'])}" for a in item["author"]]
+    authors = names[0] if len(names) == 1 else ", ".join(names[:-1]) + ", & " + names[-1]
+    head = f"{authors} ({_year(item)}). {_end(item['title'])}"
+    if item["type"] == "article-journal":
+        issue = f"({item['issue']})" if "issue" in item else ""
+        return f"{head} {item['container-title']}, {item['volume']}{issue}, {_pages(item)}."
+    return f"{head} {_end(item['publisher'])}"
+
+
+def _inverted(authors, et_al_after):
+    first = f"{authors[0]['family']}, {authors[0]['given']}"
+    if len(authors) == 1:
+        return first
+    if len(authors) > et_al_after:
+        return f"{first}, et al"
+    rest = [f"{a['given']} {a['family']}" for a in authors[1:]]
+    return ", ".join([first] + rest[:-1]) + f", and {rest[-1]}"
+
+
+def mla(item):
+    authors = _end(_inverted(item["author"], 2))
+    if item["type"] == "article-journal":
+        issue = f", no. {item['issue']}" if "issue" in item else ""
+        return (f'{authors} "{_end(item["title"])}" {item["container-title"]}, vol. {item["volume"]}{issue}, '
+                f"{_year(item)}, pp. {_pages(item)}.")
+    if "container-title" in item:
+        return f'{authors} "{_end(item["title"])}" {item["container-title"]}, {_year(item)}.'
+    return f"{authors} {_end(item['title'])} {item['publisher']}, {_year(item)}."
+
+
+def chicago(item):
+    authors = _end(_inverted(item["author"], 10))
+    if item["type"] == "article-journal":
+        issue = f", no. {item['issue']}" if "issue" in item else ""
+        return f'{authors} "{_end(item["title"])}" {item["container-title"]} {item["volume"]}{issue} ({_year(item)}): {_pages(item)}.'
+    if "container-title" in item:
+        return f'{authors} "{_end(item["title"])}" {item["container-title"]}. {item["publisher"]}, {_year(item)}.'
+    return f"{authors} {_end(item['title'])} {item['publisher']}, {_year(item)}."
+
+
+def _tex(text):
+    return re.sub(r"([&%$#_])", r"\\\1", text)
+
+
+def bibtex(item):
+    kind = {"article-journal": "article", "book": "book"}.get(item["type"], "misc")
+    fields = [
+        ("author", " and ".join(f"{a['family']}, {a['given']}" for a in item["author"])),
+        ("title", "{" + item["title"] + "}"),
+        ("journal" if kind == "article" else "howpublished", item.get("container-title") if kind != "book" else None),
+        ("year", str(_year(item))),
+        ("volume", item.get("volume")),
+        ("number", item.get("issue")),
+        ("pages", item["page"].replace("-", "--") if "page" in item else None),
+        ("note" if kind == "misc" else "publisher", item.get("publisher")),
+    ]
+    body = ",\n".join(f"  {name} = {{{_tex(value)}}}" for name, value in fields if value)
+    return f"@{kind}{{{item['id']},\n{body}\n}}"
+
+
+def ris(item):
+    kind = {"article-journal": "JOUR", "book": "BOOK"}.get(item["type"], "RPRT")
+    lines = [("TY", kind)] + [("AU", f"{a['family']}, {a['given']}") for a in item["author"]]
+    lines += [("PY", str(_year(item))), ("TI", item["title"])]
+    if "container-title" in item:
+        lines.append(("JO" if kind == "JOUR" else "T2", item["container-title"]))
+    for tag, field in (("VL", "volume"), ("IS", "issue"), ("PB", "publisher")):
+        if field in item:
+            lines.append((tag, item[field]))
+    if "page" in item:
+        start, _, end = item["page"].partition("-")
+        lines += [("SP", start)] + ([("EP", end)] if end else [])
+    lines.append(("ER", ""))
+    return "\n".join(f"{tag}  - {value}".rstrip() for tag, value in lines)
+
+
+# format -> (label, item formatter, separator between items, file name, MIME type)
+FORMATS = {
+    "apa": ("APA", apa, "\n\n", "apa.txt", "text/plain"),
+    "mla": ("MLA", mla, "\n\n", "mla.txt", "text/plain"),
+    "chicago": ("Chicago", chicago, "\n\n", "chicago.txt", "text/plain"),
+    "bibtex": ("BibTeX", bibtex, "\n\n", "citations.bib", "application/x-bibtex"),
+    "ris": ("RIS", ris, "\n\n", "citations.ris", "application/x-research-info-systems"),
+    "csl-json": ("CSL-JSON", None, None, "citations.json", "application/vnd.citationstyles.csl+json"),
+}
+
+
+def export(entries, fmt):
+    """All ``entries`` in one format, as the text of a file."""
+    if fmt == "csl-json":
+        return json.dumps(entries, indent=2, ensure_ascii=False) + "\n"
+    _, formatter, separator, _, _ = FORMATS[fmt]
+    return separator.join(formatter(item) for item in entries) + "\n"
+
+
+def bundle(entries):
+    """A zip with every entry in every format (one file per format)."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for fmt, (_, _, _, name, _) in FORMATS.items():
+            info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, export(entries, fmt))
+    return out.getvalue()
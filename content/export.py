@@ -0,0 +1,134 @@
+"""Export the static sections of the paper as a plain HTML site.
+
+Usage::
+
+    python -m content.export [OUTDIR] [--app-url URL]
+
+Every section without widgets is rendered to ``OUTDIR/<section>.html`` (the
+first one doubles as ``index.html``) from the same compiled blocks the app
+serves. The stylesheet is minified into a single content-hashed file under
+``OUTDIR/assets/`` (next to the vendored fonts) so it can be served with a
+long-lived cache header; the HTML pages keep stable names. Interactive
+sections link to the Streamlit app when ``--app-url`` is given.
+
+``OUTDIR`` is replaced as a whole, so it must be missing, empty or a
+previous export (it holds a ``manifest.json`` written by this command);
+any other directory is refused.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import shutil
+from pathlib import Path
+
+import sections
+from content import assets, build
+from content.markup import header, render_blocks
+
+STYLESHEETS = ("app.css", "export.css")
+DEFAULT_OUT = Path("site")
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def bundle_css(out):
+    css = assets.bundle(STYLESHEETS, font_url="fonts/")
+    name = assets.fingerprint(css, stem="site")
+    (out / "assets" / "fonts").mkdir(parents=True, exist_ok=True)
+    (out / "assets" / name).write_text(css, encoding="utf-8")
+    for _, font, _, _ in assets.fonts():
+        shutil.copyfile(assets.FONTS / font, out / "assets" / "fonts" / font)
+    return f"assets/{name}"
+
+
+def _nav(pages, current, app_url):
+    links = []
+    for label, key in sections.SECTIONS.items():
+        if key in pages:
+            active = ' class="active"' if key == current else ""
+            links.append(f'<a href="{key}.html"{active}>{html.escape(label)}</a>')
+        elif app_url:
+            links.append(f'<a href="{html.escape(app_url)}">{html.escape(label)} ↗</a>')
+    return '<nav class="site-nav">\n' + "\n".join(links) + "\n</nav>"
+
+
+def _local_links(body):
+    """Cross-section links (``?section=<key>#...``) point at the exported pages."""
+    return re.sub(r'href="\?section=(\w+)', r'href="\1.html', body)
+
+
+def render_page(artifact, key, label, pages, css_href, app_url=None):
+    meta = artifact["data"]["meta"]
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="generator" content="content.export {artifact['version']}">
+<title>{html.escape(label)} · {html.escape(meta['title'])}</title>
+<link rel="stylesheet" href="{css_href}">
+</head>
+<body>
+<div class="site">
+{_nav(pages, key, app_url)}
+<main class="site-main">
+{header(meta)}
+{_local_links(render_blocks(artifact['sections'][key]))}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def _previous_export(out):
+    try:
+        manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return isinstance(manifest, dict) and {"version", "assets", "pages"} <= manifest.keys()
+
+
+def export(out=DEFAULT_OUT, app_url=None):
+    out = Path(out)
+    if out.exists():
+        if not out.is_dir() or (any(out.iterdir()) and not _previous_export(out)):
+            raise ValueError(f"{out} is not empty and not a previous export; choose another directory")
+        shutil.rmtree(out)
+    artifact = build.compile_paper()
+    out.mkdir(parents=True)
+
+    css_href = bundle_css(out)
+    pages = [key for key in sections.SECTIONS.values() if key not in sections.INTERACTIVE]
+    manifest = {"version": artifact["version"], "assets": {"site.css": css_href}, "pages": {}}
+    for label, key in sections.SECTIONS.items():
+        if key not in pages:
+            continue
+        page = render_page(artifact, key, label, pages, css_href, app_url).encode("utf-8")
+        (out / f"{key}.html").write_bytes(page)
+        manifest["pages"][key] = {"path": f"{key}.html", "sha256": _digest(page)}
+    shutil.copyfile(out / f"{pages[0]}.html", out / "index.html")
+
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out", nargs="?", default=DEFAULT_OUT, type=Path)
+    parser.add_argument("--app-url", help="URL of the live Streamlit app for the interactive sections")
+    args = parser.parse_args(argv)
+    try:
+        manifest = export(args.out, args.app_url)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"exported {len(manifest['pages'])} pages ({manifest['version']}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
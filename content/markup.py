@@ -0,0 +1,81 @@
+"""HTML rendering of compiled content blocks.
+
+Covers the Markdown subset used in ``content.paper`` (headings, rules,
+paragraphs, bold and italic) so the same blocks Streamlit renders in the app
+can be written out as plain HTML without a Markdown dependency.
+"""
+
+import html
+import re
+
+_HEADING = re.compile(r"(#{1,6}) (.+)")
+# Citation anchors inserted by ``content.references`` pass through as HTML
+_CITE = re.compile(r'(<a class="cite"[^>]*>[^<]*</a>)')
+
+
+def _emphasis(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
+
+
+def inline(text):
+    return "".join(part if i % 2 else _emphasis(part) for i, part in enumerate(_CITE.split(text)))
+
+
+def header(meta):
+    """The paper's title block, shared by the app and the static export."""
+    return (
+        '<div class="paper-header">\n'
+        f'<h1 class="paper-title">{inline(meta["title"])}</h1>\n'
+        f'<h2 class="paper-author">{inline(meta["author"])}</h2>\n'
+        f'<p class="paper-affiliation">{inline(meta["affiliation"])} • {inline(meta["program"])} • {inline(meta["date"])}</p>\n'
+        "</div>"
+    )
+
+
+def markdown(text):
+    out = []
+    for para in re.split(r"\n\s*\n", text.strip()):
+        para = para.strip()
+        heading = _HEADING.fullmatch(para)
+        if para == "---":
+            out.append("<hr>")
+        elif heading:
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline(heading.group(2))}</h{level}>")
+        else:
+            out.append(f"<p>{inline(para).replace(chr(10), '<br>')}</p>")
+    return "\n".join(out)
+
+
+def render_blocks(blocks):
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "md":
+            out.append(markdown(block[1]))
+        elif kind == "html":
+            out.append(block[1])
+        elif kind == "subheader":
+            out.append(f"<h3>{inline(block[1])}</h3>")
+        elif kind in ("info", "success", "error"):
+            out.append(f'<div class="callout callout-{kind}">{markdown(block[1])}</div>')
+        elif kind == "metric":
+            out.append(f'<div class="metric-card"><div class="metric-label">{inline(block[1])}</div>'
+                       f'<div class="metric-value">{inline(block[2])}</div></div>')
+        elif kind == "expander":
+            out.append(f"<details><summary>{inline(block[1])}</summary>\n{render_blocks(block[2])}\n</details>")
+        elif kind == "columns":
+            spec = block[1] if isinstance(block[1], list) else [1] * block[1]
+            cols = "\n".join(f'<div class="column" style="flex: {weight}">\n{render_blocks(children)}\n</div>'
+                             for weight, children in zip(spec, block[2]))
+            out.append(f'<div class="columns">\n{cols}\n</div>')
+        elif kind == "tabs":
+            # No script on the static site: tabs become stacked, collapsible panels
+            for i, (label, children) in enumerate(zip(block[1], block[2])):
+                open_attr = " open" if i == 0 else ""
+                out.append(f"<details{open_attr}><summary>{inline(label)}</summary>\n{render_blocks(children)}\n</details>")
+        else:
+            raise ValueError(f"Unknown content block: {kind!r}")
+    return "\n".join(out)
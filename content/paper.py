@@ -0,0 +1,353 @@
+"""Source text of the paper.
+
+Everything a reader sees in the static parts of the app is defined here as
+plain data. ``content.build`` compiles it into the pre-rendered artifact the
+app serves, so edits to this file take effect after a rebuild (or on the
+next process start, which rebuilds a stale artifact automatically).
+"""
+
+META = {
+    "title": "Information Networks and Moral Responsibility",
+    "subtitle": "How Digital Connectivity Transforms Ethical Obligations",
+    "author": "Xavier Honablue, M.Ed.",
+    "authors": [{"family": "Honablue", "given": "Xavier"}],
+    "affiliation": "University of Michigan Ann Arbor",
+    "program": "Masters Applied Data Science",
+    "course": "PHL201",
+    "date": "September 2025",
+    "year": 2025,
+    "reading_time": "~25-30 minutes",
+}
+
+# Sidebar navigation: (label, section key). Keys with a module in
+# ``sections`` are interactive; the rest render their compiled blocks.
+SECTIONS = [
+    ("Paper Overview", "overview"),
+    ("Full Paper Text", "full_paper"),
+    ("Abstract & Introduction", "abstract"),
+    ("Theoretical Framework", "framework"),
+    ("The IMR Model", "imr_model"),
+    ("Case Studies", "case_studies"),
+    ("Applications & Implications", "applications"),
+    ("Discussion Questions", "discussion"),
+    ("References & Further Reading", "references"),
+    ("Interactive Demos", "demos"),
+]
+
+KEYWORDS = "moral responsibility, digital ethics, information networks, moral psychology, global ethics, media effects"
+
+ABSTRACT = [
+    "This paper examines how information networks and digital connectivity affect moral responsibility in contemporary global society. Drawing on empirical research in moral psychology, network theory, and media studies, we analyze how awareness of distant suffering through digital media creates new forms of moral obligation that challenge traditional proximity-based ethical frameworks. We propose the **Information-Mediated Responsibility (IMR) model**, which accounts for how technological mediation affects moral salience, emotional engagement, and behavioral response.",
+    "Key findings include: (1) digital information exposure creates measurable changes in moral judgment patterns, (2) network effects amplify individual moral responses through social reinforcement mechanisms, and (3) information overload can paradoxically reduce moral responsiveness through psychological defense mechanisms. We conclude with practical recommendations for ethical engagement in digital environments and educational approaches for developing critical moral literacy in an interconnected world.",
+]
+
+ABSTRACT_SHORT = "This paper examines how information networks and digital connectivity affect moral responsibility in contemporary global society. We propose the Information-Mediated Responsibility (IMR) model, which accounts for how technological mediation affects moral salience, emotional engagement, and behavioral response."
+
+INTRODUCTION = [
+    "The digital revolution has fundamentally altered the landscape of moral responsibility. Unlike previous generations, who remained largely unaware of distant suffering, contemporary individuals receive constant streams of information about global injustices, environmental crises, and human rights violations. This unprecedented access to information about suffering raises profound questions about the scope and nature of moral obligation.",
+    "Traditional ethical frameworks developed under assumptions of limited information and local communities. Utilitarian calculations assumed practical constraints on knowledge and action. Virtue ethics focused on character development within particular communities. Deontological systems emphasized universal principles but were applied within contexts of limited awareness. None adequately address the moral implications of instantaneous global information access.",
+    "This paper proposes the Information-Mediated Responsibility (IMR) model as a framework for understanding how digital connectivity transforms moral obligations. Unlike speculative theoretical approaches, IMR builds on established research in moral psychology, media effects, and network theory to generate empirically grounded insights about contemporary ethical challenges.",
+]
+
+INTRODUCTION_SHORT = "The digital revolution has fundamentally altered the landscape of moral responsibility. Traditional ethical frameworks don't adequately address the moral implications of instantaneous global information access. The Information-Mediated Responsibility (IMR) model provides a framework for understanding how digital connectivity transforms moral obligations."
+
+RESEARCH_SUMMARY = [
+    ("Research Question", "How does digital connectivity transform moral responsibility in contemporary society?"),
+    ("Methodology", "Interdisciplinary analysis drawing on moral psychology, network theory, and media studies"),
+    ("Key Contribution", "The Information-Mediated Responsibility (IMR) model"),
+]
+
+KEY_INSIGHT = "Key Insight: Digital information doesn't just expand moral awareness—it fundamentally transforms the nature of moral responsibility itself."
+
+IMR_INSIGHT = "The IMR Model: A framework for understanding how digital connectivity transforms moral obligations through four core principles and testable predictions."
+
+OBJECTIVES = [
+    "Analyze how digital information affects moral judgment and behavior",
+    "Evaluate traditional ethical frameworks in digital contexts",
+    "Apply the IMR model to contemporary moral challenges",
+    "Critically assess technology's role in shaping moral communities",
+]
+
+# (title, summary used in the section views, full paper text)
+MECHANISMS = [
+    ("Proximity Override",
+     "Visual media makes distant suffering more psychologically proximate than local issues.",
+     "Visual media can make distant suffering more psychologically proximate than local issues. Neuroimaging studies show that viewing images of distant suffering activates similar empathy networks as witnessing local distress (Decety & Jackson, 2004)."),
+    ("Narrative Framing",
+     "Digital platforms use storytelling techniques that enhance emotional engagement.",
+     "Digital platforms use storytelling techniques that enhance emotional engagement with distant moral issues. Research indicates that narrative structure significantly influences moral judgment independent of factual content (Nussbaum, 2001)."),
+    ("Algorithmic Curation",
+     "Social media algorithms create echo chambers that amplify certain moral concerns.",
+     "Social media algorithms selectively expose users to morally charged content based on engagement patterns, creating echo chambers that amplify certain moral concerns while obscuring others (Pariser, 2011)."),
+]
+
+NETWORK_EFFECTS = [
+    ("Moral Cascade Effects", "When individuals observe others responding to moral issues, they become more likely to respond themselves, creating cascading waves of moral engagement (Bicchieri, 2006)."),
+    ("Diffusion of Responsibility", "Paradoxically, awareness that many others are also aware of moral issues can reduce individual feelings of responsibility through diffusion effects documented in social psychology (Latané & Darley, 1970)."),
+    ("Network Polarization", "Digital networks can amplify moral polarization by sorting individuals into like-minded communities that reinforce existing moral commitments while demonizing alternative perspectives (Sunstein, 2017)."),
+]
+
+OVERLOAD_EFFECTS = [
+    ("Finite Pool of Worry", "Individuals have limited capacity for moral concern, leading to zero-sum competition between moral issues for attention and emotional engagement (Weber, 2006)."),
+    ("Compassion Fatigue", "Repeated exposure to suffering can reduce empathetic responding through psychological defense mechanisms (Figley, 2002)."),
+    ("Psychic Numbing", "Research demonstrates that moral responsiveness decreases as the number of victims increases, violating normative principles of proportional response (Slovic, 2007)."),
+]
+
+# (title, summary used in the section views, full paper text)
+PRINCIPLES = [
+    ("Information Integration Principle",
+     "Moral obligations arise through integration of factual information, emotional engagement, and capacity for effective action.",
+     "Moral obligations arise through the integration of factual information, emotional engagement, and capacity for effective action. All three components are necessary for full moral responsibility."),
+    ("Network Amplification Principle",
+     "Individual moral responses are amplified or diminished through network effects.",
+     "Individual moral responses are amplified or diminished through network effects that can either reinforce or undermine moral engagement."),
+    ("Cognitive Load Principle",
+     "Moral responsiveness is subject to cognitive limitations that create systematic biases.",
+     "Moral responsiveness is subject to cognitive limitations that create systematic biases in how individuals process moral information."),
+    ("Mediation Transparency Principle",
+     "Technological mediation affects moral judgment in ways often invisible to the moral agent.",
+     "The technological mediation of moral information affects moral judgment in ways that are often invisible to the moral agent, requiring critical literacy for appropriate moral response."),
+]
+
+PREDICTIONS = [
+    "Individuals exposed to narrative-rich presentations of distant suffering will show greater moral engagement than those receiving statistical information about larger-scale suffering.",
+    "Moral responsiveness will correlate with network position, with individuals at network centers showing both greater initial engagement and faster saturation effects.",
+    "Individuals will show measurable decreases in moral responsiveness when exposed to multiple simultaneous moral demands compared to sequential presentation.",
+    "Training in media literacy will improve calibration between moral response and objective moral significance of issues.",
+]
+
+CASE_STUDIES = [
+    {
+        "key": "haiti",
+        "title": "Social Media and Crisis Response: 2010 Haiti Earthquake",
+        "heading": "4.1 Social Media and Crisis Response",
+        "intro": "**The 2010 Haiti earthquake** provides a paradigmatic case of information-mediated moral responsibility. Social media enabled unprecedented rapid response, with millions of individuals donating through text messaging within hours of the disaster. However, analysis reveals several concerning patterns:",
+        "points": [
+            ("Attention Decay", "Initial massive engagement declined rapidly", "Initial massive engagement declined rapidly as media attention shifted, despite ongoing need"),
+            ("Visible vs. Invisible Needs", "Rescue efforts received disproportionate support", "Highly visible rescue efforts received disproportionate support compared to less dramatic but equally important infrastructure needs"),
+            ("Geographic Bias", "Haiti received more aid than simultaneous crises elsewhere", "Haiti received more per-capita aid than simultaneous crises in less media-accessible regions"),
+        ],
+    },
+    {
+        "key": "climate",
+        "title": "Climate Change and Temporal Responsibility",
+        "heading": "4.2 Climate Change and Temporal Responsibility",
+        "intro": "**Climate change** presents unique challenges for information-mediated responsibility due to temporal distance and causal complexity:",
+        "points": [
+            ("Present Bias", "Reduced engagement with future suffering", "Individuals show reduced moral engagement with future compared to present suffering, even when future suffering is more severe"),
+            ("Causal Opacity", "Complex causal chains reduce personal responsibility", "Complex causal chains between individual action and climate outcomes reduce feelings of personal responsibility"),
+            ("Statistical vs. Narrative", "Abstract statistics generate less engagement", "Abstract statistics about future climate impacts generate less moral engagement than personal stories about present climate effects"),
+        ],
+    },
+    {
+        "key": "covid",
+        "title": "Global Health Inequities: COVID-19 Pandemic",
+        "heading": "4.3 Global Health Inequities",
+        "intro": "**The COVID-19 pandemic** revealed both possibilities and limitations of global moral solidarity:",
+        "points": [
+            ("Initial Universalism", "Unprecedented global cooperation", "Early pandemic response showed unprecedented global cooperation based on shared vulnerability"),
+            ("Rapid Localization", "Moral concern narrowed to local priorities", "As vaccines became available, moral concern quickly narrowed to national and local priorities"),
+            ("Information Fatigue", "Sustained exposure led to decreased engagement", "Sustained information exposure led to measurable decreases in moral engagement over time"),
+        ],
+    },
+]
+
+# (title, summary used in the section views, full paper text)
+DESIGN_PRINCIPLES = [
+    ("Moral Calibration", "Promote appropriate rather than maximal emotional engagement", "Systems should present moral information in ways that promote appropriate rather than maximal emotional engagement."),
+    ("Attention Distribution", "Avoid concentrating attention on less significant issues", "Platforms should avoid algorithms that concentrate moral attention on highly engaging but potentially less significant issues."),
+    ("Action Facilitation", "Couple information with concrete action opportunities", "Moral information should be coupled with concrete, effective action opportunities to prevent learned helplessness."),
+    ("Transparency Requirements", "Users should understand algorithmic curation", "Users should understand how algorithmic curation affects their moral information environment."),
+]
+
+EDUCATION_AREAS = [
+    ("Media Effects Education", "Instruction in how digital media affects moral judgment", "Students need explicit instruction in how digital media affects moral judgment and behavior."),
+    ("Network Awareness", "Understanding how social networks shape moral beliefs", "Understanding how social networks shape moral beliefs and responses."),
+    ("Cognitive Bias Training", "Recognition of systematic limitations", "Recognition of systematic limitations in moral information processing."),
+    ("Practical Ethics", "Frameworks for navigating complex moral environments", "Development of frameworks for navigating complex moral information environments."),
+]
+
+POLICY_AREAS = [
+    ("Platform Transparency", "Requirements for disclosure of algorithmic curation", "Requirements for social media platforms to disclose algorithmic curation of moral content."),
+    ("Information Diversity", "Policies promoting diverse moral perspectives", "Policies promoting exposure to diverse moral perspectives and global moral concerns."),
+    ("Attention Protection", "Recognition of attention as finite moral resource", "Recognition that human attention is a finite moral resource requiring protection from exploitation."),
+    ("Global Information Justice", "Equitable representation of global concerns", "Efforts to ensure equitable representation of global moral concerns in information systems."),
+]
+
+LIMITATIONS = [
+    ("Correlation vs. Causation", "Much evidence is correlational, making causal claims tentative"),
+    ("Cultural Specificity", "Most studies focus on Western, educated populations"),
+    ("Laboratory vs. Real-World", "Experimental studies may not generalize to complex real-world moral environments"),
+    ("Temporal Constraints", "Long-term effects of digital moral engagement remain understudied"),
+]
+
+FUTURE_RESEARCH = [
+    ("Longitudinal Studies", "Tracking how digital moral engagement evolves over time and life course."),
+    ("Cross-Cultural Research", "Examining how cultural differences affect information-mediated moral responsibility."),
+    ("Intervention Studies", "Testing specific approaches for improving moral calibration in digital environments."),
+    ("Neuroscience Applications", "Using brain imaging to understand neural mechanisms of digitally mediated moral response."),
+    ("Network Analysis", "Large-scale studies of how moral beliefs and behaviors spread through digital networks."),
+]
+
+CONCLUSION = [
+    "The Information-Mediated Responsibility model provides a framework for understanding how digital connectivity transforms moral obligation. Unlike traditional ethical theories developed for limited-information environments, IMR acknowledges both the opportunities and limitations created by global information access.",
+    "These insights have practical implications for educational curricula, platform design, and public policy. As digital connectivity continues to evolve, developing sophisticated frameworks for information-mediated moral responsibility becomes increasingly urgent.",
+    "The goal is not to maximize moral engagement but to calibrate it appropriately - responding to genuine moral demands while avoiding the psychological defense mechanisms that lead to moral numbing and disengagement. This requires both individual moral literacy and collective efforts to create information environments that support rather than undermine moral agency.",
+    "Future research should focus on empirical testing of IMR predictions and development of practical tools for navigating moral complexity in digital environments. The stakes are high: our capacity for appropriate moral response to global challenges may depend on our ability to understand and manage the transformation of moral responsibility in the digital age.",
+]
+
+KEY_CONCLUSIONS = [
+    "Moral responsibility is not simply expanded by information access but qualitatively transformed",
+    "Network effects create collective moral phenomena that exceed individual moral capacities",
+    "Cognitive limitations require systematic approaches to moral information management",
+    "Technological mediation affects moral judgment in ways requiring critical literacy",
+]
+
+QUESTIONS = [
+    "How does the IMR model challenge traditional notions of moral proximity?",
+    "What are the ethical implications of algorithmic curation of moral content?",
+    "How might the principles of the IMR model apply to emerging technologies?",
+    "Is there such a thing as 'too much' moral information?",
+    "What role should education play in developing 'digital moral literacy'?",
+    "Can the IMR model help explain contemporary political polarization online?",
+]
+
+REFERENCES = [
+    "Bicchieri, C. (2006). *The grammar of society: The nature and dynamics of social norms*. Cambridge University Press.",
+    "Decety, J., & Jackson, P. L. (2004). The functional architecture of human empathy. *Behavioral and Cognitive Neuroscience Reviews*, 3(2), 71-100.",
+    "Figley, C. R. (2002). Compassion fatigue: Psychotherapists' chronic lack of self care. *Journal of Clinical Psychology*, 58(11), 1433-1441.",
+    "Greene, J. D. (2013). *Moral tribes: Emotion, reason, and the gap between us and them*. Penguin Press.",
+    "Haidt, J. (2012). *The righteous mind: Why good people are divided by politics and religion*. Vintage Books.",
+    "Latané, B., & Darley, J. M. (1970). *The unresponsive bystander: Why doesn't he help?* Appleton-Century-Crofts.",
+    "Nussbaum, M. C. (2001). *Upheavals of thought: The intelligence of emotions*. Cambridge University Press.",
+    "Pariser, E. (2011). *The filter bubble: What the Internet is hiding from you*. Penguin Press.",
+    "Slovic, P. (2007). 'If I look at the mass I will never act': Psychic numbing and genocide. *Judgment and Decision Making*, 2(2), 79-95.",
+    "Sunstein, C. R. (2017). *#Republic: Divided democracy in the age of social media*. Princeton University Press.",
+    "Weber, E. U. (2006). Experience-based and description-based perceptions of long-term risk: Why global warming does not scare us (yet). *Climatic Change*, 77(1-2), 103-120.",
+]
+
+# Entries of REFERENCES shown under "References & Further Reading", cited in-text style
+PRIMARY_REFERENCES = ["Greene, 2013", "Haidt, 2012", "Pariser, 2011", "Sunstein, 2017"]
+
+# Item bank of the adaptive quiz: id, the section (key) it tests, authored
+# level (1 easy .. 3 hard, the prior for its calibrated difficulty),
+# question, options and the correct option
+QUIZ = [
+    {"id": "overview-question", "section": "overview", "level": 1,
+     "question": "What is the paper's central research question?",
+     "options": ["How does digital connectivity transform moral responsibility in contemporary society?",
+                 "How do social media companies profit from moral outrage?",
+                 "Which ethical theory best explains charitable giving?"],
+     "answer": "How does digital connectivity transform moral responsibility in contemporary society?"},
+    {"id": "overview-method", "section": "overview", "level": 2,
+     "question": "Which methodology does the paper use?",
+     "options": ["A randomized field experiment with social media users",
+                 "Interdisciplinary analysis drawing on moral psychology, network theory, and media studies",
+                 "A philosophical thought experiment without empirical grounding"],
+     "answer": "Interdisciplinary analysis drawing on moral psychology, network theory, and media studies"},
+    {"id": "overview-insight", "section": "overview", "level": 3,
+     "question": "According to the paper's key insight, digital information...",
+     "options": ["only expands the number of issues people are aware of",
+                 "fundamentally transforms the nature of moral responsibility itself",
+                 "has no measurable effect on moral judgment"],
+     "answer": "fundamentally transforms the nature of moral responsibility itself"},
+    {"id": "abstract-model", "section": "abstract", "level": 1,
+     "question": "What does the IMR model stand for?",
+     "options": ["Information-Mediated Responsibility", "Individual Moral Reasoning", "Integrated Media Response"],
+     "answer": "Information-Mediated Responsibility"},
+    {"id": "abstract-overload", "section": "abstract", "level": 2,
+     "question": "What does the paper find about information overload?",
+     "options": ["It steadily increases moral responsiveness",
+                 "It can paradoxically reduce moral responsiveness through psychological defense mechanisms",
+                 "It affects only people who avoid the news"],
+     "answer": "It can paradoxically reduce moral responsiveness through psychological defense mechanisms"},
+    {"id": "abstract-frameworks", "section": "abstract", "level": 3,
+     "question": "Why do traditional ethical frameworks fall short in the digital age, according to the introduction?",
+     "options": ["They were developed under assumptions of limited information and local communities",
+                 "They reject the idea of moral obligation altogether",
+                 "They apply only to political decisions"],
+     "answer": "They were developed under assumptions of limited information and local communities"},
+    {"id": "framework-proximity", "section": "framework", "level": 1,
+     "question": "Which mechanism describes visual media making distant suffering feel psychologically close?",
+     "options": ["Proximity Override", "Narrative Framing", "Algorithmic Curation"],
+     "answer": "Proximity Override"},
+    {"id": "framework-numbing", "section": "framework", "level": 2,
+     "question": "The 'psychic numbing' effect refers to:",
+     "options": ["Becoming overwhelmed by information", "Decreased moral response as victim numbers increase",
+                 "Loss of empathy over time"],
+     "answer": "Decreased moral response as victim numbers increase"},
+    {"id": "framework-diffusion", "section": "framework", "level": 3,
+     "question": "Why can knowing that many others are aware of a moral issue reduce individual responsibility?",
+     "options": ["Diffusion of responsibility", "Moral cascade effects", "Compassion fatigue"],
+     "answer": "Diffusion of responsibility"},
+    {"id": "imr-components", "section": "imr_model", "level": 1,
+     "question": "What are the three components necessary for full moral responsibility in the IMR model?",
+     "options": ["Knowledge, Action, Emotion", "Information, Engagement, Capacity", "Awareness, Empathy, Response"],
+     "answer": "Information, Engagement, Capacity"},
+    {"id": "imr-cognitive-load", "section": "imr_model", "level": 2,
+     "question": "Which principle holds that moral responsiveness is subject to cognitive limitations that create systematic biases?",
+     "options": ["Cognitive Load Principle", "Network Amplification Principle", "Information Integration Principle"],
+     "answer": "Cognitive Load Principle"},
+    {"id": "imr-transparency", "section": "imr_model", "level": 3,
+     "question": "The Mediation Transparency Principle says that technological mediation...",
+     "options": ["should be banned from news platforms",
+                 "affects moral judgment in ways often invisible to the moral agent",
+                 "always increases moral engagement"],
+     "answer": "affects moral judgment in ways often invisible to the moral agent"},
+    {"id": "cases-haiti", "section": "case_studies", "level": 1,
+     "question": "What pattern followed the initial surge of engagement after the 2010 Haiti earthquake?",
+     "options": ["Engagement grew steadily for years",
+                 "Engagement declined rapidly as media attention shifted, despite ongoing need",
+                 "Engagement moved entirely to infrastructure needs"],
+     "answer": "Engagement declined rapidly as media attention shifted, despite ongoing need"},
+    {"id": "cases-climate", "section": "case_studies", "level": 2,
+     "question": "Which challenge is specific to climate change as a case of information-mediated responsibility?",
+     "options": ["Temporal distance and causal complexity", "A lack of any statistical data",
+                 "Too few people being affected"],
+     "answer": "Temporal distance and causal complexity"},
+    {"id": "cases-covid", "section": "case_studies", "level": 3,
+     "question": "What happened to moral concern during the COVID-19 pandemic as vaccines became available?",
+     "options": ["It became more universal", "It quickly narrowed to national and local priorities",
+                 "It shifted to climate change"],
+     "answer": "It quickly narrowed to national and local priorities"},
+    {"id": "apps-action", "section": "applications", "level": 1,
+     "question": "Which design principle couples moral information with concrete action opportunities?",
+     "options": ["Action Facilitation", "Moral Calibration", "Attention Distribution"],
+     "answer": "Action Facilitation"},
+    {"id": "apps-calibration", "section": "applications", "level": 2,
+     "question": "The Moral Calibration principle asks systems to promote...",
+     "options": ["maximal emotional engagement", "appropriate rather than maximal emotional engagement",
+                 "no emotional engagement at all"],
+     "answer": "appropriate rather than maximal emotional engagement"},
+    {"id": "apps-attention", "section": "applications", "level": 3,
+     "question": "Which policy recommendation treats human attention as a finite moral resource?",
+     "options": ["Attention Protection", "Platform Transparency", "Information Diversity"],
+     "answer": "Attention Protection"},
+    {"id": "paper-prediction", "section": "full_paper", "level": 1,
+     "question": "According to the IMR predictions, which presentation of distant suffering produces greater moral engagement?",
+     "options": ["Statistical information about larger-scale suffering", "Narrative-rich presentations",
+                 "Both produce the same engagement"],
+     "answer": "Narrative-rich presentations"},
+    {"id": "paper-limitation", "section": "full_paper", "level": 2,
+     "question": "Which limitation does the paper note about current research?",
+     "options": ["Most studies focus on Western, educated populations", "There are no laboratory studies",
+                 "Long-term effects are fully understood"],
+     "answer": "Most studies focus on Western, educated populations"},
+    {"id": "paper-goal", "section": "full_paper", "level": 3,
+     "question": "What does the conclusion say the goal of moral engagement should be?",
+     "options": ["To maximize moral engagement", "To calibrate it appropriately",
+                 "To limit it to local communities"],
+     "answer": "To calibrate it appropriately"},
+    {"id": "refs-filter-bubble", "section": "references", "level": 1,
+     "question": "Which work introduced the 'filter bubble'?",
+     "options": ["Pariser (2011)", "Haidt (2012)", "Greene (2013)"],
+     "answer": "Pariser (2011)"},
+    {"id": "refs-polarization", "section": "references", "level": 2,
+     "question": "Which source does the paper cite for network polarization?",
+     "options": ["Sunstein (2017)", "Bicchieri (2006)", "Nussbaum (2001)"],
+     "answer": "Sunstein (2017)"},
+    {"id": "refs-divided", "section": "references", "level": 3,
+     "question": "Which primary reference asks why good people are divided by politics and religion?",
+     "options": ["Haidt (2012)", "Greene (2013)", "Sunstein (2017)"],
+     "answer": "Haidt (2012)"},
+]
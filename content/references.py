@@ -0,0 +1,170 @@
+"""Reference index and in-text citation links, resolved at build time.
+
+``index`` keys every entry of a paper source's ``REFERENCES`` by its
+citation id (the CSL-JSON id from ``content.citations``) and by the
+(first author, year) pair an in-text citation names, so resolving
+"(Decety & Jackson, 2004)" is one dictionary lookup. ``link`` then rewrites
+a compiled paper in place:
+
+- Layouts place reference lists as ``("bibliography", heading, citations)``
+  blocks (``citations`` in in-text form, or None for every reference); the
+  first list holding a reference is its home, anchored as ``#ref-<id>``.
+- Every in-text citation in Markdown and HTML blocks becomes an anchor to
+  its home, with the full reference as a tooltip and its own id
+  (``#cite-<id>-<n>``); a citation naming an unknown reference fails the
+  build.
+- Reference lists are rendered with back-links to every citation.
+
+Cross-section links take the form ``?section=<key>#...``, which the app
+resolves to that section (``content.render`` adds the paper and opens them
+in the same tab) and the static export to ``<key>.html``. The index
+with every reference's citations is stored in the artifact, so rendering
+never parses or resolves anything.
+"""
+
+import html
+import re
+import unicodedata
+
+from content import citations
+from content.markup import inline
+
+_PARENTHETICAL = re.compile(r"\(([^()]*?\d{4})\)")
+_NARRATIVE = re.compile(r"\b([A-Z][\w'-]+(?: (?:&|and) [A-Z][\w'-]+| et al\.)?) \((\d{4})\)")
+_CITATION = re.compile(r"(?P<authors>[A-Z][^,;()]*?), (?P<year>\d{4})")
+
+
+def _family(name):
+    return unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower().strip()
+
+
+def _plain(text):
+    return text.replace("*", "")
+
+
+def index(source):
+    """``({id: entry}, {(first author, year): id})`` for a paper source."""
+    entries, lookup = {}, {}
+    for text in source.REFERENCES:
+        item = citations.parse_reference(text)
+        key = (_family(item["author"][0]["family"]), item["issued"]["date-parts"][0][0])
+        if key in lookup:
+            raise ValueError(f"Ambiguous in-text citation {key} for {text!r}")
+        lookup[key] = item["id"]
+        entries[item["id"]] = {"text": text, "home": None, "cited": []}
+    return entries, lookup
+
+
+def resolve(lookup, authors, year):
+    """Reference id for an in-text citation's authors and year, or None."""
+    first = re.split(r" & | and | et al\.?", authors.strip())[0]
+    return lookup.get((_family(first), int(year)))
+
+
+def _resolve_list(lookup, cites):
+    ids = []
+    for cite in cites:
+        match = _CITATION.fullmatch(cite)
+        ref = match and resolve(lookup, match["authors"], match["year"])
+        if ref is None:
+            raise ValueError(f"Reference list names an unknown reference: {cite!r}")
+        ids.append(ref)
+    return ids
+
+
+def _walk(blocks):
+    """Yield every block, nested ones included."""
+    for block in blocks:
+        yield block
+        if block[0] == "expander":
+            yield from _walk(block[2])
+        elif block[0] in ("columns", "tabs"):
+            for children in block[2]:
+                yield from _walk(children)
+
+
+class _Linker:
+    def __init__(self, section, entries, lookup):
+        self.section = section
+        self.entries = entries
+        self.lookup = lookup
+        self.counts = {}
+
+    def anchor(self, label, ref):
+        entry = self.entries[ref]
+        self.counts[ref] = self.counts.get(ref, 0) + 1
+        anchor = f"cite-{ref}-{self.counts[ref]}"
+        entry["cited"].append([self.section, anchor])
+        home = entry["home"]
+        href = "" if home is None else f' href="{"" if home == self.section else f"?section={home}"}#ref-{ref}"'
+        title = html.escape(_plain(entry["text"]))
+        return f'<a class="cite" id="{anchor}"{href} title="{title}">{html.escape(label, quote=False)}</a>'
+
+    def parenthetical(self, match):
+        parts = match.group(1).split("; ")
+        found = [_CITATION.fullmatch(part.strip()) for part in parts]
+        if not all(found):
+            return match.group(0)
+        refs = [resolve(self.lookup, m["authors"], m["year"]) for m in found]
+        if None in refs:
+            raise ValueError(f"Unresolved citation {match.group(0)!r} in section {self.section!r}")
+        return "(" + "; ".join(self.anchor(part.strip(), ref) for part, ref in zip(parts, refs)) + ")"
+
+    def narrative(self, match):
+        ref = resolve(self.lookup, match.group(1), match.group(2))
+        if ref is None:
+            return match.group(0)
+        return f"{match.group(1)} ({self.anchor(match.group(2), ref)})"
+
+    def __call__(self, text):
+        text = _NARRATIVE.sub(self.narrative, text)
+        return _PARENTHETICAL.sub(self.parenthetical, text)
+
+
+def _backlinks(entry, section, labels):
+    links, seen = [], set()
+    for cited_in, anchor in entry["cited"]:
+        if cited_in == section:
+            links.append(f'<a class="backlink" href="#{anchor}" title="Back to the citation">↩</a>')
+        elif cited_in not in seen:
+            seen.add(cited_in)
+            label = html.escape(labels.get(cited_in, cited_in), quote=False)
+            links.append(f'<a class="backlink" href="?section={cited_in}#{anchor}">{label} ↩</a>')
+    return f' <span class="backlinks">{" ".join(links)}</span>' if links else ""
+
+
+def _bibliography(heading, refs, entries, section, labels):
+    items = "\n".join(
+        f'<div class="reference-item" id="ref-{ref}">{inline(entries[ref]["text"])}'
+        f"{_backlinks(entries[ref], section, labels)}</div>"
+        for ref in refs
+    )
+    if heading is None:
+        return items
+    return f'<div class="content-section">\n<h3>{inline(heading)}</h3>\n{items}\n</div>'
+
+
+def link(sections, source):
+    """Resolve citations and reference lists of compiled ``sections`` in
+    place; returns the reference index stored in the artifact."""
+    entries, lookup = index(source)
+    labels = {key: label for label, key in source.SECTIONS}
+
+    lists = []
+    for key, blocks in sections.items():
+        for block in _walk(blocks):
+            if block[0] == "bibliography":
+                refs = list(entries) if block[2] is None else _resolve_list(lookup, block[2])
+                lists.append((key, block, refs))
+                for ref in refs:
+                    entries[ref]["home"] = entries[ref]["home"] or key
+
+    for key, blocks in sections.items():
+        linker = _Linker(key, entries, lookup)
+        for block in _walk(blocks):
+            if block[0] in ("md", "html"):
+                block[1] = linker(block[1])
+
+    for key, block, refs in lists:
+        block[:] = ["html", _bibliography(block[1], refs, entries, key, labels)]
+    return entries
@@ -0,0 +1,112 @@
+"""Registry of the papers the app serves.
+
+``content/papers.json`` (or ``PAPERS_MANIFEST``) lists every paper: an
+``id``, a ``title`` for the paper selector and either a ``source`` module,
+compiled by ``content.build`` on first use, or a prebuilt ``artifact`` path
+relative to the manifest. Listing the catalogue only reads the manifest.
+A paper's content is loaded the first time a session asks for it and kept
+in one least-recently-used cache per process, shared by every session and
+bounded by ``PAPERS_CACHE_MB`` of artifact data (64 by default): when a
+newly loaded paper does not fit, the papers read least recently are
+dropped. Memory therefore follows the papers being read, not the size of
+the catalogue.
+"""
+
+import importlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from content import build, search
+from telemetry import metrics
+
+MANIFEST = Path(os.environ.get("PAPERS_MANIFEST", Path(__file__).resolve().parent / "papers.json"))
+CACHE_BYTES = int(float(os.environ.get("PAPERS_CACHE_MB", "64")) * 2 ** 20)
+
+
+def manifest(path=MANIFEST):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    ids = [entry["id"] for entry in data["papers"]]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Duplicate paper ids in {path}")
+    data.setdefault("default", ids[0])
+    return data
+
+
+class Paper:
+    """A loaded paper: its artifact and, built on first search, its index."""
+
+    def __init__(self, paper_id, artifact, size):
+        self.id = paper_id
+        self.artifact = artifact
+        self.size = size
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = search.Index(self.artifact["search"])
+        return self._index
+
+
+class Registry:
+    """The manifest plus a size-bounded LRU cache of loaded papers."""
+
+    def __init__(self, path=MANIFEST, max_bytes=CACHE_BYTES):
+        data = manifest(path)
+        self.root = Path(path).parent
+        self.entries = {entry["id"]: entry for entry in data["papers"]}
+        self.default = data["default"]
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, paper_id):
+        return paper_id in self.entries
+
+    def ids(self):
+        return list(self.entries)
+
+    def title(self, paper_id):
+        return self.entries[paper_id]["title"]
+
+    def get(self, paper_id):
+        metrics.REGISTRY.inc("papers_cache_calls_total", cache="registry.paper")
+        with self._lock:
+            paper = self._cache.get(paper_id)
+            if paper is not None:
+                self._cache.move_to_end(paper_id)
+                return paper
+        # Load outside the lock so sessions reading cached papers never wait
+        metrics.REGISTRY.inc("papers_cache_misses_total", cache="registry.paper")
+        paper = self._load(paper_id)
+        with self._lock:
+            if paper_id not in self._cache:
+                self._cache[paper_id] = paper
+                self._bytes += paper.size
+                while self._bytes > self.max_bytes and len(self._cache) > 1:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._bytes -= evicted.size
+            return self._cache.get(paper_id, paper)
+
+    def _load(self, paper_id):
+        entry = self.entries[paper_id]
+        if "source" in entry:
+            path = build.artifact_path(paper_id)
+            artifact = build.load(path, importlib.import_module(entry["source"]))
+        else:
+            path = self.root / entry["artifact"]
+            artifact = build.load(path)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = len(json.dumps(artifact, ensure_ascii=False).encode("utf-8"))
+        return Paper(paper_id, artifact, size)
+
+    def loaded(self):
+        """Ids of the papers currently cached, least recently used first."""
+        with self._lock:
+            return list(self._cache)
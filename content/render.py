@@ -0,0 +1,50 @@
+"""Render compiled content blocks with Streamlit."""
+
+import html
+from urllib.parse import urlencode
+
+import streamlit as st
+
+from content import store
+
+_CALLOUTS = {"info": st.info, "success": st.success, "error": st.error}
+
+
+def _cross_section(body):
+    # Cross-section links (content.references) keep the page's other query
+    # parameters and the session's paper, and open in this tab: Streamlit
+    # opens links without a target in a new one
+    if 'href="?section=' not in body:
+        return body
+    params = {key: value for key, value in st.query_params.items() if key != "section"}
+    params["paper"] = store.current()
+    return body.replace('href="?section=', f'target="_self" href="?{html.escape(urlencode(params))}&amp;section=')
+
+
+def render_blocks(blocks):
+    for block in blocks:
+        kind = block[0]
+        if kind == "md":
+            # Compiled Markdown may carry citation anchors (content.references)
+            st.markdown(_cross_section(block[1]), unsafe_allow_html=True)
+        elif kind == "html":
+            st.markdown(_cross_section(block[1]), unsafe_allow_html=True)
+        elif kind == "subheader":
+            st.subheader(block[1])
+        elif kind in _CALLOUTS:
+            _CALLOUTS[kind](block[1])
+        elif kind == "metric":
+            st.metric(block[1], block[2])
+        elif kind == "expander":
+            with st.expander(block[1]):
+                render_blocks(block[2])
+        elif kind == "columns":
+            for column, children in zip(st.columns(block[1]), block[2]):
+                with column:
+                    render_blocks(children)
+        elif kind == "tabs":
+            for tab, children in zip(st.tabs(block[1]), block[2]):
+                with tab:
+                    render_blocks(children)
+        else:
+            raise ValueError(f"Unknown content block: {kind!r}")
@@ -0,0 +1,181 @@
+"""Full-text search over the compiled paper.
+
+``build_index`` runs at content build time (``content.build``): every
+section's blocks are split into passages (paragraphs, list items, callouts,
+references, plus the discussion questions), tokenized and stored in the
+artifact as an inverted index -- term -> passage ids and term frequencies.
+``Index`` loads that once per process and answers queries with BM25
+ranking; the last query word also matches as a prefix, so results appear
+while a word is still being typed. A query touches only the postings of its
+own terms, which keeps it far below a millisecond for a paper this size.
+"""
+
+import bisect
+import heapq
+import html
+import math
+import re
+
+K1 = 1.2
+B = 0.75
+PREFIX_WEIGHT = 0.7
+MAX_EXPANSIONS = 30
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have how in into is it its of on or such than that the their "
+    "them these they this those through to was were what when which while who will with".split()
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+_HEADING = re.compile(r"#{1,6} (.+)")
+_BLOCK_HTML = re.compile(r"(<h[1-6][^>]*>.*?</h[1-6]>)|</p>|</div>", re.S)
+_TAG = re.compile(r"<[^>]+>")
+
+
+def stem(word):
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [stem(word) for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+def _plain(text):
+    """Markdown or HTML fragment -> plain text."""
+    text = html.unescape(_TAG.sub("", text))
+    text = re.sub(r"\*+", "", text)
+    return re.sub(r"\s+", " ", text.replace("•", " ")).strip()
+
+
+def _passages(blocks, heading=""):
+    """Yield (heading, text) for every passage in a list of compiled blocks."""
+    for block in blocks:
+        kind = block[0]
+        if kind == "subheader":
+            heading = block[1]
+        elif kind in ("md", "info", "success", "error"):
+            for para in re.split(r"\n\s*\n", block[1]):
+                match = _HEADING.fullmatch(para.strip())
+                if match:
+                    heading = _plain(match.group(1))
+                elif _plain(para) and para.strip() != "---":
+                    yield heading, _plain(para)
+        elif kind == "html":
+            for part in _BLOCK_HTML.split(block[1]):
+                if not part:
+                    continue
+                if part.startswith("<h"):
+                    heading = _plain(part)
+                elif _plain(part):
+                    yield heading, _plain(part)
+        elif kind == "expander":
+            yield from _passages(block[2], block[1])
+        elif kind in ("columns", "tabs"):
+            for i, children in enumerate(block[2]):
+                yield from _passages(children, block[1][i] if kind == "tabs" else heading)
+
+
+def build_index(sections, questions=()):
+    """Inverted index over compiled sections (a JSON-serialisable dict)."""
+    passages = []
+    for key, blocks in sections.items():
+        passages += [[key, heading, text] for heading, text in _passages(blocks)]
+    passages += [["discussion", "Critical Thinking Questions", question] for question in questions]
+
+    terms = {}
+    lengths = []
+    for pid, (_, heading, text) in enumerate(passages):
+        tokens = tokenize(f"{heading} {text}")
+        lengths.append(len(tokens))
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            postings = terms.setdefault(token, [[], []])
+            postings[0].append(pid)
+            postings[1].append(tf)
+    return {"passages": passages, "lengths": lengths, "terms": terms}
+
+
+class Index:
+    """Query side of ``build_index`` (built once per process)."""
+
+    def __init__(self, data):
+        self.passages = data["passages"]
+        self.lengths = data["lengths"]
+        self.postings = {term: (tuple(ids), tuple(tfs)) for term, (ids, tfs) in data["terms"].items()}
+        self.vocabulary = sorted(self.postings)
+        n = len(self.passages)
+        self.average_length = sum(self.lengths) / max(n, 1)
+        self.idf = {term: math.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5)) for term, (ids, _) in self.postings.items()}
+        self._norm = [K1 * (1 - B + B * length / self.average_length) for length in self.lengths]
+
+    def _expand(self, term):
+        """Vocabulary terms starting with ``term`` (other than ``term`` itself)."""
+        start = bisect.bisect_left(self.vocabulary, term)
+        out = []
+        for word in self.vocabulary[start:start + MAX_EXPANSIONS + 1]:
+            if not word.startswith(term):
+                break
+            if word != term:
+                out.append(word)
+        return out[:MAX_EXPANSIONS]
+
+    def search(self, query, limit=8, per_section=3):
+        """Ranked passages for a query.
+
+        Returns dicts with ``section`` (key), ``heading``, ``text``,
+        ``snippet`` (HTML with ``<mark>`` highlights) and ``score``. At most
+        ``per_section`` results come from the same section.
+        """
+        words = _WORD.findall(query.lower())
+        terms = [stem(word) for word in words if word not in STOPWORDS] or [stem(word) for word in words]
+        if not terms:
+            return []
+        weighted = [(term, 1.0) for term in terms]
+        if len(words[-1]) >= 2 and not query[-1:].isspace():
+            weighted += [(word, PREFIX_WEIGHT) for word in self._expand(stem(words[-1]))]
+
+        scores = {}
+        for term, weight in weighted:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            idf = self.idf[term] * weight
+            norm = self._norm
+            for pid, tf in zip(*postings):
+                scores[pid] = scores.get(pid, 0.0) + idf * tf * (K1 + 1) / (tf + norm[pid])
+
+        phrase = " ".join(words)
+        results, taken = [], {}
+        for pid in heapq.nlargest(limit * 4, scores, key=scores.get):
+            key, heading, text = self.passages[pid]
+            if taken.get(key, 0) >= per_section:
+                continue
+            taken[key] = taken.get(key, 0) + 1
+            score = scores[pid] * (1.5 if len(words) > 1 and phrase in text.lower() else 1.0)
+            results.append({"section": key, "heading": heading, "text": text, "score": score})
+        results.sort(key=lambda result: -result["score"])
+        for result in results[:limit]:
+            result["snippet"] = snippet(result["text"], terms)
+        return results[:limit]
+
+
+def snippet(text, terms, width=160):
+    """An HTML excerpt of ``text`` around the first match, matches in ``<mark>``."""
+    stems = sorted({term[:-1] if term.endswith("y") else term for term in terms}, key=len, reverse=True)
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(s) for s in stems) + r")\w*", re.I)
+    match = pattern.search(text)
+    start = 0 if match is None else max(0, match.start() - width // 3)
+    if start:
+        start = text.find(" ", start) + 1 or start
+    end = min(len(text), start + width)
+    if end < len(text):
+        end = text.rfind(" ", start, end) if text.rfind(" ", start, end) > start else end
+    excerpt = html.escape(text[start:end], quote=False)
+    excerpt = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", excerpt)
+    return ("… " if start else "") + excerpt + (" …" if end < len(text) else "")
@@ -0,0 +1,50 @@
+"""Per-session access to the compiled paper content.
+
+Papers are served by one ``content.registry.Registry`` per process, shared
+by every session through ``st.cache_resource``; it loads each paper's
+artifact on first use (rebuilding it if missing or stale) and keeps a
+bounded number of them in memory. Every function here reads the paper the
+session has selected: ``st.session_state["paper"]``, else the ``?paper=``
+query parameter, else the manifest default.
+"""
+
+import streamlit as st
+
+from content.registry import Registry
+
+
+@st.cache_resource(show_spinner=False)
+def registry():
+    return Registry()
+
+
+def current():
+    """Id of the session's paper."""
+    papers = registry()
+    paper_id = st.session_state.get("paper") or st.query_params.get("paper")
+    return paper_id if paper_id in papers else papers.default
+
+
+def paper(paper_id=None):
+    return registry().get(paper_id or current())
+
+
+def load(paper_id=None):
+    return paper(paper_id).artifact
+
+
+def version():
+    return load()["version"]
+
+
+def section(key):
+    return load()["sections"][key]
+
+
+def data(key):
+    return load()["data"][key]
+
+
+def index():
+    """The search index over the session's paper."""
+    return paper().index
@@ -0,0 +1,38 @@
+"""Sidebar sections of the paper app.
+
+A paper's navigation (``data["nav"]`` of its artifact) lists its sidebar
+labels and section keys. Sections named in ``MODULES`` live in their own
+module exposing ``render()``; every other section renders the blocks
+compiled for it. Modules are imported the first time a reader selects the
+section, so a rerun only pays for the section on screen and heavy libraries
+stay unloaded until a section that needs them is opened.
+"""
+
+import importlib
+
+from content import paper
+from telemetry import metrics
+
+# Sidebar label -> section key of the bundled paper, in navigation order
+SECTIONS = dict(paper.SECTIONS)
+
+# Sections rendered by their own module (widgets, or charts and downloads next to the text)
+MODULES = {"framework", "imr_model", "case_studies", "discussion", "references", "demos"}
+
+# Sections made of widgets; the others are exported as static text
+INTERACTIVE = {"discussion", "demos"}
+
+
+def load(key):
+    """Import (once per process) and return the module for a section key."""
+    return importlib.import_module(f"{__name__}.{key}")
+
+
+def render(key, label=None):
+    with metrics.timed("papers_section_render_seconds", section=label or key):
+        if key in MODULES:
+            load(key).render()
+        else:
+            from content import store
+            from content.render import render_blocks
+            render_blocks(store.section(key))
@@ -0,0 +1,93 @@
+import numpy as np
+import streamlit as st
+
+from content import store
+from content.render import render_blocks
+from storage import series
+from telemetry import metrics
+
+# Buckets per chart: about one per horizontal pixel of a full-width chart
+WIDTH = 1200
+
+
+@metrics.cached(st.cache_resource(max_entries=32, show_spinner=False, validate=lambda value: value is not None))
+def columns(paper_id, key, version):
+    # Keyed on the CSV's fingerprint, so an updated file is converted again;
+    # None (not cached) while it is converted in the background
+    return series.load(paper_id, key)
+
+
+@metrics.cached(st.cache_data(max_entries=256, show_spinner=False))
+def window(paper_id, key, version, start, end, width):
+    """Every column of the window, downsampled: ``{column: (time, values)}``."""
+    _, time, values = columns(paper_id, key, version)
+    return {name: series.downsample(time, column, start, end, width) for name, column in values.items()}
+
+
+def _bound(value, kind):
+    # Slider values as the time column's type (datetime64 is not a slider type)
+    return value.astype("datetime64[ms]").item() if kind == "datetime" else float(value)
+
+
+@st.fragment(run_every="2s")
+def _pending(paper_id, key):
+    # Polls for a series converted in the background, then redraws the page
+    try:
+        loaded = series.load(paper_id, key)
+    except (OSError, ValueError) as exc:
+        loaded = exc
+    if loaded is None:
+        st.info("Preparing this series on the server (once per data file); it appears here shortly.")
+    else:
+        st.rerun()
+
+
+@st.fragment
+@metrics.fragment
+def series_chart(key, title):
+    import plotly.graph_objects as go
+
+    paper_id = store.current()
+    version = series.version(paper_id, key)
+    if version is None:
+        st.caption(f"No data for this case study yet: add {series.csv_path(paper_id, key)} "
+                   "(or run python -m storage.series --illustrative for synthetic series).")
+        return
+    try:
+        loaded = columns(paper_id, key, version)
+    except (OSError, ValueError) as exc:
+        # A CSV that cannot be converted; it is retried once the file changes
+        st.error(f"Could not read this case study's series: {exc}")
+        return
+    if loaded is None:
+        _pending(paper_id, key)
+        return
+    meta, time, _ = loaded
+    kind = meta["time"]["kind"]
+    first, last = _bound(time[0], kind), _bound(time[-1], kind)
+    if first == last:
+        start, end = first, last
+    else:
+        start, end = st.slider("Time window:", first, last, (first, last), key=f"series_window_{key}")
+    if kind == "datetime":
+        start, end = np.datetime64(start, "ms"), np.datetime64(end, "ms")
+
+    traces = window(paper_id, key, version, start, end, WIDTH)
+    fig = go.Figure([go.Scattergl(x=x, y=y, name=name, mode="lines") for name, (x, y) in traces.items()])
+    fig.update_layout(title=title, xaxis_title=meta["time"]["name"], height=380, margin=dict(t=40, b=40),
+                      legend=dict(orientation="h", y=1.12))
+    st.plotly_chart(fig, use_container_width=True)
+    shown = sum(len(x) for x, _ in traces.values())
+    st.caption(f"{meta['rows']:,} rows per series; {shown:,} points drawn (the minimum and maximum of each of "
+               f"{WIDTH:,} buckets in the window).")
+
+
+def render():
+    render_blocks(store.section("case_studies"))
+    studies = store.data("case_studies")
+    if not studies:
+        return
+    st.subheader("Attention Over Time")
+    for tab, (key, title) in zip(st.tabs([title for _, title in studies]), studies):
+        with tab:
+            series_chart(key, title)
@@ -0,0 +1,53 @@
+"""Citation tools: the paper's citation in any format, and batch downloads
+of the paper and every reference."""
+
+import streamlit as st
+
+from content import citations, store
+from telemetry import metrics
+
+
+@metrics.cached(st.cache_resource(max_entries=32, show_spinner=False))
+def exports(paper_id, version):
+    """Every export of one paper version, formatted once per process:
+    ``{"paper": {format: text}, "all": {format: text}, "zip": bytes}``."""
+    entries = store.load(paper_id)["data"]["citations"]
+    return {
+        "paper": {fmt: citations.export(entries[:1], fmt).strip() for fmt in citations.FORMATS},
+        "all": {fmt: citations.export(entries, fmt) for fmt in citations.FORMATS},
+        "zip": citations.bundle(entries),
+    }
+
+
+def current():
+    return exports(store.current(), store.version())
+
+
+def _label(fmt):
+    return citations.FORMATS[fmt][0]
+
+
+def study_tools():
+    """Sidebar: cite the paper in a chosen format, or download everything."""
+    fmt = st.selectbox("Citation format:", list(citations.FORMATS), format_func=_label, key="citation_format")
+    if st.button("Generate Citation", use_container_width=True):
+        st.code(current()["paper"][fmt], language=None)
+    st.download_button("Download all citations (.zip)", current()["zip"], file_name="citations.zip",
+                       mime="application/zip", use_container_width=True)
+
+
+def copy_citation():
+    """The footer's copy action: the code block's copy icon does the copying."""
+    with st.popover("Copy Citation"):
+        st.code(current()["paper"]["apa"], language=None)
+        st.caption("Use the copy icon in the corner of the citation.")
+
+
+def reference_export():
+    """Download the paper and its reference list in one format."""
+    col1, col2 = st.columns([2, 1])
+    fmt = col1.selectbox("Export the references as:", list(citations.FORMATS), format_func=_label,
+                         key="reference_format")
+    _, _, _, name, mime = citations.FORMATS[fmt]
+    col2.download_button(f"Download {_label(fmt)}", current()["all"][fmt], file_name=name, mime=mime,
+                         use_container_width=True)
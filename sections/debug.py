@@ -0,0 +1,60 @@
+"""Sidebar debug panel with the process's render metrics.
+
+Shown when the server runs with ``PAPERS_DEBUG=1``, or when the page is
+opened with ``?debug=<token>`` and the server has that token in
+``PAPERS_DEBUG_TOKEN``. The numbers are process-wide (every session served by
+this server), the same ones exported on ``/metrics``.
+"""
+
+import os
+
+import streamlit as st
+
+from sections.session import unlocked
+from telemetry import metrics
+
+
+def enabled():
+    return os.environ.get("PAPERS_DEBUG") == "1" or unlocked("debug", "PAPERS_DEBUG_TOKEN")
+
+
+def _timings(histograms, name, label):
+    rows = []
+    for (metric, labels), histogram in sorted(histograms.items()):
+        if metric != name:
+            continue
+        count = sum(histogram[:-1])
+        rows.append({
+            label: dict(labels)[label],
+            "runs": count,
+            "mean ms": round(histogram[-1] / count * 1000, 1),
+            "p50 ms": round(metrics.quantile(histogram, 0.5) * 1000, 1),
+            "p95 ms": round(metrics.quantile(histogram, 0.95) * 1000, 1),
+        })
+    return sorted(rows, key=lambda row: -row["mean ms"] * row["runs"])
+
+
+def _caches(counters):
+    rows = []
+    for (metric, labels), calls in sorted(counters.items()):
+        if metric == "papers_cache_calls_total":
+            misses = counters.get(("papers_cache_misses_total", labels), 0)
+            rows.append({"cache": dict(labels)["cache"], "calls": calls, "hit rate": f"{1 - misses / calls:.0%}"})
+    return rows
+
+
+def render():
+    counters, histograms = metrics.REGISTRY.snapshot()
+    with st.sidebar.expander("Performance (debug)", expanded=True):
+        col1, col2 = st.columns(2)
+        col1.metric("Reruns", counters.get(("papers_reruns_total", ()), 0))
+        col2.metric("Active sessions", counters[("papers_sessions_active", ())])
+        for title, rows in (
+            ("Sections", _timings(histograms, "papers_section_render_seconds", "section")),
+            ("Widgets (fragments)", _timings(histograms, "papers_fragment_seconds", "fragment")),
+            ("Caches", _caches(counters)),
+        ):
+            if rows:
+                st.caption(title)
+                st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.caption("Timings are estimated from histogram buckets; process-wide since start.")
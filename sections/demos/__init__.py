@@ -0,0 +1,29 @@
+"""Interactive Demos: one module per demo panel, imported when first opened.
+
+Every panel renders its widgets inside fragments, so interacting with a
+demo reruns only that demo and not the page around it.
+"""
+
+import importlib
+
+import streamlit as st
+
+# Panel label -> module name, in display order
+PANELS = {
+    "Moral Salience Simulator": "salience",
+    "Network Contagion": "contagion",
+    "Attention Decay & Numbing": "decay",
+    "Finite Pool of Worry": "worry",
+    "Algorithmic Curation": "curation",
+    "Test Your Understanding": "quiz",
+}
+
+
+def load(panel):
+    return importlib.import_module(f"{__name__}.{PANELS[panel]}")
+
+
+def render():
+    st.subheader("Interactive Demos")
+    panel = st.radio("Choose a demo:", list(PANELS), horizontal=True, label_visibility="collapsed")
+    load(panel).render()
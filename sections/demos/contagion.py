@@ -0,0 +1,86 @@
+import streamlit as st
+
+from simulations import contagion
+from storage import shared
+from telemetry import metrics
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DISTRIBUTIONS = {"Poisson (everyone similar)": "poisson", "Power law (a few hubs)": "power_law"}
+
+
+@shared.cached(contagion)
+def graph_state(n, mean_degree, distribution, homophily):
+    return contagion.generate_graph(n, mean_degree, distribution, homophily=homophily).state()
+
+
+@metrics.cached(st.cache_resource(max_entries=2, show_spinner="Building the social graph..."))
+def graph(n, mean_degree, distribution, homophily):
+    return contagion.Graph.from_state(graph_state(n, mean_degree, distribution, homophily))
+
+
+@metrics.cached(st.cache_resource(max_entries=64, show_spinner="Simulating..."))
+@shared.cached(contagion)
+def run(n, mean_degree, distribution, homophily, steps, seed_fraction, reinforcement, backlash, decay):
+    g = graph(n, mean_degree, distribution, homophily)
+    result = contagion.simulate(g, steps, seed_fraction, reinforcement, backlash, decay)
+    result["edges"] = g.edges
+    result["within_group_share"] = g.within_group_share()
+    return result
+
+
+@st.fragment
+@metrics.fragment
+def contagion_demo():
+    import plotly.graph_objects as go
+
+    st.markdown('<div class="interactive-demo">', unsafe_allow_html=True)
+    st.subheader("Demo: Network Contagion of Moral Engagement")
+    st.write("A moral issue framed by one community spreads through a synthetic social network. "
+             "Engaged friends in your own community pull you in (social reinforcement); engaged "
+             "users in the other community push you away (backlash).")
+
+    with st.form("contagion_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            n = st.select_slider("Network size (people):", SIZES, value=100_000, format_func=lambda v: f"{v:,}")
+            mean_degree = st.slider("Average connections per person:", 2, 30, 10)
+            distribution = st.selectbox("Connection pattern:", list(DISTRIBUTIONS))
+            homophily = st.slider("Homophily (extra bias towards ties within one's community):", 0.0, 1.0, 0.7, 0.05,
+                                  help="The share of ties forced to stay within a community; the others are "
+                                       "random, so about (1 + homophily) / 2 of all ties stay within.")
+        with col2:
+            reinforcement = st.slider("Social reinforcement:", 0.0, 1.0, 0.6, 0.05)
+            backlash = st.slider("Cross-community backlash:", 0.0, 1.0, 0.2, 0.05)
+            decay = st.slider("Attention decay per step:", 0.0, 0.5, 0.05, 0.01)
+            seed_fraction = st.slider("Initially engaged share:", 0.001, 0.1, 0.01, 0.001, format="%.3f")
+        steps = st.slider("Time steps:", 5, 100, 30)
+        st.form_submit_button("Run simulation")
+
+    result = run(n, mean_degree, DISTRIBUTIONS[distribution], homophily, steps, seed_fraction, reinforcement, backlash, decay)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Ties", f"{result['edges']:,}")
+    col2.metric("Ties within a community", f"{result['within_group_share']:.0%}")
+    col3.metric("Engaged at the end", f"{result['engaged_share'][-1]:.0%}")
+    col4.metric("Polarization", f"{result['polarization'][-1]:.2f}")
+
+    steps_axis = list(range(len(result["engagement"])))
+    fig = go.Figure([
+        go.Scatter(x=steps_axis, y=result["group_0"], name="Framing community"),
+        go.Scatter(x=steps_axis, y=result["group_1"], name="Other community"),
+        go.Scatter(x=steps_axis, y=result["engagement"], name="Everyone", line=dict(dash="dot")),
+        go.Scatter(x=steps_axis, y=result["polarization"], name="Polarization gap", line=dict(dash="dash")),
+    ])
+    fig.update_layout(title="Mean engagement over time", xaxis_title="Step", yaxis_title="Engagement (0-1)", height=400, margin=dict(t=40, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    bins = [f"{i / 20:.2f}" for i in range(20)]
+    fig = go.Figure(go.Bar(x=bins, y=result["final_histogram"]))
+    fig.update_layout(title="Final engagement distribution", xaxis_title="Engagement", yaxis_title="People", height=300, margin=dict(t=40, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render():
+    contagion_demo()
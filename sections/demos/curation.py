@@ -0,0 +1,77 @@
+import numpy as np
+import streamlit as st
+
+from simulations import curation
+from storage import shared
+from telemetry import metrics
+
+USERS = [1_000, 10_000, 100_000]
+ITEMS = [100, 500, 1_000, 2_000]
+POLICY_LABELS = {"engagement": "Engagement-maximizing", "diversity": "Diversity-aware"}
+METRICS = {
+    "polarization": "Polarization (variance of stances)",
+    "bimodality": "Users with strong stances (|stance| > 0.5)",
+    "feed_diversity": "Exposure diversity (stance spread within a feed)",
+    "cross_cutting": "Cross-cutting exposure (share of feed from the other side)",
+}
+
+
+@metrics.cached(st.cache_resource(max_entries=32, show_spinner="Simulating feeds..."))
+@shared.cached(curation)
+def run(users, items, k, steps, tolerance, extremity_appeal, diversity_weight):
+    return curation.compare(users=users, items=items, k=k, steps=steps, tolerance=tolerance,
+                            extremity_appeal=extremity_appeal, diversity_weight=diversity_weight)
+
+
+@st.fragment
+@metrics.fragment
+def curation_demo():
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    st.markdown('<div class="interactive-demo">', unsafe_allow_html=True)
+    st.subheader("Demo: Algorithmic Curation and Echo Chambers")
+    st.write("A synthetic population scrolls ranked feeds of moral content (Pariser, 2011). Compare an "
+             "engagement-maximizing ranker with a diversity-aware one that reserves part of every feed for "
+             "quality content from across the stance spectrum.")
+
+    with st.form("curation_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            users = st.select_slider("Users:", USERS, value=10_000, format_func=lambda v: f"{v:,}")
+            items = st.select_slider("Items in the catalogue:", ITEMS, value=500, format_func=lambda v: f"{v:,}")
+            k = st.slider("Feed length (items per step):", 2, 30, 10)
+            steps = st.slider("Steps:", 5, 60, 30)
+        with col2:
+            tolerance = st.slider("Tolerance for other views:", 0.05, 1.0, 0.3, 0.05)
+            extremity_appeal = st.slider("Extra appeal of extreme content:", 0.0, 3.0, 1.5, 0.1)
+            diversity_weight = st.slider("Diversity-aware: share of feed reserved:", 0.0, 1.0, 0.5, 0.1)
+        st.form_submit_button("Run simulation")
+
+    results = run(users, items, k, steps, tolerance, extremity_appeal, diversity_weight)
+
+    cols = st.columns(len(results))
+    for col, (policy, result) in zip(cols, results.items()):
+        col.metric(f"{POLICY_LABELS[policy]}: final polarization", f"{result['polarization'][-1]:.3f}",
+                   f"{result['polarization'][-1] - result['polarization'][0]:+.3f}", delta_color="inverse")
+
+    fig = make_subplots(rows=2, cols=2, subplot_titles=list(METRICS.values()))
+    for i, metric in enumerate(METRICS):
+        for j, (policy, result) in enumerate(results.items()):
+            fig.add_trace(go.Scatter(y=result[metric], name=POLICY_LABELS[policy], legendgroup=policy, showlegend=i == 0,
+                                     line=dict(color=["#e53e3e", "#3182ce"][j])), row=i // 2 + 1, col=i % 2 + 1)
+    fig.update_layout(height=560, margin=dict(t=60, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    centres = np.linspace(-0.975, 0.975, 40)
+    fig = go.Figure([go.Bar(x=centres, y=result["stance_histograms"][-1], name=POLICY_LABELS[policy], opacity=0.6)
+                     for policy, result in results.items()])
+    fig.update_layout(title="Final distribution of user stances", barmode="overlay", xaxis_title="Moral stance",
+                      yaxis_title="Users", height=320, margin=dict(t=40, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render():
+    curation_demo()
@@ -0,0 +1,122 @@
+import csv
+import io
+
+import numpy as np
+import streamlit as st
+
+from analytics import decay
+from telemetry import metrics
+
+THETA_OPTIONS = [0.05, 0.1, 0.2, 0.5, 1, 2, 3, 5, 10, 20, 30, 50, 100, 200]
+DEFAULT_RANGE = {"exponential": (2, 50), "power_law": (0.2, 2), "compassion_collapse": (1, 30)}
+
+
+@metrics.cached(st.cache_data(max_entries=16, show_spinner=False))
+def parse_csv(data):
+    """First column is the x axis (days, or number of victims); every other
+    column is one series. Blank cells are treated as missing."""
+    rows = list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+    header, rows = rows[0], [row for row in rows[1:] if row]
+    table = np.array([[float(cell) if cell.strip() else np.nan for cell in row] for row in rows])
+    return header[0], table[:, 0], table[:, 1:].T, header[1:]
+
+
+@metrics.cached(st.cache_data(max_entries=16, show_spinner="Fitting..."))
+def fit_all(x, y):
+    return decay.fit_all(x, y)
+
+
+@metrics.cached(st.cache_data(show_spinner=False))
+def illustrative():
+    x, y, _ = decay.illustrative_series()
+    names = [f"Illustrative crisis {i:02d}" for i in range(1, len(y) + 1)]
+    return "Days since onset", x, y, names
+
+
+def explore():
+    import plotly.graph_objects as go
+
+    col1, col2 = st.columns(2)
+    with col1:
+        model = st.selectbox("Model:", list(decay.MODELS), format_func=lambda m: decay.MODELS[m]["label"], key="decay_model")
+        low, high = st.select_slider("Shape parameter range (θ):", options=THETA_OPTIONS, value=DEFAULT_RANGE[model])
+    with col2:
+        count = st.slider("Number of curves:", 2, 50, 8)
+        horizon = st.slider("Horizon (days or victims):", 10, 1000, 120)
+
+    x = np.linspace(0, horizon, 300)
+    thetas = np.geomspace(low, high, count)
+    ys = decay.curves(model, x, thetas)
+    fig = go.Figure([go.Scatter(x=x, y=y, name=f"θ = {t:.3g}", mode="lines") for t, y in zip(thetas, ys)])
+    fig.update_layout(title=decay.MODELS[model]["label"], xaxis_title="Time or number of victims", yaxis_title="Relative response", height=400, margin=dict(t=40, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def fit_series():
+    import plotly.graph_objects as go
+
+    source = st.radio("Data:", ["Illustrative crises (synthetic)", "Upload a CSV"], horizontal=True)
+    if source == "Upload a CSV":
+        upload = st.file_uploader("CSV with the x axis in the first column and one series per column", type="csv")
+        if upload is None:
+            return
+        try:
+            x_label, x, y, names = parse_csv(upload.getvalue())
+        except (ValueError, IndexError):
+            st.error("Could not read the CSV: every cell must be a number or blank.")
+            return
+    else:
+        x_label, x, y, names = illustrative()
+
+    x, y, rows, values = decay.finite(x, y)
+    if rows or values:
+        st.caption(f"Left out of the fits: {rows:,} rows with a blank or non-finite {x_label!r} and "
+                   f"{values:,} infinite values.")
+    if not len(x):
+        st.error("No rows with a finite x value to fit.")
+        return
+    fits = fit_all(x, y)
+    table = []
+    for i, name in enumerate(names):
+        best = fits["best"][i]
+        table.append({
+            "Series": name,
+            "Best model": decay.MODELS[best]["label"],
+            "Half-life": round(float(fits[best]["half_life"][i]), 2),
+            "R²": round(float(fits[best]["r2"][i]), 3),
+            **{f"AIC ({m})": round(float(fits[m]["aic"][i]), 1) for m in decay.MODELS},
+        })
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    shown = st.multiselect("Show series:", names, default=names[:3])
+    fig = go.Figure()
+    for name in shown:
+        i = names.index(name)
+        best = fits["best"][i]
+        fitted = decay.curves(best, x, fits[best]["theta"][i], fits[best]["a"][i], fits[best]["c"][i])[0]
+        fig.add_trace(go.Scatter(x=x, y=y[i], name=name, mode="markers", marker=dict(size=4)))
+        fig.add_trace(go.Scatter(x=x, y=fitted, name=f"{name} – {decay.MODELS[best]['label']}", mode="lines"))
+    fig.update_layout(xaxis_title=x_label, yaxis_title="Attention", height=450, margin=dict(t=20, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+@metrics.fragment
+def decay_demo():
+    st.markdown('<div class="interactive-demo">', unsafe_allow_html=True)
+    st.subheader("Demo: Attention Decay and Psychic Numbing")
+    st.write("Moral attention fades after a crisis (Haiti, 2010) and shrinks as victim counts grow "
+             "(psychic numbing; Slovic, 2007). Explore the competing curve shapes, or fit all of them "
+             "to many attention series at once and compare which describes each best.")
+
+    tab1, tab2 = st.tabs(["Explore curves", "Fit series"])
+    with tab1:
+        explore()
+    with tab2:
+        fit_series()
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render():
+    decay_demo()
@@ -0,0 +1,142 @@
+import numpy as np
+import streamlit as st
+
+from analytics import irt
+from content import store
+from sections import responses
+from sections.session import session_id
+from storage import quiz as quiz_store
+from telemetry import metrics
+
+LENGTH = 8
+
+
+@metrics.cached(st.cache_resource(max_entries=8, show_spinner=False))
+def calibration(paper_id, version):
+    # One calibration per paper version and process, seeded from the stored
+    # answers and then recalibrated in place as readers finish the quiz
+    bank = store.load(paper_id)["data"]["quiz"]
+    model = irt.Calibration([item["id"] for item in bank], [item["level"] - 2 for item in bank])
+    model.add_many(quiz_store.answers(paper_id))
+    model.calibrate()
+    return model
+
+
+def _state():
+    state = st.session_state.get("quiz")
+    if state is None or state["paper"] != store.current():
+        state = st.session_state["quiz"] = {"paper": store.current(), "current": None, "answers": {}, "choices": {}}
+    return state
+
+
+def _next_item(state, bank, model):
+    """The most informative unanswered item at the reader's current ability,
+    from a section the quiz has not covered yet while there is one."""
+    asked = {bank[item]["section"] for item in state["answers"]}
+    candidates = [item for item in bank if item not in state["answers"]]
+    fresh = [item for item in candidates if bank[item]["section"] not in asked]
+    candidates = fresh or candidates
+    theta, _ = model.ability(state["answers"])
+    difficulty = model.difficulties()
+    choice = irt.select(theta, [difficulty[item] for item in candidates], np.random.default_rng())
+    return candidates[choice]
+
+
+def _answer(item, model):
+    """``on_click`` callback of the answer form."""
+    state = _state()
+    choice = st.session_state.get(f"quiz_choice_{item['id']}")
+    if choice is None:
+        st.session_state["quiz_unanswered"] = True
+        return
+    correct = choice == item["answer"]
+    quiz_store.record_answer(state["paper"], session_id(), item["id"], choice, correct)
+    model.add(session_id(), item["id"], correct)
+    state["answers"][item["id"]] = correct
+    state["choices"][item["id"]] = choice
+    state["current"] = None
+    if len(state["answers"]) == min(LENGTH, len(store.data("quiz"))):
+        score = sum(state["answers"].values())
+        quiz_store.record(state["paper"], session_id(), state["choices"], score, len(state["answers"]))
+        model.recalibrate()
+
+
+def _restart():
+    st.session_state.pop("quiz", None)
+
+
+@st.fragment
+@metrics.fragment
+def quiz_form():
+    st.markdown('<div class="quiz-container">', unsafe_allow_html=True)
+    st.subheader("Test Your Understanding")
+
+    bank = {item["id"]: item for item in store.data("quiz")}
+    model = calibration(store.current(), store.version())
+    state = _state()
+    length = min(LENGTH, len(bank))
+
+    if len(state["answers"]) < length:
+        if state["current"] not in bank:
+            state["current"] = _next_item(state, bank, model)
+        item = bank[state["current"]]
+        labels = {key: label for label, key in store.data("nav")}
+        st.caption(f"Question {len(state['answers']) + 1} of {length} · {labels[item['section']]}")
+        with st.form(f"quiz_form_{item['id']}"):
+            st.radio(item["question"], item["options"], index=None, key=f"quiz_choice_{item['id']}")
+            st.form_submit_button("Submit Answer", on_click=_answer, args=(item, model))
+        if st.session_state.pop("quiz_unanswered", False):
+            st.warning("Choose an answer first.")
+    else:
+        results(state, bank, model)
+
+    if responses.instructor():
+        item_calibration(bank, model)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def results(state, bank, model):
+    score = sum(state["answers"].values())
+    total = len(state["answers"])
+    theta, se = model.ability(state["answers"])
+    st.write(f"**Score: {score}/{total}**")
+    st.write(f"Estimated understanding: {theta:+.2f} ± {se:.2f} on the class's ability scale"
+             " (0 is the average reader; harder questions count for more).")
+    percentile, others = model.percentile(theta, session_id())
+    if others:
+        st.caption(f"Higher than {percentile:.0%} of the {others:,} other readers who have taken the quiz.")
+
+    if score == total:
+        st.success("Perfect! You understand the paper well.")
+    elif score >= total / 2:
+        st.info("Good! Review the sections below for a better understanding.")
+    else:
+        st.warning("Consider re-reading the paper sections.")
+
+    labels = {key: label for label, key in store.data("nav")}
+    missed = [bank[item] for item, correct in state["answers"].items() if not correct]
+    if missed:
+        review = dict.fromkeys(item["section"] for item in missed)
+        st.markdown("**Review:** " + ", ".join(labels[key] for key in review))
+        with st.expander("Your incorrect answers"):
+            for item in missed:
+                st.markdown(f"**{item['question']}**  \nYour answer: {state['choices'][item['id']]}  \n"
+                            f"Correct answer: {item['answer']}")
+    st.button("Take the quiz again", on_click=_restart)
+
+
+def item_calibration(bank, model):
+    labels = {key: label for label, key in store.data("nav")}
+    with st.expander("Item calibration (instructor view)"):
+        st.dataframe(
+            [{"item": row["item"], "section": labels[bank[row["item"]]["section"]], "answers": row["answers"],
+              "share correct": row["correct"], "difficulty": round(row["difficulty"], 2)}
+             for row in model.item_stats()],
+            use_container_width=True, hide_index=True,
+        )
+        st.caption("Rasch difficulties by marginal maximum likelihood over every stored answer, "
+                   "recalibrated as readers finish the quiz.")
+
+
+def render():
+    quiz_form()
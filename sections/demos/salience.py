@@ -0,0 +1,105 @@
+import streamlit as st
+
+from analytics.cohort import PairedRatings
+from sections.session import session_id
+from storage import salience as salience_store
+from telemetry import metrics
+
+# Seconds before the class results are re-read from storage
+COHORT_TTL = 60
+
+
+@st.fragment
+@metrics.fragment
+def salience_simulator():
+    st.markdown('<div class="interactive-demo">', unsafe_allow_html=True)
+    st.subheader("Demo: Moral Salience Simulator")
+    st.write("Compare how different presentation formats affect moral engagement:")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("**Statistical Presentation:**")
+        st.write("• 50,000 people affected by crisis")
+        st.write("• $2 million in damages")
+        engagement_stats = st.slider("Rate emotional engagement (Statistical):", 1, 10, 4)
+
+    with col2:
+        st.write("**Narrative Presentation:**")
+        st.write("• Maria, a mother of three, lost her home")
+        st.write("• Her children sleep in a school gymnasium")
+        engagement_narrative = st.slider("Rate emotional engagement (Narrative):", 1, 10, 7)
+
+    if engagement_narrative > engagement_stats:
+        st.success("Your response demonstrates the narrative superiority effect!")
+    elif engagement_stats > engagement_narrative:
+        st.info("You show stronger response to statistical information.")
+    else:
+        st.info("You show equal engagement with both formats.")
+
+    if st.session_state.get("salience_recorded"):
+        st.caption("Your ratings are included in the class results below.")
+    elif st.button("Add my ratings to the class results"):
+        salience_store.record(session_id(), engagement_stats, engagement_narrative)
+        cohort().add(engagement_stats, engagement_narrative)
+        st.session_state["salience_recorded"] = True
+        st.caption("Your ratings are included in the class results below.")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@metrics.cached(st.cache_resource(ttl=COHORT_TTL, show_spinner=False))
+def cohort():
+    # One aggregate per process, seeded from the stored responses and then
+    # updated in place as readers submit; reseeded every COHORT_TTL seconds
+    # to take in the responses other app processes stored
+    ratings = PairedRatings()
+    rows = salience_store.joint_counts()
+    if rows:
+        statistical, narrative, count = zip(*rows)
+        ratings.add_many(statistical, narrative, count)
+    return ratings
+
+
+@st.fragment(run_every="10s")
+@metrics.fragment
+def cohort_results():
+    import plotly.graph_objects as go
+
+    ratings = cohort()
+    counts = ratings.snapshot()
+    stats = ratings.summary()
+    st.subheader("Class Results: Narrative Superiority Effect")
+    if stats["n"] < 2:
+        st.write("Class results appear once at least two readers have added their ratings.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Responses", f"{stats['n']:,}")
+    col2.metric("Mean difference (narrative − statistical)", f"{stats['mean_diff']:+.2f}")
+    col3.metric("Effect size d_z", f"{stats['d_z']:.2f}" if "d_z" in stats else "—")
+    col4.metric("Narrative rated higher", f"{stats['share_b_greater']:.0%}")
+    low, high = stats["diff_ci"]
+    st.caption(f"95% confidence interval of the mean difference: [{low:+.2f}, {high:+.2f}]"
+               + (f"; of d_z: [{stats['d_z_ci'][0]:.2f}, {stats['d_z_ci'][1]:.2f}]" if "d_z_ci" in stats else ""))
+
+    values, diff_counts = ratings.differences(counts)
+    statistical, narrative = ratings.marginals(counts)
+    scale = list(range(1, ratings.levels + 1))
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = go.Figure(go.Bar(x=values, y=diff_counts, marker_color=["#38a169" if v > 0 else "#a0aec0" if v == 0 else "#e53e3e" for v in values]))
+        fig.update_layout(title="Paired differences", xaxis_title="Narrative − statistical rating", yaxis_title="Responses", height=350, margin=dict(t=40, b=40))
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = go.Figure([
+            go.Bar(x=scale, y=statistical, name="Statistical"),
+            go.Bar(x=scale, y=narrative, name="Narrative"),
+        ])
+        fig.update_layout(title="Rating distributions", xaxis_title="Emotional engagement", yaxis_title="Responses", barmode="group", height=350, margin=dict(t=40, b=40))
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def render():
+    salience_simulator()
+    cohort_results()
@@ -0,0 +1,75 @@
+import numpy as np
+import streamlit as st
+
+from simulations import worry
+from telemetry import metrics
+
+AGENTS = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def chart(frames, issues):
+    import plotly.graph_objects as go
+
+    steps = [f["step"] for f in frames]
+    attention = np.vstack([f["attention"] for f in frames])
+    fig = go.Figure([
+        go.Scatter(x=steps, y=attention[:, j], name=f"Issue {j + 1}", mode="lines", stackgroup="worry")
+        for j in range(issues)
+    ])
+    fig.update_layout(title="How the pool of worry is shared", xaxis_title="Step", yaxis_title="Mean share of worry budget",
+                      yaxis_range=[0, 1.05], height=420, margin=dict(t=40, b=40))
+    return fig
+
+
+@st.fragment
+@metrics.fragment
+def worry_demo():
+    st.markdown('<div class="interactive-demo">', unsafe_allow_html=True)
+    st.subheader("Demo: The Finite Pool of Worry")
+    st.write("People have a limited capacity for moral concern (Weber, 2006). Here every agent splits a fixed "
+             "worry budget across competing moral issues as news cycles come and go. The stacked total never "
+             "exceeds the budget, so each new crisis gains attention only by taking it from the others.")
+
+    with st.form("worry_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            agents = st.select_slider("Agents:", AGENTS, value=10_000, format_func=lambda v: f"{v:,}")
+            issues = st.slider("Competing moral issues:", 2, 30, 8)
+            steps = st.slider("Time steps:", 10, 200, 60)
+        with col2:
+            selectivity = st.slider("Selectivity (how strongly salience captures attention):", 0.0, 5.0, 2.0, 0.1)
+            inertia = st.slider("Inertia (share of worry kept from the previous step):", 0.0, 0.95, 0.7, 0.05)
+            spread = st.slider("Diversity of personal concerns:", 0.0, 3.0, 1.0, 0.1)
+        st.form_submit_button("Run simulation")
+
+    params = (agents, issues, steps, selectivity, inertia, spread)
+    placeholder = st.empty()
+    drawn = False
+    if st.session_state.get("worry_params") == params:
+        frames = st.session_state["worry_frames"]
+    else:
+        # Stream: redraw as steps arrive instead of waiting for the full run
+        frames = []
+        redraw = max(1, steps // 20)
+        for frame in worry.stream(agents, issues, steps, selectivity=selectivity, inertia=inertia, preference_spread=spread):
+            frames.append(frame)
+            drawn = frame["step"] % redraw == 0
+            if drawn:
+                placeholder.plotly_chart(chart(frames, issues), use_container_width=True)
+        st.session_state["worry_params"] = params
+        st.session_state["worry_frames"] = frames
+    # The stream may already have drawn the last frame
+    if not drawn:
+        placeholder.plotly_chart(chart(frames, issues), use_container_width=True)
+
+    last = frames[-1]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Issues most agents give 10%+ of their worry", int((last["attending_share"] > 0.5).sum()))
+    col2.metric("Concentration (HHI)", f"{last['concentration']:.2f}", help="1 = all worry on one issue; 1/issues = spread evenly")
+    col3.metric("Most-attended issue", f"Issue {int(np.argmax(last['attention'])) + 1}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render():
+    worry_demo()
@@ -0,0 +1,29 @@
+import streamlit as st
+
+from content import store
+from content.render import render_blocks
+from sections import responses
+from telemetry import metrics
+
+
+@st.fragment
+@metrics.fragment
+def question_card(i, question):
+    # Committing an answer reruns only this question's expander
+    with st.expander(f"Question {i}: {question}"):
+        st.write(question)
+        st.text_area(f"Your thoughts:", key=f"q{i}", height=100, on_change=responses.submit, args=(f"q{i}", f"q{i}"))
+
+
+def render():
+    render_blocks(store.section("discussion"))
+
+    questions = store.data("questions")
+    # Again on every render: leaving the section drops the boxes' state
+    responses.restore([f"q{i}" for i in range(1, len(questions) + 1)])
+    for i, question in enumerate(questions, 1):
+        question_card(i, question)
+
+    if responses.instructor():
+        class_prompts = [(f"q{i}", f"Question {i}") for i in range(1, len(questions) + 1)]
+        responses.class_summary(class_prompts + [("reflection", "Reflection")])
@@ -0,0 +1,89 @@
+import numpy as np
+import streamlit as st
+
+from content import store
+from content.render import render_blocks
+from storage import layouts
+from telemetry import metrics
+
+COLORS = ["#3182ce", "#dd6b20"]
+# Edges drawn at most, the ones among the most connected nodes first
+EDGE_BUDGET = 20_000
+
+
+# None (not cached) while the layout is still being built
+@metrics.cached(st.cache_resource(show_spinner=False, validate=lambda value: value is not None))
+def network(name):
+    return layouts.load(name)
+
+
+@st.fragment(run_every="2s")
+def _pending(name):
+    # Polls for a layout built in the background, then redraws the page
+    try:
+        loaded = layouts.load(name)
+    except layouts.BuildFailed as exc:
+        loaded = exc
+    if loaded is None:
+        st.info("Laying out this network on the server (once per host); it appears here in a few seconds.")
+    else:
+        st.rerun()
+
+
+def _edge_lines(x, y, edges):
+    # One line trace for every edge: x0, x1, gap
+    ends = np.asarray(edges[:EDGE_BUDGET])
+    xs = np.column_stack([x[ends[:, 0]], x[ends[:, 1]], np.full(len(ends), np.nan, dtype=np.float32)])
+    ys = np.column_stack([y[ends[:, 0]], y[ends[:, 1]], np.full(len(ends), np.nan, dtype=np.float32)])
+    return xs.ravel(), ys.ravel()
+
+
+@st.fragment
+@metrics.fragment
+def network_picture():
+    import plotly.graph_objects as go
+
+    st.subheader("Network Polarization")
+    st.write("Two communities in a synthetic social network of 100,000 people, laid out so that connected "
+             "people sit close together. When most ties stay within a community, the network splits into "
+             "two worlds; when ties cross communities, they blend into one.")
+
+    col1, col2 = st.columns([3, 2])
+    name = col1.radio("Network:", list(layouts.NETWORKS), format_func=lambda n: layouts.NETWORKS[n]["label"],
+                      key="network_layout")
+    nodes = col2.select_slider("Detail (most connected people shown):", layouts.TIERS, value=layouts.TIERS[1],
+                               format_func=lambda v: f"{v:,}", key="network_detail")
+    show_edges = col2.checkbox("Show ties", value=True, key="network_edges")
+
+    try:
+        value = network(name)
+    except layouts.BuildFailed as exc:
+        st.error(str(exc))
+        return
+    if value is None:
+        _pending(name)
+        return
+    x, y, community, degree, edges = layouts.tier(value, nodes)
+    traces = []
+    if show_edges and len(edges):
+        ex, ey = _edge_lines(x, y, edges)
+        traces.append(go.Scattergl(x=ex, y=ey, mode="lines", line=dict(width=0.5, color="rgba(113,128,150,0.25)"),
+                                   hoverinfo="skip", showlegend=False))
+    size = np.clip(2.0 + np.sqrt(degree), 2.0, 12.0)
+    for group in (0, 1):
+        members = community == group
+        traces.append(go.Scattergl(x=x[members], y=y[members], mode="markers", name=f"Community {'AB'[group]}",
+                                   marker=dict(size=size[members], color=COLORS[group], opacity=0.7, line=dict(width=0)),
+                                   hoverinfo="skip"))
+    fig = go.Figure(traces)
+    fig.update_layout(height=520, margin=dict(t=10, b=10, l=10, r=10), legend=dict(orientation="h", y=1.05),
+                      xaxis=dict(visible=False), yaxis=dict(visible=False, scaleanchor="x"), plot_bgcolor="white")
+    st.plotly_chart(fig, use_container_width=True)
+    drawn = min(len(edges), EDGE_BUDGET) if show_edges else 0
+    st.caption(f"{len(x):,} of {value['nodes']:,} people and {drawn:,} ties drawn; "
+               f"{value['within_group_share']:.0%} of all ties stay within a community.")
+
+
+def render():
+    render_blocks(store.section("framework"))
+    network_picture()
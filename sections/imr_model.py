@@ -0,0 +1,61 @@
+import numpy as np
+import streamlit as st
+
+from analytics import imr
+from content import store
+from content.render import render_blocks
+from storage import shared
+from telemetry import metrics
+
+SAMPLES = [100_000, 250_000, 1_000_000, 2_000_000]
+
+
+@metrics.cached(st.cache_resource(max_entries=8, show_spinner="Running Monte Carlo samples..."))
+@shared.cached(imr)
+def analysis(key, samples, _coefficients):
+    # Keyed on imr.params_hash, which covers the coefficients and factor ranges
+    return imr.sensitivity(samples, **_coefficients)
+
+
+@st.fragment
+@metrics.fragment
+def sensitivity_chart():
+    import plotly.graph_objects as go
+
+    st.subheader("Which Factors Drive Moral Response?")
+    st.write("A variance-based (Sobol) sensitivity analysis of the IMR model written as a score: factual "
+             "information × emotional engagement × capacity for action, amplified or dampened by the network, "
+             "divided by cognitive load and discounted by opaque mediation. Every factor is drawn at random across "
+             "its range; the indices show how much of the variation in moral response each factor explains.")
+
+    # A form: the analysis runs once per submit, not on every slider step
+    with st.form("imr_form"):
+        col1, col2, col3 = st.columns(3)
+        samples = col1.select_slider("Monte Carlo samples:", SAMPLES, value=1_000_000, format_func=lambda v: f"{v:,}")
+        load = col2.slider("Cognitive load per extra demand:", 0.0, 1.0, imr.COEFFICIENTS["load"], 0.05)
+        mediation = col3.slider("Mediation distortion without literacy:", 0.0, 1.0, imr.COEFFICIENTS["mediation"], 0.05)
+        st.form_submit_button("Run analysis")
+
+    coefficients = {"load": load, "mediation": mediation}
+    result = analysis(imr.params_hash(samples, **coefficients), samples, coefficients)
+
+    labels = [f"{label}<br><sub>{principle}</sub>" for label, principle in zip(result["labels"], result["principles"])]
+    fig = go.Figure([
+        go.Bar(x=labels, y=result["first_order"], name="First-order (alone)", marker_color="#3182ce",
+               error_y=dict(type="data", array=1.96 * result["first_order_se"])),
+        go.Bar(x=labels, y=result["total"], name="Total (with interactions)", marker_color="#805ad5",
+               error_y=dict(type="data", array=1.96 * result["total_se"])),
+    ])
+    fig.update_layout(barmode="group", yaxis_title="Share of variance", height=420, margin=dict(t=30, b=40),
+                      legend=dict(orientation="h", y=1.1))
+    st.plotly_chart(fig, use_container_width=True)
+
+    interaction = 1.0 - float(np.sum(result["first_order"]))
+    st.caption(f"{result['evaluations']:,} model evaluations. Mean score {result['mean']:.3f} "
+               f"(SD {result['std']:.3f}); {interaction:.0%} of the variance comes from interactions between "
+               "factors, as expected when information, engagement and capacity are all necessary.")
+
+
+def render():
+    render_blocks(store.section("imr_model"))
+    sensitivity_chart()
@@ -0,0 +1,8 @@
+from content import store
+from content.render import render_blocks
+from sections import citations
+
+
+def render():
+    render_blocks(store.section("references"))
+    citations.reference_export()
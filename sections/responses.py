@@ -0,0 +1,100 @@
+"""Free-text answers: collection and the instructor's live class summary.
+
+Answers to the discussion questions and the reflection box are committed
+from the text areas' ``on_change`` callbacks: stored write-behind
+(``storage.responses``), kept as each reader's current answers in one
+index per process, and added to one ``analytics.text.Responses`` per
+process; both are seeded from the stored answers on first use. ``restore``
+puts a returning reader's answers back from the index each time their text
+areas render (Streamlit forgets the state of widgets it did not draw). With
+several app processes each index only knows the answers its process has
+seen, so on a miss ``restore`` reads the reader's answers from the database
+once per session (indexed by session id) and adds them to the index and the
+summary.
+The summary is shown when the server runs with ``PAPERS_INSTRUCTOR=1``,
+or to readers opening ``?instructor=<token>`` with the secret token set in
+``PAPERS_INSTRUCTOR_TOKEN``.
+"""
+
+import os
+
+import streamlit as st
+
+from analytics.text import Responses
+from sections.session import session_id, unlocked
+from storage import responses as responses_store
+from telemetry import metrics
+
+
+def instructor():
+    return os.environ.get("PAPERS_INSTRUCTOR") == "1" or unlocked("instructor", "PAPERS_INSTRUCTOR_TOKEN")
+
+
+@metrics.cached(st.cache_resource(show_spinner=False))
+def answers():
+    """``{session_id: {prompt: text}}`` of every reader's current answers."""
+    index = {}
+    for prompt, author, text in responses_store.latest():
+        index.setdefault(author, {})[prompt] = text
+    return index
+
+
+@metrics.cached(st.cache_resource(show_spinner=False))
+def corpus():
+    responses = Responses()
+    for author, texts in answers().items():
+        for prompt, text in texts.items():
+            responses.add(prompt, author, text)
+    return responses
+
+
+def restore(prompts):
+    """Put the reader's stored answers to ``prompts`` back into their text
+    areas; call it before the text areas are created (their keys are the
+    prompts)."""
+    sid = session_id()
+    mine = answers().get(sid, {})
+    if any(p not in mine for p in prompts) and not st.session_state.get("answers_looked_up"):
+        # Answered through another app process, or since this one started
+        st.session_state["answers_looked_up"] = True
+        stored = responses_store.for_session(sid)
+        mine = answers().setdefault(sid, {})
+        for prompt, text in stored.items():
+            if prompt not in mine:
+                mine[prompt] = text
+                corpus().add(prompt, sid, text)
+    for prompt in prompts:
+        if prompt in mine and prompt not in st.session_state:
+            st.session_state[prompt] = mine[prompt]
+
+
+def submit(prompt, key):
+    """``on_change`` callback of a response text area."""
+    text = st.session_state.get(key, "").strip()
+    responses_store.record(prompt, session_id(), text)
+    answers().setdefault(session_id(), {})[prompt] = text
+    # An emptied answer just withdraws the reader's earlier one
+    corpus().add(prompt, session_id(), text)
+
+
+@st.fragment(run_every="10s")
+@metrics.fragment
+def class_summary(prompts):
+    """Live keyphrases and clusters for ``prompts``, a list of (prompt, label)."""
+    st.subheader("Class Responses (instructor view)")
+    responses = corpus()
+    for prompt, label in prompts:
+        stats = responses.summary(prompt)
+        with st.expander(f"{label} · {stats['responses']:,} responses"):
+            if not stats["responses"]:
+                st.caption("No responses yet.")
+                continue
+            st.markdown("**Keyphrases:** " + ", ".join(
+                f"{phrase} ({count})" for phrase, _, count in stats["keyphrases"]))
+            st.dataframe(
+                [{"responses": cluster["size"], "characteristic words": ", ".join(cluster["terms"])}
+                 for cluster in stats["clusters"]],
+                use_container_width=True, hide_index=True,
+            )
+    st.caption("Keyphrases are ranked by TF-IDF against every answer in the class, with the number of "
+               "responses using them; clusters group answers by shared vocabulary. Updated every 10 seconds.")
@@ -0,0 +1,37 @@
+"""Sidebar search over the paper with jump-to-section."""
+
+import html
+
+import streamlit as st
+
+from content import store
+from telemetry import metrics
+
+
+def _jump(label):
+    st.session_state["section"] = label
+
+
+@st.fragment
+@metrics.fragment
+def search_box():
+    query = st.text_input("Search the paper:", placeholder="e.g. psychic numbing", key="search_query")
+    if not query.strip():
+        return
+    results = store.index().search(query)
+    labels = {key: label for label, key in store.data("nav")}
+    if not results:
+        st.caption("No matches.")
+        return
+    for i, result in enumerate(results):
+        label = labels[result["section"]]
+        title = html.escape(f"{label} · {result['heading']}" if result["heading"] else label)
+        st.markdown(f'<div class="search-hit"><div class="search-hit-title">{title}</div>{result["snippet"]}</div>',
+                    unsafe_allow_html=True)
+        # The callback switches the section; the full rerun then renders it
+        if st.button(f"Go to {label}", key=f"search_hit_{i}", on_click=_jump, args=(label,)):
+            st.rerun()
+
+
+def render():
+    search_box()
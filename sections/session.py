@@ -0,0 +1,42 @@
+import hmac
+import os
+import re
+import uuid
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_SESSION_ID = re.compile(r"[0-9a-f]{32}")
+
+COOKIE = "papers_sid"
+# A reader keeps their id (and answers) for a term
+COOKIE_MAX_AGE = 120 * 24 * 3600
+
+
+def session_id():
+    """Stable identifier for the current reader.
+
+    Kept in a browser cookie, never in the URL, so a shared link does not
+    share the reader's identity. Streamlit cannot set cookies from the
+    server: a new id is written by a zero-height script on the session's
+    first run, and ``st.context.cookies`` returns it when the reader's
+    browser reconnects (a dropped connection, a reload, a server restart).
+    Call it first from the script body; app.py does.
+    """
+    if "session_id" not in st.session_state:
+        sid = st.context.cookies.get(COOKIE, "")
+        # Not a str under the AppTest harness, which has no browser
+        if not (isinstance(sid, str) and _SESSION_ID.fullmatch(sid)):
+            sid = uuid.uuid4().hex
+            components.html(f"<script>window.parent.document.cookie = '{COOKIE}={sid}; path=/; "
+                            f"max-age={COOKIE_MAX_AGE}; SameSite=Strict';</script>", height=0)
+        st.session_state["session_id"] = sid
+    return st.session_state["session_id"]
+
+
+def unlocked(param, env):
+    """Whether the URL's ``?<param>=`` is the secret token set in the
+    environment variable ``env``; never without a token configured."""
+    token = os.environ.get(env, "")
+    given = st.query_params.get(param, "")
+    return bool(token) and hmac.compare_digest(given.encode(), token.encode())
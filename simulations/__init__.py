@@ -0,0 +1 @@
+"""Executable models behind the claims made in the paper (NumPy only)."""
@@ -0,0 +1,160 @@
+"""Moral engagement contagion on a synthetic social graph.
+
+Backs the Network Amplification Principle and the network-polarization
+claim of the Theoretical Framework. Nodes belong to one of two communities;
+each node's engagement with a moral issue (0..1) is pushed up by engaged
+neighbours in its own community (social reinforcement), pushed down by
+engaged neighbours in the other community (backlash), and decays over time.
+
+The graph is stored in CSR form (row pointers plus int32 neighbour indices,
+both edge directions), and one step of the dynamics is a gather of
+neighbour engagement followed by ``np.add.reduceat`` over the rows, i.e. a
+sparse matrix-vector product without SciPy. A million nodes with mean
+degree 10 take about 100 MB and a fraction of a second per step.
+"""
+
+import numpy as np
+
+
+class Graph:
+    """Undirected graph in CSR form: the neighbours of node ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]``."""
+
+    def __init__(self, n, src, dst, group):
+        order = np.argsort(dst)
+        self.n = n
+        self.group = group
+        self.indices = src[order]
+        self.degree = np.bincount(dst, minlength=n)
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(self.degree, out=self.indptr[1:])
+        self._rows = np.flatnonzero(self.degree)
+
+    def state(self):
+        """The arrays defining the graph, for ``from_state``."""
+        return {"n": self.n, "group": self.group, "indices": self.indices, "degree": self.degree,
+                "indptr": self.indptr, "rows": self._rows}
+
+    @classmethod
+    def from_state(cls, state):
+        graph = cls.__new__(cls)
+        graph.n = state["n"]
+        graph.group = state["group"]
+        graph.indices = state["indices"]
+        graph.degree = state["degree"]
+        graph.indptr = state["indptr"]
+        graph._rows = state["rows"]
+        return graph
+
+    @property
+    def edges(self):
+        return len(self.indices) // 2
+
+    def row_sums(self, values):
+        """Sum ``values`` (one per stored edge) over each node's neighbours."""
+        out = np.zeros(self.n, dtype=values.dtype)
+        if len(values):
+            out[self._rows] = np.add.reduceat(values, self.indptr[self._rows])
+        return out
+
+    def within_group_share(self):
+        if not len(self.indices):
+            return 0.0
+        return float(np.mean(self.group[self.indices] == np.repeat(self.group, self.degree)))
+
+
+def _expected_degrees(n, mean_degree, distribution, exponent, rng):
+    if distribution == "poisson":
+        return np.full(n, float(mean_degree))
+    if distribution == "power_law":
+        # Chung-Lu weights w_i ~ i^(-1/(gamma-1)), rescaled to the mean degree
+        w = (np.arange(n) + 1.0) ** (-1.0 / (exponent - 1.0))
+        rng.shuffle(w)
+        return w * (mean_degree / w.mean())
+    raise ValueError(f"Unknown degree distribution: {distribution!r}")
+
+
+def generate_graph(n, mean_degree=10, distribution="poisson", exponent=2.5, homophily=0.5, seed=0):
+    """Random graph with a given degree distribution and community homophily.
+
+    ``homophily`` is the probability that an edge's second endpoint is drawn
+    from the first endpoint's community; otherwise it is drawn from the whole
+    population. Endpoints are drawn proportionally to expected degree, which
+    gives Poisson degrees for ``distribution="poisson"`` and a heavy-tailed
+    (Chung-Lu) degree sequence for ``"power_law"``.
+    """
+    rng = np.random.default_rng(seed)
+    group = (rng.random(n) < 0.5).astype(np.int8)
+    weights = _expected_degrees(n, mean_degree, distribution, exponent, rng)
+    m = int(n * mean_degree / 2)
+
+    def draw(candidates, size):
+        if distribution == "poisson":
+            return candidates[rng.integers(0, len(candidates), size)]
+        # Sorted uniforms make the CDF lookups cache-friendly; shuffle after
+        cdf = np.cumsum(weights[candidates])
+        return rng.permutation(candidates[np.searchsorted(cdf, np.sort(rng.random(size)) * cdf[-1])])
+
+    nodes = np.arange(n, dtype=np.int32)
+    src = draw(nodes, m)
+    dst = draw(nodes, m)
+
+    # Redraw the homophilous share of endpoints from the source's community
+    same = rng.random(m) < homophily
+    for g in (0, 1):
+        members = nodes[group == g]
+        pick = np.flatnonzero(same & (group[src] == g))
+        if len(members) and len(pick):
+            dst[pick] = draw(members, len(pick))
+
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    return Graph(n, np.concatenate([src, dst]), np.concatenate([dst, src]), group)
+
+
+def simulate(graph, steps=30, seed_fraction=0.01, reinforcement=0.6, backlash=0.2, decay=0.05, seed=0):
+    """Run the engagement dynamics and return per-step summaries.
+
+    Each step computes, for every node, the degree-normalised sum of
+    neighbour engagement with in-community edges weighted by
+    ``reinforcement`` and cross-community edges by ``-backlash``:
+
+        x <- clip((1 - decay) * x + influence * (1 - x) if influence > 0
+                  else (1 - decay) * x + influence * x, 0, 1)
+
+    Seeds are drawn from community 0, which frames the issue.
+    """
+    rng = np.random.default_rng(seed)
+    n = graph.n
+    x = np.zeros(n, dtype=np.float32)
+    seeds = np.flatnonzero(graph.group == 0)
+    seeds = rng.choice(seeds, size=max(1, int(seed_fraction * n)), replace=False) if len(seeds) else seeds
+    x[seeds] = 1.0
+
+    same = graph.group[graph.indices] == np.repeat(graph.group, graph.degree)
+    edge_weight = np.where(same, reinforcement, -backlash).astype(np.float32)
+    inv_degree = (1.0 / np.maximum(graph.degree, 1)).astype(np.float32)
+    groups = [graph.group == g for g in (0, 1)]
+
+    history = {"engagement": [], "group_0": [], "group_1": [], "engaged_share": [], "polarization": []}
+
+    def record():
+        means = [float(x[mask].mean()) if mask.any() else 0.0 for mask in groups]
+        history["engagement"].append(float(x.mean()))
+        history["group_0"].append(means[0])
+        history["group_1"].append(means[1])
+        history["engaged_share"].append(float((x > 0.5).mean()))
+        history["polarization"].append(abs(means[0] - means[1]))
+
+    record()
+    for _ in range(steps):
+        influence = graph.row_sums(edge_weight * x[graph.indices])
+        influence *= inv_degree
+        x *= 1.0 - decay
+        x += influence * np.where(influence > 0, 1.0 - x, x)
+        np.clip(x, 0.0, 1.0, out=x)
+        record()
+
+    result = {key: np.asarray(values) for key, values in history.items()}
+    result["final_histogram"] = np.bincount(np.minimum((x * 20).astype(np.int32), 19), minlength=20)
+    return result
@@ -0,0 +1,97 @@
+"""Finite pool of worry: agents splitting a fixed attention budget across issues.
+
+Backs the Cognitive Load Principle and Weber's (2006) finite pool of worry.
+Moral issues break into the news at different times and fade (each issue's
+salience is a news-cycle spike on a small baseline). Every agent has a fixed
+worry budget and, each step, moves part of its allocation toward a softmax
+over issue salience and its own preferences. Because the budget is fixed, a
+new crisis can only gain attention by taking it from the others.
+
+State is one float32 ``agents x issues`` matrix. Each step is processed in
+chunks of agents, so temporaries stay bounded however many agents there are,
+and agent preferences are low-rank (a few traits per agent times per-issue
+loadings) instead of a second ``agents x issues`` matrix. ``stream`` yields
+the population summary of every step as soon as it is computed; ``run``
+collects them.
+"""
+
+import numpy as np
+
+TRAITS = 3
+
+
+def issue_salience(issues, steps, seed=0):
+    """(steps, issues) news-cycle salience: baseline plus a decaying spike."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(steps)[:, None]
+    onset = np.sort(rng.integers(0, max(1, int(steps * 0.8)), issues))
+    onset[0] = 0
+    peak = rng.uniform(1.0, 5.0, issues)
+    half_life = rng.uniform(3.0, 15.0, issues)
+    baseline = rng.uniform(0.05, 0.3, issues)
+    since = t - onset[None, :]
+    spike = np.where(since >= 0, peak * 0.5 ** (np.maximum(since, 0) / half_life), 0.0)
+    return baseline + spike
+
+
+def stream(agents, issues, steps, selectivity=2.0, inertia=0.7, threshold=0.1,
+           preference_spread=1.0, chunk_size=65_536, seed=0):
+    """Simulate and yield one summary dict per step.
+
+    ``selectivity`` sharpens the softmax (high values concentrate the whole
+    budget on the most salient issue); ``inertia`` is the share of last
+    step's allocation an agent keeps. Each summary holds, per issue, the mean
+    attention and the share of agents whose allocation exceeds ``threshold``
+    of their budget, plus the mean Herfindahl concentration of allocations.
+    """
+    rng = np.random.default_rng(seed)
+    salience = issue_salience(issues, steps, seed)
+    log_salience = np.log(salience).astype(np.float32)
+    loadings = (rng.normal(0.0, preference_spread, (TRAITS, issues)) / np.sqrt(TRAITS)).astype(np.float32)
+    traits = rng.normal(0.0, 1.0, (agents, TRAITS)).astype(np.float32)
+    budget = rng.lognormal(0.0, 0.25, agents).astype(np.float32)
+    budget /= budget.mean()
+
+    allocation = np.empty((agents, issues), dtype=np.float32)
+    allocation[:] = budget[:, None] / issues
+
+    for step in range(steps):
+        attention = np.zeros(issues, dtype=np.float64)
+        attending = np.zeros(issues, dtype=np.int64)
+        concentration = 0.0
+        for start in range(0, agents, chunk_size):
+            stop = min(start + chunk_size, agents)
+            logits = traits[start:stop] @ loadings
+            logits += log_salience[step]
+            logits *= selectivity
+            logits -= logits.max(axis=1, keepdims=True)
+            np.exp(logits, out=logits)
+            logits *= (budget[start:stop] / logits.sum(axis=1))[:, None]
+
+            chunk = allocation[start:stop]
+            chunk *= inertia
+            logits *= 1.0 - inertia
+            chunk += logits
+
+            b = budget[start:stop]
+            attention += chunk.sum(axis=0, dtype=np.float64)
+            attending += np.count_nonzero(chunk > (threshold * b)[:, None], axis=0)
+            concentration += float((np.einsum("ij,ij->i", chunk, chunk) / (b * b)).sum(dtype=np.float64))
+        yield {
+            "step": step,
+            "salience": salience[step],
+            "attention": attention / agents,
+            "attending_share": attending / agents,
+            "concentration": concentration / agents,
+        }
+
+
+def run(agents, issues, steps, **kwargs):
+    """Collect ``stream`` into (steps, issues) arrays."""
+    frames = list(stream(agents, issues, steps, **kwargs))
+    return {
+        "salience": np.vstack([f["salience"] for f in frames]),
+        "attention": np.vstack([f["attention"] for f in frames]),
+        "attending_share": np.vstack([f["attending_share"] for f in frames]),
+        "concentration": np.array([f["concentration"] for f in frames]),
+    }
@@ -0,0 +1,2 @@
+"""Local persistence: reader responses (SQLite, written off the script thread)
+and the cross-process cache of computed results (``storage.shared``)."""
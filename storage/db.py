@@ -0,0 +1,175 @@
+"""SQLite database shared by the app's stores, with a write-behind queue.
+
+Script threads never write to the database directly: they enqueue inserts on
+the process-wide ``writer()``, whose background thread drains the queue and
+commits everything pending in one transaction. A burst of hundreds of quiz
+submissions therefore becomes a handful of batched transactions, and the
+Streamlit script thread only pays for a queue put.
+
+The database runs in WAL mode so readers (instructor exports, dashboards)
+never block the writer. Its location defaults to ``data/papers.db`` and can
+be overridden with the ``PAPERS_DB`` environment variable.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = Path(os.environ.get("PAPERS_DB", ROOT / "data" / "papers.db"))
+
+_SCHEMAS = []
+_FLUSH = object()
+
+
+def register_schema(sql):
+    """Register DDL run (idempotently) on every new connection."""
+    if sql not in _SCHEMAS:
+        _SCHEMAS.append(sql)
+
+
+def connect(path=None):
+    path = Path(path or DB_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _create(conn, 0)
+    return conn
+
+
+def _create(conn, start):
+    # Run the schemas registered from index ``start`` on; returns the count run so far
+    schemas = list(_SCHEMAS)
+    for sql in schemas[start:]:
+        conn.executescript(sql)
+    return len(schemas)
+
+
+class WriterFailed(RuntimeError):
+    """The write-behind thread could not open the database."""
+
+
+class WriteBehind:
+    """Background thread that batches queued statements into transactions.
+
+    A batch is committed in one transaction; if that fails, it is retried
+    statement group by group and then row by row, so only the offending
+    rows are dropped (and logged). If the database cannot be opened at all,
+    the writer is marked as failed and ``put``/``flush`` raise
+    ``WriterFailed`` instead of queueing writes that would never land.
+    """
+
+    def __init__(self, path=None, batch_size=1000):
+        self.path = path
+        self.batch_size = batch_size
+        self.error = None
+        self._schemas = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="papers-db-writer", daemon=True)
+        self._thread.start()
+
+    def _check(self):
+        if self.error is not None:
+            raise WriterFailed(f"database writer failed: {self.error}") from self.error
+
+    def put(self, sql, params):
+        self._check()
+        self._queue.put((sql, params))
+
+    def flush(self, timeout=None):
+        """Block until everything queued before this call is committed."""
+        self._check()
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        finished = done.wait(timeout)
+        self._check()
+        return finished
+
+    def _run(self):
+        try:
+            conn = connect(self.path)
+            self._schemas = len(_SCHEMAS)
+        except Exception as exc:
+            logger.exception("Cannot open the database; writes are refused")
+            self.error = exc
+            # Wake everyone waiting on a flush; put() and flush() now raise
+            while True:
+                sql, done = self._queue.get()
+                if sql is _FLUSH:
+                    done.set()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit(conn, [item for item in batch if item[0] is not _FLUSH])
+            for sql, done in batch:
+                if sql is _FLUSH:
+                    done.set()
+
+    def _commit(self, conn, items):
+        if not items:
+            return
+        # Group consecutive rows for the same statement into executemany calls
+        groups = []
+        for sql, params in items:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+        # Tables of stores imported after the writer started
+        if len(_SCHEMAS) > self._schemas:
+            try:
+                self._schemas = _create(conn, self._schemas)
+            except sqlite3.Error:
+                logger.exception("Could not create the tables of a store")
+        try:
+            with conn:
+                for sql, rows in groups:
+                    conn.executemany(sql, rows)
+            return
+        except sqlite3.Error:
+            logger.warning("A batch of %d writes failed; retrying statement by statement", len(items))
+        for sql, rows in groups:
+            try:
+                with conn:
+                    conn.executemany(sql, rows)
+                continue
+            except sqlite3.Error:
+                pass
+            for params in rows:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                except sqlite3.Error:
+                    logger.exception("Dropped a write (%s)", sql.split("(")[0].strip())
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def writer():
+    """Return the process-wide write-behind queue, starting it on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteBehind()
+            atexit.register(_flush_at_exit, _writer)
+        return _writer
+
+
+def _flush_at_exit(writer):
+    try:
+        writer.flush(5)
+    except WriterFailed:
+        pass
@@ -0,0 +1,186 @@
+"""Precomputed network layouts, memory-mapped by the app.
+
+Usage::
+
+    python -m storage.layouts [--force]
+
+Each entry of ``NETWORKS`` is a synthetic social graph
+(``simulations.contagion``) laid out once by ``simulations.layout`` and
+written to ``data/layouts/<name>.bin`` (override with
+``PAPERS_LAYOUT_DIR``) in the shared-cache file format
+(``storage.shared``): node coordinates (float32), community labels
+(int8), degrees and the edge list (int32 pairs), with nodes numbered by
+decreasing degree. The app maps a file read-only and every level of detail
+in ``TIERS`` is a slice of the same mapped arrays: the most connected
+``k`` nodes and the edges among them, with nothing copied or recomputed.
+
+The command builds every missing or stale layout (a file records a hash
+of its parameters and the layout code); ``--force`` rebuilds them all. Run
+it when deploying. The app never lays out a graph on its script thread:
+``load`` starts a build in a background thread and returns None until the
+file is ready. Only one process on the host builds a layout at a time (an
+exclusive lock on ``<name>.lock``); the others wait for its file. A build
+that fails is not retried until the layout's parameters or code change:
+``load`` raises ``BuildFailed`` instead.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from simulations import contagion, layout
+from storage import shared
+
+try:
+    import fcntl
+except ImportError:             # Windows: no coordination between processes
+    fcntl = None
+
+ROOT = Path(__file__).resolve().parent.parent
+LAYOUT_DIR = Path(os.environ.get("PAPERS_LAYOUT_DIR", ROOT / "data" / "layouts"))
+
+# name -> graph parameters (contagion.generate_graph) and label
+NETWORKS = {
+    "polarized": {"label": "Polarized network (ties stay within communities)",
+                  "graph": {"n": 100_000, "mean_degree": 6, "homophily": 0.95, "seed": 1}},
+    "mixed": {"label": "Mixed network (ties cross communities)",
+              "graph": {"n": 100_000, "mean_degree": 6, "homophily": 0.2, "seed": 1}},
+}
+
+TIERS = [1_000, 10_000, 100_000]
+
+_building = set()
+_building_lock = threading.Lock()
+_failed = {}                    # (name, fingerprint) -> why the build failed
+
+
+class BuildFailed(RuntimeError):
+    """A layout could not be built."""
+
+
+def path(name):
+    return LAYOUT_DIR / f"{name}.bin"
+
+
+def fingerprint(name):
+    h = hashlib.sha256(repr(sorted(NETWORKS[name]["graph"].items())).encode())
+    for module in (contagion, layout):
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def build(name):
+    """Generate, lay out and write one network; returns its file."""
+    params = NETWORKS[name]["graph"]
+    graph = contagion.generate_graph(**params)
+    pos = layout.force_layout(graph)
+    order, edges, tier_edges = layout.by_importance(graph)
+    tiers = sorted({min(size, graph.n) for size in TIERS})
+    value = {
+        "name": name,
+        "fingerprint": fingerprint(name),
+        "nodes": graph.n,
+        "within_group_share": graph.within_group_share(),
+        "tiers": [[size, tier_edges(size)] for size in tiers],
+        "x": np.ascontiguousarray(pos[order, 0]),
+        "y": np.ascontiguousarray(pos[order, 1]),
+        "community": graph.group[order].astype(np.int8),
+        "degree": graph.degree[order].astype(np.int32),
+        "edges": edges,
+    }
+    shared.save(path(name), value)
+    return path(name)
+
+
+def _current(name):
+    # The mapped layout, or None if it is missing, stale or not a layout
+    try:
+        value = shared.load(path(name))
+        return value if value["fingerprint"] == fingerprint(name) else None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+@contextlib.contextmanager
+def _host_lock(name, wait=True):
+    """Exclusive lock on the layout across processes; yields False if
+    ``wait`` is off and another process holds it."""
+    if fcntl is None:
+        yield True
+        return
+    LAYOUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LAYOUT_DIR / f"{name}.lock", "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | (0 if wait else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _build_in_background(name):
+    key = (name, fingerprint(name))
+    try:
+        with _host_lock(name, wait=False) as locked:
+            # Skipped while another process builds it, or if it just did
+            if locked and _current(name) is None:
+                build(name)
+    except Exception as exc:
+        _failed[key] = exc
+    finally:
+        with _building_lock:
+            _building.discard(name)
+
+
+def load(name):
+    """The network's layout as read-only views of the mapped file, or None
+    while it is missing or stale; a build then runs in a background thread
+    (one per layout and process)."""
+    value = _current(name)
+    if value is None:
+        failed = _failed.get((name, fingerprint(name)))
+        if failed is not None:
+            raise BuildFailed(f"Could not lay out the {name} network: {failed}")
+        with _building_lock:
+            if name not in _building:
+                _building.add(name)
+                threading.Thread(target=_build_in_background, args=(name,), name=f"papers-layout-{name}",
+                                 daemon=True).start()
+    return value
+
+
+def tier(value, nodes):
+    """``(x, y, community, degree, edges)`` of the ``nodes`` most connected
+    nodes; slices of the mapped arrays."""
+    size, count = next(((size, count) for size, count in value["tiers"] if size >= nodes), value["tiers"][-1])
+    return (value["x"][:size], value["y"][:size], value["community"][:size], value["degree"][:size],
+            value["edges"][:count])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild every layout")
+    args = parser.parse_args(argv)
+
+    for name in NETWORKS:
+        stale = args.force or _current(name) is None
+        if stale:
+            with _host_lock(name):
+                build(name)
+        value = shared.load(path(name))
+        tiers = ", ".join(f"{size:,} nodes/{count:,} edges" for size, count in value["tiers"])
+        size = path(name).stat().st_size / 2 ** 20
+        print(f"{name:<10}{'built' if stale else 'up to date':<12}{size:6.1f} MiB  {tiers}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
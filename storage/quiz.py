@@ -0,0 +1,120 @@
+"""Quiz submissions: recorded write-behind, exported in bulk for instructors.
+
+Usage::
+
+    python -m storage.quiz export results.csv
+    python -m storage.quiz export answers.csv --items
+
+A finished quiz is one submission row. The adaptive quiz (recorded under
+the paper's id) also stores every answer to an item as it is given, which
+is what the item calibration is seeded from; ``--items`` exports those.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime, timezone
+
+from storage import db
+
+db.register_schema("""
+CREATE TABLE IF NOT EXISTS quiz_submissions (
+    id INTEGER PRIMARY KEY,
+    quiz TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    answers TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quiz_submissions_quiz ON quiz_submissions (quiz, submitted_at);
+CREATE TABLE IF NOT EXISTS quiz_answers (
+    id INTEGER PRIMARY KEY,
+    quiz TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    answered_at TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quiz_answers_quiz ON quiz_answers (quiz, id);
+""")
+
+_INSERT = ("INSERT INTO quiz_submissions (quiz, session_id, submitted_at, score, total, answers) "
+           "VALUES (?, ?, ?, ?, ?, ?)")
+
+_INSERT_ANSWER = ("INSERT INTO quiz_answers (quiz, session_id, item, answered_at, answer, correct) "
+                  "VALUES (?, ?, ?, ?, ?, ?)")
+
+COLUMNS = ["id", "quiz", "session_id", "submitted_at", "score", "total", "answers"]
+ANSWER_COLUMNS = ["id", "quiz", "session_id", "item", "answered_at", "answer", "correct"]
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def record(quiz, session_id, answers, score, total):
+    """Queue a submission; returns immediately."""
+    db.writer().put(_INSERT, (quiz, session_id, _now(), score, total, json.dumps(answers)))
+
+
+def record_answer(quiz, session_id, item, answer, correct):
+    """Queue one answer to an item; returns immediately."""
+    db.writer().put(_INSERT_ANSWER, (quiz, session_id, item, _now(), answer, int(correct)))
+
+
+def answers(quiz, path=None):
+    """``(session_id, item, correct)`` of every answer to ``quiz``, oldest first."""
+    conn = db.connect(path)
+    try:
+        return conn.execute("SELECT session_id, item, correct FROM quiz_answers WHERE quiz = ? ORDER BY id",
+                            (quiz,)).fetchall()
+    finally:
+        conn.close()
+
+
+def results(quiz=None, path=None, items=False):
+    conn = db.connect(path)
+    try:
+        if items:
+            sql = f"SELECT {', '.join(ANSWER_COLUMNS)} FROM quiz_answers"
+        else:
+            sql = f"SELECT {', '.join(COLUMNS)} FROM quiz_submissions"
+        if quiz:
+            return conn.execute(sql + " WHERE quiz = ? ORDER BY id", (quiz,)).fetchall()
+        return conn.execute(sql + " ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def export_csv(out, quiz=None, path=None, items=False):
+    """Write all submissions (answers as JSON), or with ``items`` every
+    answer to an item, to a CSV file object."""
+    rows = results(quiz, path, items)
+    writer = csv.writer(out)
+    writer.writerow(ANSWER_COLUMNS if items else COLUMNS)
+    writer.writerows(rows)
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quiz submission store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="export all submissions as CSV")
+    export.add_argument("out", nargs="?", help="output file (default: stdout)")
+    export.add_argument("--quiz", help="only this quiz")
+    export.add_argument("--items", action="store_true", help="export every answer to an item instead")
+    args = parser.parse_args(argv)
+
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as out:
+            count = export_csv(out, args.quiz, items=args.items)
+    else:
+        count = export_csv(sys.stdout, args.quiz, items=args.items)
+    print(f"exported {count} {'answers' if args.items else 'submissions'}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Free-text responses: discussion answers and reflections.
+
+Usage::
+
+    python -m storage.responses export responses.csv [--prompt q1]
+
+Every committed answer is stored (a reader editing an answer adds a row);
+``latest`` returns only each reader's current answer per prompt.
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime, timezone
+
+from storage import db
+
+db.register_schema("""
+CREATE TABLE IF NOT EXISTS text_responses (
+    id INTEGER PRIMARY KEY,
+    prompt TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS text_responses_author ON text_responses (prompt, session_id, id);
+CREATE INDEX IF NOT EXISTS text_responses_session ON text_responses (session_id, id);
+""")
+
+_INSERT = "INSERT INTO text_responses (prompt, session_id, submitted_at, text) VALUES (?, ?, ?, ?)"
+
+COLUMNS = ["id", "prompt", "session_id", "submitted_at", "text"]
+
+
+def record(prompt, session_id, text):
+    """Queue a response; returns immediately."""
+    submitted_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    db.writer().put(_INSERT, (prompt, session_id, submitted_at, text))
+
+
+def latest(path=None):
+    """``(prompt, session_id, text)`` of every reader's current answers, oldest first."""
+    conn = db.connect(path)
+    try:
+        return conn.execute(
+            "SELECT prompt, session_id, text FROM text_responses WHERE id IN "
+            "(SELECT MAX(id) FROM text_responses GROUP BY prompt, session_id) ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def for_session(session_id, path=None):
+    """``{prompt: text}`` of one reader's current answers."""
+    conn = db.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT prompt, text FROM text_responses WHERE session_id = ? ORDER BY id", (session_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    # Later rows are later edits
+    return dict(rows)
+
+
+def export_csv(out, prompt=None, path=None):
+    """Write every stored response to a CSV file object."""
+    conn = db.connect(path)
+    try:
+        sql = f"SELECT {', '.join(COLUMNS)} FROM text_responses"
+        if prompt:
+            rows = conn.execute(sql + " WHERE prompt = ? ORDER BY id", (prompt,)).fetchall()
+        else:
+            rows = conn.execute(sql + " ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    writer.writerows(rows)
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Free-text response store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="export all responses as CSV")
+    export.add_argument("out", nargs="?", help="output file (default: stdout)")
+    export.add_argument("--prompt", help="only this prompt (q1..q6, reflection)")
+    args = parser.parse_args(argv)
+
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as out:
+            count = export_csv(out, args.prompt)
+    else:
+        count = export_csv(sys.stdout, args.prompt)
+    print(f"exported {count} responses", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Moral Salience Simulator responses."""
+
+from datetime import datetime, timezone
+
+from storage import db
+
+db.register_schema("""
+CREATE TABLE IF NOT EXISTS salience_responses (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    statistical INTEGER NOT NULL,
+    narrative INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS salience_responses_pair ON salience_responses (statistical, narrative);
+""")
+
+_INSERT = ("INSERT INTO salience_responses (session_id, submitted_at, statistical, narrative) "
+           "VALUES (?, ?, ?, ?)")
+
+
+def record(session_id, statistical, narrative):
+    """Queue a response; returns immediately."""
+    submitted_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    db.writer().put(_INSERT, (session_id, submitted_at, statistical, narrative))
+
+
+def joint_counts(path=None):
+    """Response counts per (statistical, narrative) pair."""
+    conn = db.connect(path)
+    try:
+        return conn.execute(
+            "SELECT statistical, narrative, COUNT(*) FROM salience_responses GROUP BY statistical, narrative"
+        ).fetchall()
+    finally:
+        conn.close()
@@ -0,0 +1,303 @@
+"""Time series behind the case studies, stored column by column.
+
+Usage::
+
+    python -m storage.series [--illustrative [--points N]]
+
+A paper's series are CSV files under ``data/series/<paper id>/`` (override
+the root with ``PAPERS_SERIES_DIR``), one per case study named by its key
+(``haiti.csv``). The first column is the time axis (ISO dates or times, or
+plain numbers, decided from the first ``SAMPLE_ROWS`` times) and every
+other column is one numeric series; blank or missing cells are missing
+values, and rows without a time are dropped.
+
+Parsing text is the slow part, so each CSV is converted once after it
+changed into a directory of NumPy ``.npy`` files (one per column, sorted by
+time) and a ``meta.json``: by the command when deploying, else by a
+background thread the first time ``load`` finds it stale (the app shows a
+placeholder meanwhile). Readers memory-map the
+columns read-only: a window of a multi-million-point series only pages in
+the rows it covers, and every process on the host shares one copy in the
+OS page cache. ``downsample`` cuts a time window to at most two points per
+pixel of the chart, the minimum and the maximum of each bucket, so spikes
+survive and a chart's payload does not grow with the data.
+
+The command converts every stale CSV and lists the series;
+``--illustrative`` first writes synthetic series for the bundled case
+studies (marked "synthetic" in their column names; they are not data).
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+SERIES_DIR = Path(os.environ.get("PAPERS_SERIES_DIR", ROOT / "data" / "series"))
+
+CHUNK_ROWS = 1 << 20
+# Rows whose time cells decide between a numeric and a date/time axis
+SAMPLE_ROWS = 1000
+
+_converting = set()
+_failed = {}                # columns dir -> why its CSV could not be converted
+_converting_lock = threading.Lock()
+
+
+def csv_path(paper_id, key):
+    return SERIES_DIR / paper_id / f"{key}.csv"
+
+
+def version(paper_id, key):
+    """Fingerprint of a case study's CSV (size and mtime), or None without one."""
+    try:
+        stat = csv_path(paper_id, key).stat()
+    except FileNotFoundError:
+        return None
+    return hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def _columns_dir(source, fingerprint):
+    return source.with_name(f"{source.stem}.{fingerprint}.cols")
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_time(cells, kind):
+    if kind == "number":
+        return _parse_values(cells)
+    return np.array([cell.strip() or "NaT" for cell in cells], dtype="datetime64[ms]")
+
+
+def _parse_values(cells):
+    return np.array([cell.strip() or "nan" for cell in cells], dtype=np.float64)
+
+
+def _chunks(reader):
+    rows = []
+    for row in reader:
+        if row:
+            rows.append(row)
+            if len(rows) == CHUNK_ROWS:
+                yield rows
+                rows = []
+    if rows:
+        yield rows
+
+
+def convert(source, target):
+    """Convert the CSV ``source`` into the column directory ``target``."""
+    with open(source, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        sample = list(itertools.islice(reader, SAMPLE_ROWS))
+        times = [row[0].strip() for row in sample if row and row[0].strip()]
+        if header is None or not times:
+            raise ValueError(f"{source} has no rows with a time")
+        kind = "number" if all(_is_number(cell) for cell in times) else "datetime"
+        names = ["time"] + [f"c{i}" for i in range(len(header) - 1)]
+        dtypes = [np.dtype(np.float64 if kind == "number" else "datetime64[ms]")]
+        dtypes += [np.dtype(np.float64)] * (len(names) - 1)
+
+        tmp = Path(tempfile.mkdtemp(dir=target.parent, suffix=".tmp"))
+        try:
+            # Chunks are appended raw, then each column is written as .npy
+            raw = [open(tmp / f"{name}.raw", "wb") for name in names]
+            n = 0
+            try:
+                for chunk in _chunks(itertools.chain(sample, reader)):
+                    # Short rows are padded with missing values, long ones cut
+                    cells = list(itertools.zip_longest(*chunk, fillvalue=""))[:len(names)]
+                    cells += [("",) * len(chunk)] * (len(names) - len(cells))
+                    raw[0].write(_parse_time(cells[0], kind).tobytes())
+                    for out, values in zip(raw[1:], cells[1:]):
+                        out.write(_parse_values(values).tobytes())
+                    n += len(chunk)
+            except (ValueError, csv.Error) as exc:
+                raise ValueError(f"{source}: {exc}") from exc
+            finally:
+                for out in raw:
+                    out.close()
+
+            time = np.memmap(tmp / "time.raw", dtype=dtypes[0], mode="r", shape=(n,))
+            # NaN/NaT would sort last and stretch the time axis to nothing
+            keep = np.flatnonzero(np.isfinite(time) if kind == "number" else ~np.isnat(time))
+            if not len(keep):
+                raise ValueError(f"{source} has no rows with a time")
+            order = keep[np.argsort(time[keep], kind="stable")]
+            order = None if len(order) == n and np.all(order == np.arange(n)) else order
+            for name, dtype in zip(names, dtypes):
+                values = np.memmap(tmp / f"{name}.raw", dtype=dtype, mode="r", shape=(n,))
+                np.save(tmp / f"{name}.npy", values if order is None else values[order])
+                del values
+                (tmp / f"{name}.raw").unlink()
+            del time
+            meta = {
+                "source": source.name,
+                "rows": len(keep),
+                "dropped": n - len(keep),
+                "time": {"name": header[0], "kind": kind},
+                "columns": header[1:],
+            }
+            (tmp / "meta.json").write_text(json.dumps(meta, indent=1), encoding="utf-8")
+            try:
+                os.rename(tmp, target)
+            except OSError:
+                # Another process converted the same file first
+                if not target.exists():
+                    raise
+                shutil.rmtree(tmp, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+    for stale in source.parent.glob(f"{source.stem}.*.cols"):
+        if stale != target:
+            shutil.rmtree(stale, ignore_errors=True)
+    return target
+
+
+def _convert_in_background(source, target):
+    try:
+        convert(source, target)
+    except Exception as exc:
+        _failed[target] = exc
+    finally:
+        with _converting_lock:
+            _converting.discard(target)
+
+
+def load(paper_id, key, wait=False):
+    """``(meta, time, {column: values})`` for a case study; arrays are
+    read-only memory maps. None if the case study has no CSV, or while its
+    changed CSV is converted in a background thread (``wait`` converts it
+    on the calling thread instead)."""
+    fingerprint = version(paper_id, key)
+    if fingerprint is None:
+        return None
+    source = csv_path(paper_id, key)
+    target = _columns_dir(source, fingerprint)
+    if target in _failed:
+        raise _failed[target]
+    if not (target / "meta.json").exists():
+        if wait:
+            convert(source, target)
+        else:
+            with _converting_lock:
+                if target not in _converting:
+                    _converting.add(target)
+                    threading.Thread(target=_convert_in_background, args=(source, target),
+                                     name=f"papers-series-{key}", daemon=True).start()
+            return None
+    meta = json.loads((target / "meta.json").read_text(encoding="utf-8"))
+    time = np.load(target / "time.npy", mmap_mode="r")
+    columns = {name: np.load(target / f"c{i}.npy", mmap_mode="r") for i, name in enumerate(meta["columns"])}
+    return meta, time, columns
+
+
+def minmax(values, width):
+    """Indices of the minimum and maximum of ``values`` in each of ``width``
+    equal buckets, in order (every index when there are few enough)."""
+    n = len(values)
+    if n <= 2 * width:
+        return np.arange(n)
+    size = -(-n // width)
+    full = n // size * size
+    buckets = np.asarray(values[:full]).reshape(-1, size)
+    missing = np.isnan(buckets)
+    starts = np.arange(0, full, size)
+    picks = [starts + np.argmin(np.where(missing, np.inf, buckets), axis=1),
+             starts + np.argmax(np.where(missing, -np.inf, buckets), axis=1)]
+    if full < n:
+        tail = np.asarray(values[full:])
+        picks.append(full + np.array([np.nanargmin(tail), np.nanargmax(tail)]) if not np.isnan(tail).all()
+                     else np.array([full]))
+    return np.unique(np.concatenate(picks))
+
+
+def downsample(time, values, start=None, end=None, width=1000):
+    """``(time, values)`` of the window ``[start, end]`` reduced to at most
+    two points per bucket of ``width``."""
+    lo = 0 if start is None else int(np.searchsorted(time, start, side="left"))
+    hi = len(time) if end is None else int(np.searchsorted(time, end, side="right"))
+    index = lo + minmax(values[lo:hi], width)
+    return np.asarray(time[index]), np.asarray(values[index])
+
+
+def illustrative(paper_id, studies, points=1_000_000, seed=11):
+    """Write synthetic minute-by-minute series for ``studies`` (case study
+    keys) that do not have a CSV yet; returns the files written."""
+    from analytics import decay
+
+    rng = np.random.default_rng(seed)
+    written = []
+    minutes = np.arange(points, dtype=float)
+    days = minutes / 1440.0
+    cycle = 1.0 + 0.25 * np.sin(2 * np.pi * (days - 0.3))
+    time = np.datetime64("2020-01-01T00:00") + minutes.astype("timedelta64[m]")
+    for key in studies:
+        path = csv_path(paper_id, key)
+        if path.exists():
+            continue
+        model = rng.choice(list(decay.MODELS))
+        theta = {"exponential": 30.0, "power_law": 0.8, "compassion_collapse": 5.0}[model]
+        attention = decay.curves(model, days, theta, a=0.9, c=0.1)[0] * cycle
+        # Later news events restart attention at a fraction of the first peak
+        for onset in rng.uniform(days[-1] * 0.2, days[-1], 3):
+            later = np.clip(days - onset, 0.0, None)
+            attention += np.where(days >= onset, rng.uniform(0.1, 0.4) * decay.curves(model, later, theta)[0], 0.0)
+        attention *= rng.lognormal(0.0, 0.15, points)
+        engagement = attention * np.exp(-days / (days[-1] * rng.uniform(0.5, 2.0)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            writer.writerow(["time", "attention (synthetic)", "engagement (synthetic)"])
+            for i in range(0, points, CHUNK_ROWS):
+                part = slice(i, i + CHUNK_ROWS)
+                writer.writerows(zip(np.datetime_as_string(time[part], unit="m"),
+                                     np.round(attention[part], 5), np.round(engagement[part], 5)))
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--illustrative", action="store_true",
+                        help="write synthetic series for case studies without a CSV")
+    parser.add_argument("--points", type=int, default=1_000_000, help="points per synthetic series")
+    args = parser.parse_args(argv)
+
+    from content import registry
+
+    papers = registry.Registry()
+    for paper_id in papers.ids():
+        studies = [key for key, _ in papers.get(paper_id).artifact["data"]["case_studies"]]
+        if args.illustrative:
+            for path in illustrative(paper_id, studies, args.points):
+                print(f"wrote {path}", file=sys.stderr)
+        for key in studies:
+            loaded = load(paper_id, key, wait=True)
+            if loaded is None:
+                print(f"{paper_id}/{key:<12} no data ({csv_path(paper_id, key)})")
+                continue
+            meta, _, _ = loaded
+            dropped = f" ({meta['dropped']:,} without a time dropped)" if meta.get("dropped") else ""
+            print(f"{paper_id}/{key:<12} {meta['rows']:>12,} rows  {', '.join(meta['columns'])}{dropped}")
+
+
+if __name__ == "__main__":
+    main()
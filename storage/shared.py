@@ -0,0 +1,254 @@
+"""Cache of computed results shared by every app process on a host.
+
+Usage::
+
+    python -m storage.shared [--clear] [--max-mb N]
+
+``@shared.cached(module, ...)`` stores a function's result in a file under
+``data/cache/`` (override with ``PAPERS_CACHE_DIR``) named by a SHA-256 of
+the function, its arguments and the source of its module plus the listed
+ones, so editing the simulation code invalidates its results. Files are
+memory-mapped read-only when loaded and NumPy arrays in a result are views
+of the mapping: worker processes behind a load balancer share one copy in
+the OS page cache instead of each holding its own, and a restarted worker
+maps the results instead of recomputing them.
+
+A file is an 8-byte magic, the header length, a JSON header describing the
+value (dicts with string keys, lists, tuples, JSON scalars and arrays by
+dtype, shape and offset) and the array data, each array aligned to 64
+bytes. Writes go to a temporary file renamed into place, so readers never
+see a partial result; two processes computing the same key race to write
+identical files. Loaded results are read-only. Beyond ``PAPERS_SHARED_MB``
+(default 1024) the files read least recently are deleted.
+
+The command prints the cache size per function, or prunes/clears it.
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from telemetry import metrics
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("PAPERS_CACHE_DIR", ROOT / "data" / "cache"))
+MAX_BYTES = int(float(os.environ.get("PAPERS_SHARED_MB", "1024")) * 2 ** 20)
+
+MAGIC = b"PAPERSC1"
+ALIGN = 64
+
+
+def _digest(value, h):
+    """Feed a canonical encoding of ``value`` into the hash ``h``."""
+    if isinstance(value, np.ndarray):
+        value = np.require(value, requirements="C")
+        h.update(f"array:{value.dtype.str}:{value.shape}:".encode())
+        h.update(value.tobytes())
+    elif isinstance(value, dict):
+        h.update(b"dict:")
+        for key in sorted(value, key=repr):
+            _digest(key, h)
+            _digest(value[key], h)
+        h.update(b";")
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}:".encode())
+        for item in value:
+            _digest(item, h)
+        h.update(b";")
+    else:
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def _source_hash(modules):
+    h = hashlib.sha256()
+    for module in modules:
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _encode(value, arrays):
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Object arrays cannot be stored in the shared cache")
+        arrays.append(np.require(value, requirements="C"))
+        return {"array": len(arrays) - 1}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Shared cache dicts need string keys")
+        return {"dict": {key: _encode(item, arrays) for key, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {type(value).__name__: [_encode(item, arrays) for item in value]}
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Cannot store {type(value).__name__} in the shared cache")
+
+
+def _decode(node, buffer, start, arrays):
+    if not isinstance(node, dict):
+        return node
+    if "array" in node:
+        dtype, shape, offset = arrays[node["array"]]
+        dtype, shape = np.dtype(dtype), tuple(shape)
+        if not np.prod(shape, dtype=np.int64):
+            return np.empty(shape, dtype)
+        return np.ndarray(shape, dtype, buffer=buffer, offset=start + offset)
+    if "dict" in node:
+        return {key: _decode(item, buffer, start, arrays) for key, item in node["dict"].items()}
+    if "tuple" in node:
+        return tuple(_decode(item, buffer, start, arrays) for item in node["tuple"])
+    return [_decode(item, buffer, start, arrays) for item in node["list"]]
+
+
+def path(name, key):
+    return CACHE_DIR / name / f"{key}.bin"
+
+
+def _data_start(header_size):
+    return -(-(len(MAGIC) + 8 + header_size) // ALIGN) * ALIGN
+
+
+def save(file, value):
+    """Write ``value`` atomically to ``file``."""
+    arrays = []
+    tree = _encode(value, arrays)
+    layout, offset = [], 0
+    for array in arrays:
+        layout.append([array.dtype.str, list(array.shape), offset])
+        offset += -(-array.nbytes // ALIGN) * ALIGN
+    header = json.dumps({"tree": tree, "arrays": layout}).encode("utf-8")
+    start = _data_start(len(header))
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(MAGIC + len(header).to_bytes(8, "little") + header)
+            for array, (_, _, position) in zip(arrays, layout):
+                out.seek(start + position)
+                out.write(array.tobytes())
+            out.truncate(max(out.tell(), start))
+        os.replace(tmp, file)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load(file):
+    """Map ``file`` and return its value; arrays are read-only views."""
+    with open(file, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{file} is not a shared cache file")
+    size = int.from_bytes(buffer[len(MAGIC):len(MAGIC) + 8], "little")
+    header = json.loads(buffer[len(MAGIC) + 8:len(MAGIC) + 8 + size])
+    return _decode(header["tree"], buffer, _data_start(size), header["arrays"])
+
+
+def _files():
+    return list(CACHE_DIR.glob("*/*.bin"))
+
+
+def _touch(file):
+    """Mark ``file`` as recently read (its mtime orders pruning)."""
+    try:
+        os.utime(file)
+    except OSError:
+        pass
+
+
+def prune(max_bytes=MAX_BYTES):
+    """Delete the least recently read files until the cache fits ``max_bytes``."""
+    files = []
+    for file in _files():
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, file))
+    total = sum(size for _, size, _ in files)
+    for _, size, file in sorted(files):
+        if total <= max_bytes:
+            break
+        # Processes that have the file mapped keep reading it until they unmap
+        file.unlink(missing_ok=True)
+        total -= size
+    return total
+
+
+def cached(*modules, version=0):
+    """Decorator: share results across processes, keyed on the arguments
+    and the source of the function's module and ``modules``."""
+    def decorate(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        sources = [sys.modules[func.__module__], *modules]
+        fingerprint = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal fingerprint
+            if fingerprint is None:
+                fingerprint = _source_hash(sources)
+            h = hashlib.sha256(f"{name}:{version}:{fingerprint}:".encode())
+            _digest((args, kwargs), h)
+            file = path(name, h.hexdigest()[:32])
+
+            metrics.REGISTRY.inc("papers_cache_calls_total", cache=f"shared.{name}")
+            try:
+                value = load(file)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError):
+                logger.warning("Unreadable shared cache file %s; recomputing", file, exc_info=True)
+            else:
+                _touch(file)
+                return value
+
+            metrics.REGISTRY.inc("papers_cache_misses_total", cache=f"shared.{name}")
+            value = func(*args, **kwargs)
+            try:
+                save(file, value)
+                prune()
+                # Serve the mapped copy so this process shares it too
+                return load(file)
+            except OSError:
+                logger.warning("Could not write shared cache file %s", file, exc_info=True)
+                return value
+
+        return wrapper
+    return decorate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clear", action="store_true", help="delete every cached result")
+    parser.add_argument("--max-mb", type=float, help="prune the cache to this size")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        args.max_mb = 0
+    if args.max_mb is not None:
+        prune(int(args.max_mb * 2 ** 20))
+    sizes = {}
+    for file in _files():
+        count, total = sizes.get(file.parent.name, (0, 0))
+        sizes[file.parent.name] = (count + 1, total + file.stat().st_size)
+    for name, (count, total) in sorted(sizes.items()):
+        print(f"{name:<48}{count:6d} files{total / 2 ** 20:10.1f} MiB")
+    print(f"{CACHE_DIR}: {sum(total for _, total in sizes.values()) / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
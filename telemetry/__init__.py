@@ -0,0 +1 @@
+"""Runtime instrumentation of the app (timings, counters, metrics endpoint)."""
@@ -0,0 +1,243 @@
+"""Process-wide render metrics, exposed in the Prometheus text format.
+
+Instrumented code records into one in-process registry:
+
+- ``papers_reruns_total``: full script runs.
+- ``papers_section_render_seconds{section}``: time to render each sidebar
+  section (see ``sections.render``).
+- ``papers_fragment_seconds{fragment}``: time of every fragment run, i.e.
+  of the interactive widgets (``@metrics.fragment`` under ``@st.fragment``).
+- ``papers_cache_calls_total{cache}`` / ``papers_cache_misses_total{cache}``:
+  calls of functions wrapped with ``metrics.cached`` and how many of them
+  had to run the function body.
+- ``papers_sessions_total`` and ``papers_sessions_active`` (sessions seen in
+  the last ``SESSION_TTL`` seconds).
+
+Recording is a lock, a dict lookup and a bisect over fixed buckets -- a
+few microseconds per observation, a handful of observations per rerun.
+Set ``PAPERS_METRICS_PORT`` to serve ``/metrics`` from a background thread
+(bound to ``PAPERS_METRICS_HOST``, default ``127.0.0.1``) for Prometheus to
+scrape.
+"""
+
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+PORT = os.environ.get("PAPERS_METRICS_PORT")
+HOST = os.environ.get("PAPERS_METRICS_HOST", "127.0.0.1")
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SESSION_TTL = 300
+
+HELP = {
+    "papers_reruns_total": ("counter", "Full script runs."),
+    "papers_section_render_seconds": ("histogram", "Time to render a sidebar section."),
+    "papers_fragment_seconds": ("histogram", "Time of a fragment (interactive widget) run."),
+    "papers_cache_calls_total": ("counter", "Calls of cached functions."),
+    "papers_cache_misses_total": ("counter", "Calls of cached functions that ran the function body."),
+    "papers_sessions_total": ("counter", "Browser sessions seen."),
+    "papers_sessions_active": ("gauge", "Browser sessions seen in the last SESSION_TTL seconds."),
+}
+
+
+class Registry:
+    """Thread-safe counters and fixed-bucket histograms keyed by labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}       # (name, labels) -> value
+        self._histograms = {}     # (name, labels) -> [count per bucket..., +Inf, sum]
+        self._sessions = {}       # session id -> last seen (monotonic)
+        self._pruned = time.monotonic()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(BUCKETS) + 1) + [0.0]
+            histogram[bisect.bisect_left(BUCKETS, seconds)] += 1
+            histogram[-1] += seconds
+
+    def session(self, session_id):
+        now = time.monotonic()
+        with self._lock:
+            if session_id not in self._sessions:
+                self._counters[("papers_sessions_total", ())] = self._counters.get(("papers_sessions_total", ()), 0) + 1
+            self._sessions[session_id] = now
+            # Forget expired sessions here too, so the table stays bounded
+            # when nothing reads the active count
+            if now - self._pruned > SESSION_TTL:
+                self._prune(now)
+
+    def active_sessions(self):
+        with self._lock:
+            self._prune(time.monotonic())
+            return len(self._sessions)
+
+    def _prune(self, now):
+        cutoff = now - SESSION_TTL
+        for session_id in [s for s, seen in self._sessions.items() if seen < cutoff]:
+            del self._sessions[session_id]
+        self._pruned = now
+
+    def snapshot(self):
+        """Copies of the counters and histograms plus the active session count."""
+        active = self.active_sessions()
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(value) for key, value in self._histograms.items()}
+        counters[("papers_sessions_active", ())] = active
+        return counters, histograms
+
+    def exposition(self):
+        """The registry in the Prometheus text exposition format (0.0.4)."""
+        counters, histograms = self.snapshot()
+        lines = []
+        for name, (kind, text) in HELP.items():
+            samples = [(labels, value) for (n, labels), value in counters.items() if n == name]
+            series = [(labels, value) for (n, labels), value in histograms.items() if n == name]
+            if not samples and not series:
+                continue
+            lines += [f"# HELP {name} {text}", f"# TYPE {name} {kind}"]
+            for labels, value in sorted(samples):
+                lines.append(f"{name}{_labels(labels)} {value}")
+            for labels, histogram in sorted(series):
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), histogram[:-1]):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {histogram[-1]:.6f}")
+                lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+
+def quantile(histogram, q):
+    """Estimate a quantile from bucket counts (as Prometheus' histogram_quantile)."""
+    counts = histogram[:-1]
+    total = sum(counts)
+    if not total:
+        return None
+    rank = q * total
+    cumulative = 0
+    for i, count in enumerate(counts):
+        if cumulative + count >= rank and count:
+            if i == len(BUCKETS):
+                return BUCKETS[-1]
+            lower = BUCKETS[i - 1] if i else 0.0
+            return lower + (BUCKETS[i] - lower) * (rank - cumulative) / count
+        cumulative += count
+    return BUCKETS[-1]
+
+
+REGISTRY = Registry()
+
+
+@contextmanager
+def timed(name, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - start, **labels)
+
+
+def fragment(func):
+    """Time every run of a fragment function (apply under ``@st.fragment``)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed("papers_fragment_seconds", fragment=func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def cached(cache):
+    """Wrap a function in a Streamlit cache decorator, counting calls and misses.
+
+    ``@metrics.cached(st.cache_data(max_entries=16))`` behaves like
+    ``@st.cache_data(max_entries=16)``; the function body only runs on a miss.
+    """
+    def decorator(func):
+        module = func.__module__.rsplit(".", 1)[-1]
+        name = f"{'app' if module == '__main__' else module}.{func.__name__}"
+
+        @functools.wraps(func)
+        def miss(*args, **kwargs):
+            REGISTRY.inc("papers_cache_misses_total", cache=name)
+            return func(*args, **kwargs)
+
+        cached_func = cache(miss)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            REGISTRY.inc("papers_cache_calls_total", cache=name)
+            return cached_func(*args, **kwargs)
+
+        wrapper.clear = cached_func.clear
+        return wrapper
+    return decorator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def serve(port=None, host=HOST):
+    """Start the ``/metrics`` endpoint once per process (no-op without a port).
+
+    Only the first call tries: if the port cannot be bound (another process
+    on the host has it), the error is logged once and the app runs without
+    the endpoint."""
+    global _server, _server_started
+    port = port or PORT
+    if not port:
+        return None
+    with _server_lock:
+        if not _server_started:
+            _server_started = True
+            try:
+                _server = ThreadingHTTPServer((host, int(port)), _Handler)
+            except OSError as exc:
+                logger.error("Cannot serve /metrics on %s:%s: %s", host, port, exc)
+            else:
+                _server.daemon_threads = True
+                threading.Thread(target=_server.serve_forever, name="papers-metrics", daemon=True).start()
+    return _server
@@ -0,0 +1,50 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from content import citations
+
+ARTICLE = ("Decety, J., & Jackson, P. L. (2004). The functional architecture of human empathy. "
+           "*Behavioral and Cognitive Neuroscience Reviews*, 3(2), 71-100.")
+BOOK = "Haidt, J. (2012). *The righteous mind: Why good people are divided by politics and religion*. Vintage Books."
+
+
+def test_parses_an_article():
+    item = citations.parse_reference(ARTICLE)
+    assert item["type"] == "article-journal"
+    assert item["id"] == "decety2004functional"
+    assert [a["family"] for a in item["author"]] == ["Decety", "Jackson"]
+    assert (item["volume"], item["issue"], item["page"]) == ("3", "2", "71-100")
+
+
+def test_parses_a_book():
+    item = citations.parse_reference(BOOK)
+    assert item["type"] == "book"
+    assert item["publisher"] == "Vintage Books"
+    assert item["title"].startswith("The righteous mind")
+
+
+@pytest.mark.parametrize("text", ["Nobody wrote this.", "Smith, J., Jones (2001). A title. Publisher."])
+def test_rejects_malformed_references(text):
+    with pytest.raises(ValueError):
+        citations.parse_reference(text)
+
+
+def test_formats():
+    item = citations.parse_reference(ARTICLE)
+    assert citations.apa(item) == ("Decety, J., & Jackson, P. L. (2004). The functional architecture of human "
+                                   "empathy. Behavioral and Cognitive Neuroscience Reviews, 3(2), 71–100.")
+    assert citations.mla(item).startswith('Decety, J., and P. L. Jackson. "The functional architecture')
+    assert "3, no. 2 (2004): 71–100." in citations.chicago(item)
+    assert "pages = {71--100}" in citations.bibtex(item)
+    assert "SP  - 71\nEP  - 100\nER  -" in citations.ris(item)
+
+
+def test_bundle_has_every_format():
+    entries = [citations.parse_reference(ARTICLE), citations.parse_reference(BOOK)]
+    with zipfile.ZipFile(io.BytesIO(citations.bundle(entries))) as archive:
+        names = archive.namelist()
+        assert json.loads(archive.read("citations.json")) == entries
+    assert sorted(names) == sorted(spec[3] for spec in citations.FORMATS.values())
@@ -0,0 +1,59 @@
+import pytest
+
+from storage import db
+
+INSERT = "INSERT INTO notes (text) VALUES (?)"
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    # Schemas registered by a test do not leak into the other tests
+    monkeypatch.setattr(db, "_SCHEMAS", list(db._SCHEMAS))
+    db.register_schema("CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, text TEXT NOT NULL);")
+    return tmp_path / "papers.db"
+
+
+def rows(path, table="notes"):
+    conn = db.connect(path)
+    try:
+        return [text for (text,) in conn.execute(f"SELECT text FROM {table} ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_commits_queued_writes(path):
+    writer = db.WriteBehind(path)
+    for i in range(50):
+        writer.put(INSERT, (f"note {i}",))
+    assert writer.flush(10)
+    assert rows(path) == [f"note {i}" for i in range(50)]
+
+
+def test_a_bad_row_drops_only_itself(path):
+    writer = db.WriteBehind(path)
+    writer.flush(10)
+    # Queued together, so they reach the database as one batch
+    for params in [("a",), (None,), ("b",)]:
+        writer.put(INSERT, params)
+    writer.put("INSERT INTO missing (text) VALUES (?)", ("lost",))
+    writer.put(INSERT, ("c",))
+    assert writer.flush(10)
+    assert rows(path) == ["a", "b", "c"]
+
+
+def test_runs_schemas_registered_after_it_started(path):
+    writer = db.WriteBehind(path)
+    writer.flush(10)
+    db.register_schema("CREATE TABLE IF NOT EXISTS late (id INTEGER PRIMARY KEY, text TEXT NOT NULL);")
+    writer.put("INSERT INTO late (text) VALUES (?)", ("late",))
+    assert writer.flush(10)
+    assert rows(path, "late") == ["late"]
+
+
+def test_fails_fast_when_the_database_cannot_be_opened(tmp_path):
+    # A directory cannot be opened as a database
+    writer = db.WriteBehind(tmp_path)
+    with pytest.raises(db.WriterFailed):
+        writer.flush(10)
+    with pytest.raises(db.WriterFailed):
+        writer.put(INSERT, ("never",))
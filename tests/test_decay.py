@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from analytics import decay
+
+
+@pytest.mark.parametrize("model, theta", [("exponential", 12.0), ("power_law", 0.8), ("compassion_collapse", 4.0)])
+def test_fit_recovers_parameters(model, theta):
+    x = np.arange(80, dtype=float)
+    y = decay.curves(model, x, theta, a=0.9, c=0.1)
+    fit = decay.fit(model, x, y)
+    assert fit["theta"][0] == pytest.approx(theta, rel=1e-2)
+    assert fit["a"][0] == pytest.approx(0.9, rel=1e-2)
+    assert fit["c"][0] == pytest.approx(0.1, abs=1e-2)
+    assert fit["r2"][0] > 0.999
+
+
+def test_fit_handles_padding_and_infinities():
+    x = np.arange(60, dtype=float)
+    y = decay.curves("exponential", x, [5.0, 20.0])
+    y[0, 30:] = np.nan
+    y[1, 3] = np.inf
+    fit = decay.fit("exponential", x, y)
+    assert np.allclose(fit["theta"], [5.0, 20.0], rtol=1e-2)
+
+
+def test_finite_drops_bad_times_and_counts_ignored_values():
+    x = np.array([0.0, np.nan, 2.0, np.inf])
+    y = np.array([[1.0, 2.0, np.inf, 4.0]])
+    x, y, rows, values = decay.finite(x, y)
+    assert x.tolist() == [0.0, 2.0]
+    assert np.isnan(y[0, 1])
+    assert (rows, values) == (2, 1)
+
+
+def test_fit_all_picks_the_generating_model():
+    x, y, models = decay.illustrative_series(count=12, noise=0.0)
+    fits = decay.fit_all(x, y)
+    assert (fits["best"] == models).mean() >= 0.75
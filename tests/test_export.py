@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from content import export
+
+
+@pytest.fixture(scope="module")
+def site(tmp_path_factory):
+    out = tmp_path_factory.mktemp("export") / "site"
+    return out, export.export(out)
+
+
+def test_writes_the_static_pages(site):
+    out, manifest = site
+    assert set(manifest["pages"]) and not set(manifest["pages"]) & export.sections.INTERACTIVE
+    for key, page in manifest["pages"].items():
+        assert (out / page["path"]).exists()
+    assert (out / "index.html").read_bytes() == (out / next(iter(manifest["pages"].values()))["path"]).read_bytes()
+    assert json.loads((out / "manifest.json").read_text()) == manifest
+
+
+def test_stylesheet_is_local(site):
+    out, manifest = site
+    css = (out / manifest["assets"]["site.css"]).read_text()
+    assert "@import" not in css and "googleapis" not in css
+    page = (out / "index.html").read_text()
+    assert f'href="{manifest["assets"]["site.css"]}"' in page
+    assert 'href="?section=' not in page
+
+
+def test_replaces_a_previous_export(site):
+    out, manifest = site
+    (out / "stale.html").write_text("old")
+    assert export.export(out)["pages"] == manifest["pages"]
+    assert not (out / "stale.html").exists()
+
+
+def test_refuses_other_directories(tmp_path):
+    (tmp_path / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError, match="not a previous export"):
+        export.export(tmp_path)
+    assert (tmp_path / "notes.txt").read_text() == "keep me"
+    (tmp_path / "manifest.json").write_text('{"unrelated": true}')
+    with pytest.raises(ValueError):
+        export.export(tmp_path)
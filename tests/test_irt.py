@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from analytics import irt
+
+
+def simulate(difficulty, readers=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    theta = rng.normal(0.0, 1.0, readers)
+    correct = rng.random((readers, len(difficulty))) < irt.probability(theta[:, None], difficulty[None, :])
+    return [(r, f"i{j}", bool(correct[r, j])) for r in range(readers) for j in range(len(difficulty))]
+
+
+def test_calibration_recovers_difficulties():
+    difficulty = np.array([-1.5, -0.5, 0.0, 0.5, 1.5])
+    calibration = irt.Calibration([f"i{j}" for j in range(5)])
+    calibration.add_many(simulate(difficulty))
+    calibration.calibrate()
+    estimated = np.array(list(calibration.difficulties().values()))
+    assert np.abs(estimated - difficulty).max() < 0.2
+    assert np.all(np.diff(estimated) > 0)
+
+
+def test_answering_again_replaces_the_earlier_answer():
+    calibration = irt.Calibration(["a", "b"], capacity=1)
+    calibration.add("r1", "a", False)
+    calibration.add("r1", "a", True)
+    calibration.add("r2", "b", True)       # grows past the initial capacity
+    calibration.add("r2", "unknown", True)
+    assert calibration.n == 2 and calibration.readers == 2
+    stats = {row["item"]: row for row in calibration.item_stats()}
+    assert stats["a"]["correct"] == 1.0 and stats["a"]["answers"] == 1
+
+
+def test_ability_is_finite_for_perfect_and_zero_scores():
+    calibration = irt.Calibration(["a", "b", "c"], levels=[-1.0, 0.0, 1.0])
+    high, high_se = calibration.ability({"a": True, "b": True, "c": True})
+    low, _ = calibration.ability({"a": False, "b": False, "c": False})
+    assert np.isfinite([high, low, high_se]).all()
+    assert low < 0.0 < high
+    assert calibration.ability({}) == pytest.approx((0.0, 1.0), abs=1e-2)
+
+
+def test_select_prefers_items_near_the_ability():
+    rng = np.random.default_rng(0)
+    assert irt.select(0.0, [-3.0, 0.1, 3.0], rng, top=1) == 1
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+
+from content import references
+
+SOURCE = SimpleNamespace(
+    REFERENCES=[
+        "Decety, J., & Jackson, P. L. (2004). The functional architecture of human empathy. "
+        "*Behavioral and Cognitive Neuroscience Reviews*, 3(2), 71-100.",
+        "Haidt, J. (2012). *The righteous mind: Why good people are divided by politics and religion*. Vintage Books.",
+    ],
+    SECTIONS=[("Overview", "overview"), ("References", "references")],
+)
+
+
+def compiled(text, cites=None):
+    return {"overview": [["md", text]], "references": [["bibliography", "References", cites]]}
+
+
+def test_links_citations_to_their_reference_list():
+    sections = compiled("Empathy (Decety & Jackson, 2004) and Haidt (2012) agree.")
+    entries = references.link(sections, SOURCE)
+    text = sections["overview"][0][1]
+    assert 'id="cite-decety2004functional-1" href="?section=references#ref-decety2004functional"' in text
+    assert 'Haidt (<a class="cite" id="cite-haidt2012righteous-1"' in text
+    assert entries["haidt2012righteous"]["home"] == "references"
+    bibliography = sections["references"][0]
+    assert bibliography[0] == "html"
+    assert 'href="?section=overview#cite-decety2004functional-1">Overview ↩' in bibliography[1]
+
+
+def test_unknown_parenthetical_citation_fails():
+    with pytest.raises(ValueError, match="Unresolved citation"):
+        references.link(compiled("As shown (Nobody, 1999)."), SOURCE)
+
+
+def test_unknown_reference_in_a_list_fails():
+    with pytest.raises(ValueError, match="unknown reference"):
+        references.link(compiled("No citations.", ["Nobody, 1999"]), SOURCE)
+
+
+def test_unknown_narrative_citation_is_left_as_text():
+    sections = compiled("Smith (1999) said so.")
+    references.link(sections, SOURCE)
+    assert sections["overview"][0][1] == "Smith (1999) said so."
+
+
+def test_ambiguous_first_author_and_year_fails():
+    source = SimpleNamespace(REFERENCES=[SOURCE.REFERENCES[1], SOURCE.REFERENCES[1].replace("righteous", "other")],
+                             SECTIONS=SOURCE.SECTIONS)
+    with pytest.raises(ValueError, match="Ambiguous"):
+        references.index(source)
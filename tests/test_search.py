@@ -0,0 +1,41 @@
+import pytest
+
+from content import search
+
+SECTIONS = {
+    "overview": [["subheader", "Overview"],
+                 ["md", "Digital connectivity transforms moral responsibility.\n\nEcho chambers narrow attention."]],
+    "framework": [["expander", "Filter bubbles",
+                   [["md", "Personalised feeds build a filter bubble around each reader."]]]],
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    return search.Index(search.build_index(SECTIONS, ["Who is responsible for distant suffering?"]))
+
+
+def test_tokenize_drops_stopwords_and_stems():
+    assert search.tokenize("The bubbles of the Policies") == ["bubble", "policy"]
+
+
+def test_ranks_the_matching_passage_first(index):
+    results = index.search("filter bubble")
+    assert results[0]["section"] == "framework"
+    assert results[0]["heading"] == "Filter bubbles"
+    assert "<mark>filter</mark>" in results[0]["snippet"]
+
+
+def test_last_word_matches_as_a_prefix(index):
+    assert [r["section"] for r in index.search("connec")] == ["overview"]
+    # A finished word (trailing space) is matched exactly
+    assert index.search("connec ") == []
+
+
+def test_questions_are_indexed_under_discussion(index):
+    assert index.search("distant suffering")[0]["section"] == "discussion"
+
+
+def test_limits_results_per_section(index):
+    assert len(index.search("moral echo narrow", per_section=1)) == 1
+    assert index.search("") == []
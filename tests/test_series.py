@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+import pytest
+
+from storage import series
+
+
+@pytest.fixture(autouse=True)
+def series_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(series, "SERIES_DIR", tmp_path)
+    return tmp_path
+
+
+def write(series_dir, text, paper="paper", key="study"):
+    path = series_dir / paper / f"{key}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_converts_numbers_sorted_with_missing_cells(series_dir):
+    write(series_dir, "day,coverage,donations\n3, 30 ,\n1,10,1.5\n,99,99\n2,20\n")
+    meta, time, columns = series.load("paper", "study", wait=True)
+    assert meta["time"] == {"name": "day", "kind": "number"}
+    assert (meta["rows"], meta["dropped"]) == (3, 1)
+    assert time.tolist() == [1.0, 2.0, 3.0]
+    assert columns["coverage"].tolist() == [10.0, 20.0, 30.0]
+    assert np.isnan(columns["donations"][1:]).all() and columns["donations"][0] == 1.5
+
+
+def test_converts_dates(series_dir):
+    write(series_dir, "date,value\n2010-01-13,2\n 2010-01-12 ,1\n")
+    meta, time, columns = series.load("paper", "study", wait=True)
+    assert meta["time"]["kind"] == "datetime"
+    assert time.tolist() == list(np.array(["2010-01-12", "2010-01-13"], dtype="datetime64[ms]").tolist())
+    assert columns["value"].tolist() == [1.0, 2.0]
+
+
+def test_time_kind_comes_from_the_sample(series_dir, monkeypatch):
+    monkeypatch.setattr(series, "SAMPLE_ROWS", 2)
+    write(series_dir, "t,v\n1,1\n2,2\n2010-01-01,3\n")
+    with pytest.raises(ValueError, match="study.csv"):
+        series.load("paper", "study", wait=True)
+
+
+def test_failed_background_conversion_is_raised(series_dir):
+    write(series_dir, "t,v\n1,abc\n")
+    assert series.load("paper", "study") is None
+    for thread in __import__("threading").enumerate():
+        if thread.name == "papers-series-study":
+            thread.join()
+    with pytest.raises(ValueError, match="abc"):
+        series.load("paper", "study")
+
+
+def test_reconverts_a_changed_csv(series_dir):
+    path = write(series_dir, "t,v\n1,1\n")
+    series.load("paper", "study", wait=True)
+    path.write_text("t,v\n1,1\n2,2\n", encoding="utf-8")
+    meta, _, _ = series.load("paper", "study", wait=True)
+    assert meta["rows"] == 2
+    assert len(list(path.parent.glob("study.*.cols"))) == 1
+    assert json.loads(next(path.parent.glob("study.*.cols/meta.json")).read_text())["rows"] == 2
+
+
+def test_no_csv():
+    assert series.load("paper", "missing") is None
+
+
+def test_minmax_keeps_the_extremes_of_each_bucket():
+    values = np.zeros(1000)
+    values[123], values[877] = 5.0, -5.0
+    index = series.minmax(values, 10)
+    assert len(index) <= 20
+    assert {123, 877} <= set(index.tolist())
+    assert np.all(np.diff(index) > 0)
+
+
+def test_minmax_ignores_missing_values():
+    values = np.array([np.nan, 1.0, np.nan, 3.0, 2.0, np.nan, np.nan])
+    assert series.minmax(values, 1).tolist() == [1, 3]
+    assert series.minmax(values[:3], 2).tolist() == [0, 1, 2]
+
+
+def test_downsample_cuts_the_window():
+    time = np.arange(100.0)
+    values = np.sin(time)
+    t, v = series.downsample(time, values, start=10, end=19, width=100)
+    assert t.tolist() == list(range(10, 20))
+    assert np.array_equal(v, values[10:20])
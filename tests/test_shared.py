@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+from storage import shared
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_round_trip(tmp_path):
+    value = {"grid": np.arange(12, dtype=np.float32).reshape(3, 4), "empty": np.zeros((0, 2)),
+             "meta": ("run", [1, 2.5, None, True]), "n": np.int64(7)}
+    file = tmp_path / "value.bin"
+    shared.save(file, value)
+    loaded = shared.load(file)
+    assert np.array_equal(loaded["grid"], value["grid"]) and loaded["grid"].dtype == np.float32
+    assert loaded["empty"].shape == (0, 2)
+    assert loaded["meta"] == ("run", [1, 2.5, None, True])
+    assert loaded["n"] == 7
+    assert not loaded["grid"].flags.writeable
+    # Arrays start on an ALIGN boundary of the mapping
+    assert loaded["grid"].__array_interface__["data"][0] % shared.ALIGN == 0
+
+
+@pytest.mark.parametrize("value", [{1: "int key"}, np.array([object()]), {1, 2}])
+def test_rejects_values_it_cannot_map(tmp_path, value):
+    with pytest.raises(TypeError):
+        shared.save(tmp_path / "bad.bin", value)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_rejects_other_files(tmp_path):
+    (tmp_path / "other.bin").write_bytes(b"not a cache file")
+    with pytest.raises(ValueError):
+        shared.load(tmp_path / "other.bin")
+
+
+def test_cached_computes_once_per_arguments():
+    calls = []
+
+    @shared.cached()
+    def square(n, scale=1):
+        calls.append(n)
+        return {"values": np.arange(n) ** 2 * scale}
+
+    assert square(4)["values"].tolist() == [0, 1, 4, 9]
+    assert square(4)["values"].tolist() == [0, 1, 4, 9]
+    assert square(4, scale=2)["values"].tolist() == [0, 2, 8, 18]
+    assert calls == [4, 4]
+
+
+def test_cached_recomputes_unreadable_files(cache_dir):
+    @shared.cached()
+    def value():
+        return [1]
+
+    value()
+    (file,) = cache_dir.glob("*/*.bin")
+    file.write_bytes(b"garbage")
+    assert value() == [1]
+    assert shared.load(file) == [1]
+
+
+def test_prune_deletes_least_recently_read(cache_dir):
+    files = []
+    for i in range(3):
+        file = shared.path("f", str(i))
+        shared.save(file, np.zeros(1024))
+        files.append(file)
+    size = files[0].stat().st_size
+    # Read order: the second file longest ago, the first most recently
+    for age, file in zip([0, 200, 100], files):
+        stamp = file.stat().st_mtime - age
+        os.utime(file, (stamp, stamp))
+    assert shared.prune(2 * size) == 2 * size
+    assert [file.exists() for file in files] == [True, False, True]